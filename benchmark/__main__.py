@@ -0,0 +1,28 @@
+from argparse import ArgumentParser
+
+from benchmark.runner import COLD_STARTS_AMOUNT, format_results, load_results, run_benchmark, save_results
+
+DEFAULT_SEED = 0
+DEFAULT_SETS_AMOUNT = 200
+
+
+def main() -> None:
+    parser = ArgumentParser(description="Time count_assignments on random hint sets of every density.")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="seed of the random hint sets")
+    parser.add_argument("--sets", type=int, default=DEFAULT_SETS_AMOUNT, help="hint sets per density")
+    parser.add_argument(
+        "--cold-starts", type=int, default=COLD_STARTS_AMOUNT, help="fresh processes to time the import and first call"
+    )
+    parser.add_argument("--save", metavar="PATH", help="save the results as a baseline JSON file")
+    parser.add_argument("--compare", metavar="PATH", help="compare the results to a baseline JSON file")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.seed, args.sets, cold_starts_amount=args.cold_starts)
+    baseline = load_results(args.compare) if args.compare else None
+    print(format_results(results, baseline))
+    if args.save:
+        save_results(results, args.save)
+
+
+if __name__ == "__main__":
+    main()
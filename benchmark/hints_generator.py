@@ -0,0 +1,87 @@
+from enum import Enum
+from random import Random
+
+from picasso.hints import AbsoluteHint, Hint, NeighborHint, RelativeHint
+from picasso.models import Floor, HintAttribute
+from picasso.tower import DEFAULT_TOWER_SPEC, CompactTower, TowerSpec
+
+
+class Density(Enum):
+    Sparse = "sparse"
+    Medium = "medium"
+    NearFull = "near-full"
+    Contradictory = "contradictory"
+
+
+# The (minimum, maximum) amount of hints in a set of every density, for a five floors tower.
+HINTS_AMOUNTS = {
+    Density.Sparse: (1, 3),
+    Density.Medium: (4, 8),
+    Density.NearFull: (10, 16),
+    Density.Contradictory: (4, 8),
+}
+
+
+def get_floor(floor_index: int) -> int:
+    """
+    Get the floor number of a floor index, the first five floors are Floor members.
+    """
+    floor = floor_index + Floor.First
+    return Floor(floor) if floor <= Floor.Fifth else floor
+
+
+def get_floor_attributes(tower: CompactTower, floor_index: int, spec: TowerSpec) -> list[HintAttribute]:
+    """
+    Get the floor, the color and the animal of a floor of the tower.
+    """
+    colors, animals = tower
+    return [get_floor(floor_index), spec.colors[colors[floor_index]], spec.animals[animals[floor_index]]]
+
+
+def generate_tower(rng: Random, spec: TowerSpec = DEFAULT_TOWER_SPEC) -> CompactTower:
+    """
+    Generate a random full tower.
+    """
+    floors = range(spec.floors_amount)
+    return tuple(rng.sample(floors, len(floors))), tuple(rng.sample(floors, len(floors)))
+
+
+def generate_true_hint(rng: Random, tower: CompactTower, spec: TowerSpec = DEFAULT_TOWER_SPEC) -> Hint:
+    """
+    Generate a random AbsoluteHint, RelativeHint or NeighborHint that the tower satisfies.
+    """
+    hint_type = rng.choice((AbsoluteHint, RelativeHint, NeighborHint))
+    if hint_type is AbsoluteHint:
+        attr1, attr2 = rng.sample(get_floor_attributes(tower, rng.randrange(spec.floors_amount), spec), 2)
+        return AbsoluteHint(attr1, attr2)
+
+    if hint_type is NeighborHint:
+        floor_index = rng.randrange(spec.floors_amount - 1)
+        neighbor_floors = [floor_index, floor_index + 1]
+        rng.shuffle(neighbor_floors)
+        attr1 = rng.choice(get_floor_attributes(tower, neighbor_floors[0], spec))
+        attr2 = rng.choice(get_floor_attributes(tower, neighbor_floors[1], spec)[1:])
+        return NeighborHint(attr2, attr1)
+
+    # Relative hints are between colors and animals only.
+    first_floor, second_floor = rng.sample(range(spec.floors_amount), 2)
+    attr1 = rng.choice(get_floor_attributes(tower, first_floor, spec)[1:])
+    attr2 = rng.choice(get_floor_attributes(tower, second_floor, spec)[1:])
+    return RelativeHint(attr1, attr2, first_floor - second_floor)
+
+
+def generate_hints(rng: Random, density: Density, spec: TowerSpec = DEFAULT_TOWER_SPEC) -> list[Hint]:
+    """
+    Generate a random hint set of the given density.
+    The hints of every density but Contradictory are satisfied by a random tower, so they have at least one
+    assignment. Contradictory sets also put one of the tower colors on two different floors.
+    """
+    tower = generate_tower(rng, spec)
+    minimum_amount, maximum_amount = HINTS_AMOUNTS[density]
+    hints = [generate_true_hint(rng, tower, spec) for _ in range(rng.randint(minimum_amount, maximum_amount))]
+    if density == Density.Contradictory:
+        first_floor, second_floor = rng.sample(range(spec.floors_amount), 2)
+        color = spec.colors[tower[0][first_floor]]
+        hints.insert(rng.randint(0, len(hints)), AbsoluteHint(color, get_floor(first_floor)))
+        hints.insert(rng.randint(0, len(hints)), AbsoluteHint(color, get_floor(second_floor)))
+    return hints
@@ -0,0 +1,206 @@
+import json
+import subprocess
+import sys
+from math import ceil
+from random import Random
+from time import perf_counter
+from typing import Any, Callable, TypeVar
+
+from benchmark.hints_generator import Density, generate_hints
+from picasso._backtracking import count_solutions
+from picasso._compile import compile_specific_hints
+from picasso._count_assignments import count_assignments
+from picasso._domains import propagate_domains
+from picasso._planner import plan_hints
+from picasso.hints import Hint, SpecificHint, get_specific_hints
+from picasso.hints_utils import ContradictingHintsError
+from picasso.tower import DEFAULT_TOWER_SPEC, Domains, TowerSpec
+
+STAGES = ("get_specific_hints", "compile_hints", "propagate_domains", "enumeration", "end_to_end")
+PERCENTILES = (50, 99)
+COLD_START = "cold_start"
+COLD_START_STAGES = ("import", "first_call")
+COLD_STARTS_AMOUNT = 5
+
+# Imports the counting core and counts a small hint set in a fresh process, prints the two wall times as JSON.
+COLD_START_CODE = """
+import json
+from time import perf_counter
+
+start_time = perf_counter()
+from picasso._count_assignments import count_assignments
+from picasso.hints import NeighborHint, RelativeHint
+from picasso.models import Animal, Color
+import_time = perf_counter() - start_time
+
+start_time = perf_counter()
+count_assignments([RelativeHint(Color.Red, Animal.Frog, 1), NeighborHint(Color.Blue, Animal.Bird)])
+first_call_time = perf_counter() - start_time
+print(json.dumps({"import": import_time, "first_call": first_call_time}))
+"""
+
+# The results of a benchmark run: the throughput and the stage latencies percentiles of every density.
+BenchmarkResults = dict[str, dict[str, Any]]
+
+T = TypeVar("T")
+
+
+def get_percentile(sorted_values: list[float], percentile: int) -> float:
+    """
+    Get the nearest-rank percentile of sorted values.
+    """
+    rank = max(ceil(len(sorted_values) * percentile / 100), 1)
+    return sorted_values[rank - 1]
+
+
+def measure(function: Callable[[], T]) -> tuple[T, float]:
+    """
+    Call the function and return its result with its wall time in seconds.
+    """
+    start_time = perf_counter()
+    result = function()
+    return result, perf_counter() - start_time
+
+
+def time_stages(hints: list[Hint], spec: TowerSpec = DEFAULT_TOWER_SPEC) -> dict[str, float]:
+    """
+    Count the assignments of the hints stage by stage, the way count_assignments does,
+    and return the wall time of every stage and of an end to end count_assignments call.
+    """
+    specific_hints, specific_hints_time = measure(lambda: get_specific_hints(hints, spec))
+    planned_hints, compile_time = measure(
+        lambda: plan_hints(compile_specific_hints(specific_hints, spec), spec.floors_amount)
+    )
+    compiled_hints: list[SpecificHint] = list(planned_hints)
+    tower = spec.new_partial_tower()
+
+    def propagate() -> Domains | None:
+        try:
+            return propagate_domains(tower, compiled_hints)
+        except ContradictingHintsError:
+            return None
+
+    domains, propagate_time = measure(propagate)
+    enumeration_time = 0.0
+    if domains is not None:
+        enumeration_time = measure(lambda: count_solutions(tower, compiled_hints, domains=domains))[1]
+    end_to_end_time = measure(lambda: count_assignments(hints, spec=spec))[1]
+    return {
+        "get_specific_hints": specific_hints_time,
+        "compile_hints": compile_time,
+        "propagate_domains": propagate_time,
+        "enumeration": enumeration_time,
+        "end_to_end": end_to_end_time,
+    }
+
+
+def time_cold_start() -> dict[str, float]:
+    """
+    Return the wall times of importing the counting core and of the first count in a fresh process.
+    """
+    output = subprocess.run([sys.executable, "-c", COLD_START_CODE], capture_output=True, check=True, text=True)
+    stages_times: dict[str, float] = json.loads(output.stdout)
+    return stages_times
+
+
+def get_percentiles(times: list[float]) -> dict[str, float]:
+    """
+    Get the percentiles of the times in milliseconds.
+    """
+    sorted_times = sorted(times)
+    return {f"p{percentile}": get_percentile(sorted_times, percentile) * 1000 for percentile in PERCENTILES}
+
+
+def run_benchmark(
+    seed: int, sets_amount: int, spec: TowerSpec = DEFAULT_TOWER_SPEC, cold_starts_amount: int = COLD_STARTS_AMOUNT
+) -> BenchmarkResults:
+    """
+    Time sets_amount random hint sets of every density, and cold_starts_amount fresh processes.
+    Returns the throughput in hint sets per second and the stage latencies percentiles in milliseconds,
+    and the percentiles of the import and the first call of the fresh processes under "cold_start".
+    """
+    rng = Random(seed)
+    results: BenchmarkResults = {}
+    for density in Density:
+        stages_times: dict[str, list[float]] = {stage: [] for stage in STAGES}
+        for _ in range(sets_amount):
+            for stage, stage_time in time_stages(generate_hints(rng, density, spec), spec).items():
+                stages_times[stage].append(stage_time)
+
+        density_results: dict[str, Any] = {"throughput": sets_amount / sum(stages_times["end_to_end"])}
+        for stage, times in stages_times.items():
+            density_results[stage] = get_percentiles(times)
+        results[density.value] = density_results
+
+    if cold_starts_amount:
+        cold_starts_times: dict[str, list[float]] = {stage: [] for stage in COLD_START_STAGES}
+        for _ in range(cold_starts_amount):
+            for stage, stage_time in time_cold_start().items():
+                cold_starts_times[stage].append(stage_time)
+        results[COLD_START] = {stage: get_percentiles(times) for stage, times in cold_starts_times.items()}
+    return results
+
+
+def format_results(results: BenchmarkResults, baseline: BenchmarkResults | None = None) -> str:
+    """
+    Format the results as a table, with the ratios to the baseline results when given.
+    """
+    lines = []
+    for density, density_results in results.items():
+        stages: tuple[str, ...]
+        if density == COLD_START:
+            lines.append(f"{density}:")
+            stages = COLD_START_STAGES
+        else:
+            lines.append(f"{density}: {density_results['throughput']:.1f} hint sets/s")
+            stages = STAGES
+        for stage in stages:
+            line = f"    {stage:<20}" + "".join(
+                f"  p{percentile} {density_results[stage][f'p{percentile}']:8.3f}ms" for percentile in PERCENTILES
+            )
+            if baseline is not None and density in baseline:
+                line += "".join(
+                    f"  p{percentile} {format_ratio(get_ratio(density_results, baseline[density], stage, percentile))}"
+                    for percentile in PERCENTILES
+                )
+            lines.append(line)
+    return "\n".join(lines)
+
+
+def get_ratio(
+    density_results: dict[str, Any], baseline_results: dict[str, Any], stage: str, percentile: int
+) -> float | None:
+    """
+    Get the ratio of a stage latency percentile to its baseline, above 1 is a regression.
+    Return None when the baseline was recorded without the stage, like baselines of older stage names.
+    """
+    if stage not in baseline_results:
+        return None
+    baseline_latency = baseline_results[stage][f"p{percentile}"]
+    if not baseline_latency:
+        return 1.0
+    return float(density_results[stage][f"p{percentile}"] / baseline_latency)
+
+
+def format_ratio(ratio: float | None) -> str:
+    """
+    Format a ratio to the baseline, n/a when the baseline has no such stage.
+    """
+    return "  n/a" if ratio is None else f"x{ratio:.2f}"
+
+
+def save_results(results: BenchmarkResults, path: str) -> None:
+    """
+    Save the results as a baseline JSON file.
+    """
+    with open(path, "w") as baseline_file:
+        json.dump(results, baseline_file, indent=4)
+
+
+def load_results(path: str) -> BenchmarkResults:
+    """
+    Load the results of a baseline JSON file.
+    """
+    with open(path) as baseline_file:
+        results: BenchmarkResults = json.load(baseline_file)
+    return results
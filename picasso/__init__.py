@@ -0,0 +1,17 @@
+from typing import TYPE_CHECKING, Any
+
+from picasso.models import Difficulty
+
+if TYPE_CHECKING:
+    from picasso._generator import Puzzle, generate_puzzle
+
+__all__ = ["Difficulty", "Puzzle", "generate_puzzle"]
+
+
+def __getattr__(name: str) -> Any:
+    # The generator is imported on its first use, so importing the counting core stays fast.
+    if name in ("Puzzle", "generate_puzzle"):
+        from picasso import _generator
+
+        return getattr(_generator, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
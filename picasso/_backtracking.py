@@ -0,0 +1,289 @@
+from math import factorial
+
+from picasso._stats import CountStats
+from picasso.hints import SpecificHint
+from picasso.tower import EMPTY, Domains, PartialTower
+
+
+def is_hint_possible(hint: SpecificHint, tower: PartialTower, placed_attributes: set[tuple[int, int]]) -> bool:
+    """
+    Check if the hint can still be satisfied by the partial tower.
+    A hint with all its attributes placed is validated, a hint with one attribute left
+    must have an empty floor that can hold it (forward checking).
+    """
+    unplaced_attributes = [attribute for attribute in hint.attributes if attribute not in placed_attributes]
+    if not unplaced_attributes:
+        return hint.validate(tower)
+    if len(unplaced_attributes) > 1:
+        return True
+
+    row_index, item = unplaced_attributes[0]
+    floor_items = tower[row_index]
+    for floor, floor_item in enumerate(floor_items):
+        if floor_item == EMPTY:
+            floor_items[floor] = item
+            is_possible = hint.validate(tower)
+            floor_items[floor] = EMPTY
+            if is_possible:
+                return True
+    return False
+
+
+def get_placement_order(
+    hints_by_attribute: dict[tuple[int, int], list[SpecificHint]], unplaced_attributes: set[tuple[int, int]]
+) -> list[tuple[int, int]]:
+    """
+    Order the attributes to place so every attribute is connected by as many hints as possible
+    to the attributes placed before it, which lets the hints cut the branches as early as possible.
+    """
+    order: list[tuple[int, int]] = []
+    connections = {attribute: 0 for attribute in unplaced_attributes}
+    while connections:
+        attribute = max(sorted(connections), key=lambda item: (connections[item], len(hints_by_attribute[item])))
+        order.append(attribute)
+        del connections[attribute]
+        for hint in hints_by_attribute[attribute]:
+            for other_attribute in hint.attributes:
+                if other_attribute in connections:
+                    connections[other_attribute] += 1
+    return order
+
+
+def get_independent_components(
+    hints: list[SpecificHint], rows_amount: int
+) -> list[tuple[tuple[int, ...], list[SpecificHint]]]:
+    """
+    Split the hints into components that can be counted independently, as (row indices, hints) pairs.
+    The hints connect the attributes they mention into a constraint graph, and the attributes of one row
+    are always connected since every item of the row takes a different floor.
+    So the components are the rows joined by hints that mention both a color and an animal,
+    a tower without such hints is counted as (color permutations) * (animal permutations).
+    """
+    components: list[set[int]] = [{row_index} for row_index in range(rows_amount)]
+    for hint in hints:
+        hint_rows = {row_index for row_index, _ in hint.attributes}
+        joined_component = set().union(*(components[row_index] for row_index in hint_rows))
+        for row_index in joined_component:
+            components[row_index] = joined_component
+
+    independent_components = []
+    for row_index, component in enumerate(components):
+        if row_index == min(component):
+            component_hints = [hint for hint in hints if hint.attributes[0][0] in component]
+            independent_components.append((tuple(sorted(component)), component_hints))
+    return independent_components
+
+
+def get_component_plan(
+    rows: PartialTower,
+    hints: list[SpecificHint],
+    component_rows: tuple[int, ...],
+    placed_attributes: set[tuple[int, int]],
+) -> tuple[dict[tuple[int, int], list[SpecificHint]], list[tuple[int, int]], int]:
+    """
+    Get the hints of every attribute of the component, the order to place its hinted attributes in,
+    and the amount of fillings of the free items that are left once all of them are placed.
+    """
+    hints_by_attribute: dict[tuple[int, int], list[SpecificHint]] = {}
+    for hint in hints:
+        for attribute in hint.attributes:
+            hints_by_attribute.setdefault(attribute, []).append(hint)
+
+    placement_order = get_placement_order(hints_by_attribute, set(hints_by_attribute).difference(placed_attributes))
+    free_items_amounts = {row_index: rows[row_index].count(EMPTY) for row_index in component_rows}
+    for row_index, _ in placement_order:
+        free_items_amounts[row_index] -= 1
+    free_items_assignments = 1
+    for free_items_amount in free_items_amounts.values():
+        free_items_assignments *= factorial(free_items_amount)
+    return hints_by_attribute, placement_order, free_items_assignments
+
+
+def count_component_solutions(
+    rows: PartialTower,
+    hints: list[SpecificHint],
+    component_rows: tuple[int, ...],
+    placed_attributes: set[tuple[int, int]],
+    at_most: int,
+    stats: CountStats | None = None,
+    domains: Domains | None = None,
+) -> int:
+    """
+    Count the fillings of the component rows that satisfy the component hints, up to at_most fillings.
+    The hinted items are placed only on the floors of their domains when given.
+    """
+    hints_by_attribute, placement_order, free_items_assignments = get_component_plan(
+        rows, hints, component_rows, placed_attributes
+    )
+
+    def count_from(order_index: int, limit: int) -> int:
+        if order_index == len(placement_order):
+            return min(free_items_assignments, limit)
+
+        attribute = placement_order[order_index]
+        row_index, item = attribute
+        floor_items = rows[row_index]
+        attribute_hints = hints_by_attribute[attribute]
+        domain = domains[row_index][item] if domains is not None else -1
+        placed_attributes.add(attribute)
+        counter = 0
+
+        for floor in range(len(floor_items)):
+            if floor_items[floor] == EMPTY and domain >> floor & 1:
+                if stats is not None:
+                    stats.candidates += 1
+                floor_items[floor] = item
+                if all(is_hint_possible(hint, rows, placed_attributes) for hint in attribute_hints):
+                    counter += count_from(order_index + 1, limit - counter)
+                floor_items[floor] = EMPTY
+                if counter >= limit:
+                    break
+
+        placed_attributes.remove(attribute)
+        return counter
+
+    return count_from(0, at_most)
+
+
+def count_solutions(
+    tower: PartialTower,
+    hints: list[SpecificHint],
+    at_most: int | None = None,
+    stats: CountStats | None = None,
+    domains: Domains | None = None,
+) -> int:
+    """
+    Count the assignments that complete the tower and satisfy the hints, up to at_most assignments.
+    The colors and animals the hints mention are placed one at a time on the empty floors and every hint
+    is checked as soon as one of its attributes is placed, so dead branches are cut early.
+    Items that no hint mentions are interchangeable, once all the mentioned items are placed
+    the rest of the floors are counted without enumerating them.
+    Independent components of the hints are counted separately and their counts are multiplied.
+    The search stops as soon as at_most assignments are found.
+    When the domains of propagate_domains are given, the hinted items are placed only on the floors of their domains.
+    """
+    rows = (list(tower[0]), list(tower[1]))
+    for floor_items in rows:
+        known_items = [item for item in floor_items if item != EMPTY]
+        if len(set(known_items)) != len(known_items):
+            return 0
+
+    placed_attributes = {
+        (row_index, item) for row_index, floor_items in enumerate(rows) for item in floor_items if item != EMPTY
+    }
+    for hint in hints:
+        if not is_hint_possible(hint, rows, placed_attributes):
+            return 0
+
+    if at_most is None:
+        at_most = factorial(len(rows[0])) ** 2
+    # Every component count is capped by at_most, the product of the capped counts is still at least at_most
+    # when the real product is, since none of the other counts is zero.
+    counter = 1
+    for component_rows, component_hints in get_independent_components(hints, len(rows)):
+        counter *= count_component_solutions(
+            rows, component_hints, component_rows, placed_attributes, at_most, stats, domains
+        )
+        if counter == 0:
+            return 0
+    return min(counter, at_most)
+
+
+def count_component_marginals(
+    rows: PartialTower,
+    hints: list[SpecificHint],
+    component_rows: tuple[int, ...],
+    placed_attributes: set[tuple[int, int]],
+    domains: Domains | None = None,
+) -> tuple[int, dict[int, list[list[int]]]]:
+    """
+    Count the fillings of the component rows that satisfy the component hints, and the fillings that put every item
+    of every component row on every floor, as {row index: table[floor][item]}.
+    Every branch that places all the hinted items stands for all the fillings of the free items, and every free item
+    of a row is on every empty floor of the row in the same share of them.
+    """
+    hints_by_attribute, placement_order, free_items_assignments = get_component_plan(
+        rows, hints, component_rows, placed_attributes
+    )
+    floors_amount = len(rows[0])
+    tables = {row_index: [[0] * floors_amount for _ in range(floors_amount)] for row_index in component_rows}
+    counter = 0
+
+    def add_filling() -> None:
+        for row_index in component_rows:
+            floor_items = rows[row_index]
+            table = tables[row_index]
+            free_items = [item for item in range(floors_amount) if item not in floor_items]
+            free_item_fillings = free_items_assignments // len(free_items) if free_items else 0
+            for floor, item in enumerate(floor_items):
+                if item != EMPTY:
+                    table[floor][item] += free_items_assignments
+                    continue
+                for free_item in free_items:
+                    table[floor][free_item] += free_item_fillings
+
+    def visit(order_index: int) -> None:
+        nonlocal counter
+        if order_index == len(placement_order):
+            counter += free_items_assignments
+            add_filling()
+            return
+
+        attribute = placement_order[order_index]
+        row_index, item = attribute
+        floor_items = rows[row_index]
+        attribute_hints = hints_by_attribute[attribute]
+        domain = domains[row_index][item] if domains is not None else -1
+        placed_attributes.add(attribute)
+        for floor in range(len(floor_items)):
+            if floor_items[floor] == EMPTY and domain >> floor & 1:
+                floor_items[floor] = item
+                if all(is_hint_possible(hint, rows, placed_attributes) for hint in attribute_hints):
+                    visit(order_index + 1)
+                floor_items[floor] = EMPTY
+        placed_attributes.remove(attribute)
+
+    visit(0)
+    return counter, tables
+
+
+def count_marginals(
+    tower: PartialTower, hints: list[SpecificHint], domains: Domains | None = None
+) -> tuple[int, list[list[list[int]]]]:
+    """
+    Count the assignments that complete the tower and satisfy the hints, and the assignments that put every item
+    of every row on every floor, as tables[row index][floor][item], in the same search as count_solutions.
+    The table of a row in one of the independent components is multiplied by the counts of the other components.
+    """
+    floors_amount = len(tower[0])
+    empty_tables = [[[0] * floors_amount for _ in range(floors_amount)] for _ in tower]
+    rows = (list(tower[0]), list(tower[1]))
+    for floor_items in rows:
+        known_items = [item for item in floor_items if item != EMPTY]
+        if len(set(known_items)) != len(known_items):
+            return 0, empty_tables
+
+    placed_attributes = {
+        (row_index, item) for row_index, floor_items in enumerate(rows) for item in floor_items if item != EMPTY
+    }
+    for hint in hints:
+        if not is_hint_possible(hint, rows, placed_attributes):
+            return 0, empty_tables
+
+    counter = 1
+    components_marginals = []
+    for component_rows, component_hints in get_independent_components(hints, len(rows)):
+        component_counter, component_tables = count_component_marginals(
+            rows, component_hints, component_rows, placed_attributes, domains
+        )
+        if component_counter == 0:
+            return 0, empty_tables
+        counter *= component_counter
+        components_marginals.append((component_counter, component_tables))
+
+    tables = empty_tables
+    for component_counter, component_tables in components_marginals:
+        other_components_counter = counter // component_counter
+        for row_index, table in component_tables.items():
+            tables[row_index] = [[cell * other_components_counter for cell in floor_cells] for floor_cells in table]
+    return counter, tables
@@ -0,0 +1,55 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from os import cpu_count
+from typing import Iterable
+
+from picasso._count_assignments import count_assignments
+from picasso._serialization import SerializedHint, deserialize_hints, serialize_hints
+from picasso.hints import Hint
+from picasso.models import CountingEngine
+from picasso.tower import DEFAULT_TOWER_SPEC, TowerSpec
+
+# Every worker gets about this amount of chunks, small enough to balance the load between the workers
+# and big enough so the per task overhead does not dominate the counts.
+CHUNKS_PER_WORKER = 4
+MAX_CHUNK_SIZE = 1000
+
+
+def count_serialized_assignments(
+    serialized_hints: tuple[SerializedHint, ...], engine: CountingEngine, spec: TowerSpec
+) -> int:
+    """
+    Count the assignments of hints in their serialized form, runs inside the pool workers.
+    """
+    return count_assignments(deserialize_hints(serialized_hints, spec), engine, spec)
+
+
+def get_chunk_size(hint_sets_amount: int, workers: int) -> int:
+    """
+    Get the amount of hint sets to send to a worker in each task.
+    """
+    return max(1, min(MAX_CHUNK_SIZE, hint_sets_amount // (workers * CHUNKS_PER_WORKER)))
+
+
+def count_assignments_many(
+    hint_sets: Iterable[list[Hint]],
+    workers: int | None = None,
+    chunk_size: int | None = None,
+    engine: CountingEngine = CountingEngine.Backtracking,
+    spec: TowerSpec = DEFAULT_TOWER_SPEC,
+) -> list[int]:
+    """
+    Count the assignments of many independent hint sets across a pool of worker processes.
+    The hints are sent to the workers in their serialized form and the counts are returned in the input order.
+    The workers default to the cpu count and the chunk size to a few chunks per worker,
+    with a single worker the hint sets are counted in this process.
+    """
+    serialized_hint_sets = [serialize_hints(hints, spec) for hints in hint_sets]
+    workers = workers or cpu_count() or 1
+    count = partial(count_serialized_assignments, engine=engine, spec=spec)
+    if workers == 1:
+        return [count(serialized_hints) for serialized_hints in serialized_hint_sets]
+
+    chunk_size = chunk_size or get_chunk_size(len(serialized_hint_sets), workers)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(count, serialized_hint_sets, chunksize=chunk_size))
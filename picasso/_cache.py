@@ -0,0 +1,52 @@
+from functools import lru_cache
+from typing import NamedTuple
+
+from picasso._count_assignments import count_specific_assignments
+from picasso.hints import Hint, get_canonical_hints, get_specific_hints
+from picasso.models import CountingEngine
+from picasso.tower import DEFAULT_TOWER_SPEC, TowerSpec
+
+DEFAULT_CACHE_SIZE = 4096
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
+class CountAssignmentsCache(object):
+    """
+    A bounded LRU cache in front of count_assignments.
+    Hint sets are cached by their canonical hints, so the same hints in a different order
+    or with swapped attributes are counted only once.
+    For example:
+        cache = CountAssignmentsCache(maxsize=1000)
+        cache.count_assignments([AbsoluteHint(Animal.Frog, Floor.Fifth)])
+        cache.count_assignments([AbsoluteHint(Floor.Fifth, Animal.Frog)])
+        cache.cache_info() - CacheStats(hits=1, misses=1, maxsize=1000, currsize=1)
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE, engine: CountingEngine = CountingEngine.Backtracking):
+        self.engine = engine
+        self._count_canonical_assignments = lru_cache(maxsize=maxsize)(count_specific_assignments)
+
+    def count_assignments(self, hints: list[Hint], spec: TowerSpec = DEFAULT_TOWER_SPEC) -> int:
+        """
+        Given a list of Hint objects, return the number of valid assignments that satisfy these hints.
+        """
+        canonical_hints = get_canonical_hints(get_specific_hints(hints, spec))
+        return self._count_canonical_assignments(canonical_hints, self.engine, spec)
+
+    def cache_info(self) -> CacheStats:
+        """
+        Get the cache hits, misses, max size and current size.
+        """
+        return CacheStats(*self._count_canonical_assignments.cache_info())
+
+    def cache_clear(self) -> None:
+        """
+        Clear the cache and its statistics.
+        """
+        self._count_canonical_assignments.cache_clear()
@@ -0,0 +1,169 @@
+from typing import Any, Sequence
+
+from picasso.hints import Hint, SpecificHint, get_specific_hints
+from picasso.hints_utils import ContradictingHintsError, insert_item
+from picasso.tower import DEFAULT_TOWER_SPEC, EMPTY, CompactTower, PartialTower, TowerSpec
+
+
+def get_possible_floors(floor_items: list[int], item: int, floors: Sequence[int]) -> list[int]:
+    """
+    Get the floors out of the given floors that can hold the item in the partial tower row.
+    """
+    if item in floor_items:
+        return [floor for floor in floors if floor_items[floor] == item]
+    return [floor for floor in floors if floor_items[floor] == EMPTY]
+
+
+class CompiledHint(SpecificHint):
+    """
+    A specific hint compiled once for a tower size into a precomputed form:
+    the floors its only attribute can be on, or the (first attribute floor, second attribute floor) pairs it allows.
+    Compiled hints are frozen and can be reused across counts of the tower they were compiled for.
+    """
+
+    __slots__ = (
+        "hint",
+        "spec",
+        "attributes",
+        "differences",
+        "base_floor",
+        "first_row",
+        "first_item",
+        "second_row",
+        "second_item",
+        "first_floors",
+        "second_floors",
+        "allowed_floors",
+        "allowed_pairs",
+    )
+
+    hint: SpecificHint
+    spec: TowerSpec
+    first_row: int
+    first_item: int
+    second_row: int | None
+    second_item: int | None
+    first_floors: tuple[int, ...]
+    second_floors: tuple[int, ...]
+    allowed_floors: frozenset[int]
+    allowed_pairs: frozenset[tuple[int, int]]
+
+    def __init__(self, hint: SpecificHint, spec: TowerSpec = DEFAULT_TOWER_SPEC):
+        floors = range(spec.floors_amount)
+        (first_row, first_item), *other_attributes = hint.attributes
+        second_row, second_item = other_attributes[0] if other_attributes else (None, None)
+        if other_attributes:
+            allowed_pairs = frozenset(
+                (first_floor, second_floor)
+                for first_floor in floors
+                for second_floor in floors
+                if first_floor - second_floor in hint.differences
+            )
+            allowed_floors = frozenset(first_floor for first_floor, _ in allowed_pairs)
+        else:
+            allowed_floors = frozenset(
+                hint.base_floor + difference
+                for difference in hint.differences
+                if hint.base_floor + difference in floors
+            )
+            allowed_pairs = frozenset()
+
+        for name, value in (
+            ("hint", hint),
+            ("spec", spec),
+            ("attributes", hint.attributes),
+            ("differences", hint.differences),
+            ("base_floor", hint.base_floor),
+            ("first_row", first_row),
+            ("first_item", first_item),
+            ("second_row", second_row),
+            ("second_item", second_item),
+            ("first_floors", tuple(sorted(allowed_floors))),
+            ("second_floors", tuple(sorted({second_floor for _, second_floor in allowed_pairs}))),
+            ("allowed_floors", allowed_floors),
+            ("allowed_pairs", allowed_pairs),
+        ):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is frozen")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is frozen")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({type(self.hint).__name__}, {self.get_key()})"
+
+    def validate(self, tower: CompactTower | PartialTower) -> bool:
+        first_floor = tower[self.first_row].index(self.first_item)
+        if self.second_row is None or self.second_item is None:
+            return first_floor in self.allowed_floors
+        return (first_floor, tower[self.second_row].index(self.second_item)) in self.allowed_pairs
+
+    def insert(self, tower: PartialTower) -> None:
+        """
+        Insert every attribute of the hint that has only one floor left according to the precomputed floors.
+        Raise ContradictingHintsError when no floor is left.
+        """
+        first_items = tower[self.first_row]
+        first_floors = get_possible_floors(first_items, self.first_item, self.first_floors)
+        if self.second_row is None or self.second_item is None:
+            if not first_floors:
+                raise ContradictingHintsError(f"{self!r} can not be satisfied")
+            if len(first_floors) == 1:
+                insert_item(first_items, first_floors[0], self.first_item)
+            return
+
+        second_items = tower[self.second_row]
+        second_floors = get_possible_floors(second_items, self.second_item, self.second_floors)
+        is_same_row = self.first_row == self.second_row
+        is_same_item = is_same_row and self.first_item == self.second_item
+        possible_first_floors = set()
+        possible_second_floors = set()
+        for first_floor, second_floor in self.allowed_pairs:
+            if first_floor in first_floors and second_floor in second_floors:
+                if not is_same_row or (first_floor == second_floor) == is_same_item:
+                    possible_first_floors.add(first_floor)
+                    possible_second_floors.add(second_floor)
+        if not possible_first_floors:
+            raise ContradictingHintsError(f"{self!r} can not be satisfied")
+        if len(possible_first_floors) == 1:
+            insert_item(first_items, possible_first_floors.pop(), self.first_item)
+        if len(possible_second_floors) == 1:
+            insert_item(second_items, possible_second_floors.pop(), self.second_item)
+
+
+def check_compiled_hint(hint: SpecificHint, spec: TowerSpec) -> None:
+    """
+    Raise ValueError for a hint compiled for another tower, its floors and items only fit the tower it was
+    compiled for.
+    """
+    if not isinstance(hint, CompiledHint):
+        return
+    if (hint.spec.color_type, hint.spec.animal_type) != (spec.color_type, spec.animal_type):
+        raise ValueError(
+            f"Got {hint!r} compiled for a tower of {hint.spec.color_type.__name__} and "
+            f"{hint.spec.animal_type.__name__}, must be compiled for the counted tower"
+        )
+
+
+def compile_specific_hints(
+    specific_hints: Sequence[SpecificHint], spec: TowerSpec = DEFAULT_TOWER_SPEC
+) -> tuple[CompiledHint, ...]:
+    """
+    Compile the specific hints for the tower size, already compiled hints are kept as they are.
+    Raise ValueError for hints compiled for another tower.
+    """
+    compiled_hints = []
+    for hint in specific_hints:
+        check_compiled_hint(hint, spec)
+        compiled_hints.append(hint if isinstance(hint, CompiledHint) else CompiledHint(hint, spec))
+    return tuple(compiled_hints)
+
+
+def compile_hints(hints: list[Hint], spec: TowerSpec = DEFAULT_TOWER_SPEC) -> tuple[CompiledHint, ...]:
+    """
+    Compile a list of Hint objects once, the compiled hints can be passed to count_assignments
+    instead of the hints for every count of the same tower.
+    """
+    return compile_specific_hints(get_specific_hints(hints, spec), spec)
@@ -1,87 +1,217 @@
 from itertools import permutations
-from typing import Generator
+from math import factorial
+from typing import Generator, Iterable, Literal, Sequence, overload
 
+from picasso._backtracking import count_solutions
+from picasso._compile import compile_specific_hints
+from picasso._domains import propagate_domains
+from picasso._planner import plan_hints
+from picasso._stats import CountStats, measure_stage
 from picasso.hints import Hint, SpecificHint, get_specific_hints
-from picasso.hints_utils import complete_last_available_option
-from picasso.models import Animal, Color, Floor, PicassoTowerFloor
+from picasso.hints_utils import ContradictingHintsError, complete_last_available_option
+from picasso.models import CountingEngine, PicassoTowerFloor
+from picasso.tower import DEFAULT_TOWER_SPEC, EMPTY, CompactTower, PartialTower, TowerSpec, decode_tower
 
+# Rows with up to this amount of fillings (a seven floors row) are generated once and kept in memory.
+MAX_CACHED_ROW_OPTIONS = factorial(7)
 
-def generate_all_floor_combinations(
-    tower: dict[Floor, PicassoTowerFloor]
-) -> Generator[dict[Floor, PicassoTowerFloor], None, None]:
+
+def generate_floor_items_options(floor_items: list[int]) -> Generator[tuple[int, ...], None, None]:
+    """
+    Generate all possible fillings of one row (colors or animals) of a partial tower.
+    Rows that already hold the same item twice have no possible filling.
+    """
+    unused_items = [item for item in range(len(floor_items)) if item not in floor_items]
+    empty_floors = [floor for floor, item in enumerate(floor_items) if item == EMPTY]
+    if len(unused_items) != len(empty_floors):
+        return
+
+    for items_perm in permutations(unused_items):
+        option = list(floor_items)
+        for floor, item in zip(empty_floors, items_perm):
+            option[floor] = item
+        yield tuple(option)
+
+
+def generate_all_floor_combinations(tower: PartialTower) -> Generator[CompactTower, None, None]:
     """
     Generate all possible assignments of the tower.
     Take in consideration the already existing information in the tower.
     The logic is to go over all unused colors permutations and for each one go over all unused animals permutations,
-    then go over the tower floors and for each empty space insert the next color/animal
-    according to the current permutations.
+    every combination of the two is yielded as a compact tower.
+    The permutations are generated lazily, only the animals permutations of small towers are kept
+    to be reused for every colors permutation, so the memory stays flat for any tower size.
     """
-    unused_colors = list(Color)
-    unused_animals = list(Animal)
-
-    for floor in tower.values():
-        if floor.color in unused_colors:
-            unused_colors.remove(floor.color)
-        if floor.animal in unused_animals:
-            unused_animals.remove(floor.animal)
+    cached_animals_options: list[tuple[int, ...]] | None = None
+    if factorial(tower[1].count(EMPTY)) <= MAX_CACHED_ROW_OPTIONS:
+        cached_animals_options = list(generate_floor_items_options(tower[1]))
 
-    for color_perm in permutations(unused_colors):
-        for animal_perm in permutations(unused_animals):
-            color_iter = iter(color_perm)
-            animal_iter = iter(animal_perm)
-            tower_copy = {
-                floor_num: PicassoTowerFloor(animal=tower[floor_num].animal, color=tower[floor_num].color)
-                for floor_num in tower
-            }
-            for floor in tower_copy.values():
-                if floor.color is None:
-                    floor.color = next(color_iter)
-                if floor.animal is None:
-                    floor.animal = next(animal_iter)
-            yield tower_copy
+    for colors in generate_floor_items_options(tower[0]):
+        animals_options: Iterable[tuple[int, ...]] = (
+            cached_animals_options if cached_animals_options is not None else generate_floor_items_options(tower[1])
+        )
+        for animals in animals_options:
+            yield colors, animals
 
 
-def are_towers_equal(tower1: dict[Floor, PicassoTowerFloor], tower2: dict[Floor, PicassoTowerFloor]) -> bool:
+def get_filled_amounts(tower: PartialTower) -> tuple[int, int]:
     """
-    Get two towers and go over their floors to check if they are equal.
+    Get the amount of known floors in every row of the tower.
+    Known floors are never overwritten, so the amounts grow with every write and tell if a row was written.
     """
-    for floor in Floor:
-        if tower1[floor].color != tower2[floor].color or tower1[floor].animal != tower2[floor].animal:
-            return False
-    return True
+    return len(tower[0]) - tower[0].count(EMPTY), len(tower[1]) - tower[1].count(EMPTY)
 
 
-def insert_hints(tower: dict[Floor, PicassoTowerFloor], hints: list[SpecificHint]) -> None:
+def insert_hints(tower: PartialTower, hints: list[SpecificHint]) -> None:
     """
     Responsible for inserting color and animal to the floors according to the hints.
-    After each rotation of trying to insert the hints, If the tower has changed the function will
-    try to run the flow again in order to catch cases where after adding more information some
-    hints will give more completion to the tower.
-    """
-    is_tower_changed = True
-    while is_tower_changed:
-        tower_copy = {
-            floor_num: PicassoTowerFloor(animal=tower[floor_num].animal, color=tower[floor_num].color)
-            for floor_num in tower
-        }
-        for hint in hints:
+    Every hint watches the rows of its attributes, and is inserted again only when one of them was written
+    since its last insert, including by the hint itself. A hint with all its attributes placed has nothing
+    left to insert and is not inserted again. After each round the rows with a single empty floor are completed,
+    and the rounds go on until a round writes nothing.
+    Raise ContradictingHintsError as soon as a hint can not be inserted, so contradicting hints are
+    rejected without going over the assignments.
+    """
+    hints_rows = [tuple({row_index for row_index, _ in hint.attributes}) for hint in hints]
+    inserted_amounts: list[tuple[int, ...] | None] = [None] * len(hints)
+    is_settled = [False] * len(hints)
+    round_amounts = None
+    filled_amounts = get_filled_amounts(tower)
+    while round_amounts != filled_amounts:
+        round_amounts = filled_amounts
+        for hint_index, hint in enumerate(hints):
+            if is_settled[hint_index]:
+                continue
+            hint_amounts = tuple(filled_amounts[row_index] for row_index in hints_rows[hint_index])
+            if hint_amounts == inserted_amounts[hint_index]:
+                continue
             hint.insert(tower)
+            inserted_amounts[hint_index] = hint_amounts
+            is_settled[hint_index] = all(item in tower[row_index] for row_index, item in hint.attributes)
+            filled_amounts = get_filled_amounts(tower)
         complete_last_available_option(tower)
-        is_tower_changed = not are_towers_equal(tower, tower_copy)
+        filled_amounts = get_filled_amounts(tower)
+
+
+def count_specific_assignments(
+    specific_hints: Sequence[SpecificHint],
+    engine: CountingEngine = CountingEngine.Backtracking,
+    spec: TowerSpec = DEFAULT_TOWER_SPEC,
+    at_most: int | None = None,
+    stats: CountStats | None = None,
+) -> int:
+    """
+    Return the number of valid assignments that satisfy the specific hints, up to at_most assignments.
+    The hints are compiled for the tower size unless they are already compiled,
+    and are checked in the order of plan_hints.
+    The floors every item can be on are pruned by propagate_domains before counting, and the counting
+    only places the hinted items on the floors left to them.
+    The NumPy engine requires the optional numpy dependency, it masks only the permutations the domains allow.
+    The Index engine counts with the bitsets of a persistent index of the tower, without propagating the hints.
+    """
+    if at_most is not None and at_most < 0:
+        raise ValueError(f"Got at_most {at_most}, must not be negative")
+    if engine == CountingEngine.Index:
+        from picasso._index import count_with_index
+
+        with measure_stage(stats, "enumeration"):
+            assignments_amount = count_with_index(specific_hints, spec)
+        return assignments_amount if at_most is None else min(assignments_amount, at_most)
+    with measure_stage(stats, "compile_hints"):
+        specific_hints = list(plan_hints(compile_specific_hints(specific_hints, spec), spec.floors_amount))
+    if stats is not None:
+        specific_hints = stats.instrument(specific_hints)
+
+    tower = spec.new_partial_tower()
+    try:
+        with measure_stage(stats, "propagate_domains"):
+            domains = propagate_domains(tower, specific_hints, stats)
+    except ContradictingHintsError:
+        return 0
+
+    with measure_stage(stats, "enumeration"):
+        if engine == CountingEngine.NumPy:
+            from picasso._numpy_engine import count_with_masks
+
+            return count_with_masks(specific_hints, spec.floors_amount, at_most, domains)
+
+        return count_solutions(tower, specific_hints, at_most, stats, domains)
 
 
-def count_assignments(hints: list[Hint]) -> int:
+def count_assignments(
+    hints: list[Hint],
+    engine: CountingEngine = CountingEngine.Backtracking,
+    spec: TowerSpec = DEFAULT_TOWER_SPEC,
+    at_most: int | None = None,
+    stats: CountStats | None = None,
+) -> int:
     """
     Given a list of Hint objects, return the number of valid assignments that satisfy these hints.
+    The hints can also be compiled hints of compile_hints, to reuse them across counts.
+    When at_most is given the counting stops once at_most assignments are found and at_most is returned.
+    When stats are given they collect what every stage of the counting did.
     """
-    counter = 0
-    specific_hints = get_specific_hints(hints)
-    tower: dict[Floor, PicassoTowerFloor] = {Floor(i + 1): PicassoTowerFloor(animal=None, color=None) for i in range(5)}
-    insert_hints(tower, specific_hints)
+    with measure_stage(stats, "get_specific_hints"):
+        specific_hints = get_specific_hints(hints, spec)
+    return count_specific_assignments(specific_hints, engine, spec, at_most, stats)
+
+
+def has_solution(
+    hints: list[Hint], engine: CountingEngine = CountingEngine.Backtracking, spec: TowerSpec = DEFAULT_TOWER_SPEC
+) -> bool:
+    """
+    Check if at least one assignment satisfies the hints, the counting stops at the first assignment.
+    """
+    return count_assignments(hints, engine, spec, at_most=1) == 1
+
+
+def is_unique(
+    hints: list[Hint], engine: CountingEngine = CountingEngine.Backtracking, spec: TowerSpec = DEFAULT_TOWER_SPEC
+) -> bool:
+    """
+    Check if exactly one assignment satisfies the hints, the counting stops at the second assignment.
+    """
+    return count_assignments(hints, engine, spec, at_most=2) == 1
+
+
+@overload
+def iter_assignments(
+    hints: list[Hint], limit: int | None = ..., *, compact: Literal[True], spec: TowerSpec = ...
+) -> Generator[CompactTower, None, None]: ...
+
+
+@overload
+def iter_assignments(
+    hints: list[Hint], limit: int | None = ..., compact: Literal[False] = ..., spec: TowerSpec = ...
+) -> Generator[dict[int, PicassoTowerFloor], None, None]: ...
+
+
+def iter_assignments(
+    hints: list[Hint], limit: int | None = None, compact: bool = False, spec: TowerSpec = DEFAULT_TOWER_SPEC
+) -> Generator[CompactTower | dict[int, PicassoTowerFloor], None, None]:
+    """
+    Given a list of Hint objects, lazily yield the valid assignments that satisfy these hints,
+    up to limit assignments.
+    The assignments are yielded as towers of PicassoTowerFloor objects,
+    or as compact towers of color and animal indices when compact is set.
+    """
+    if limit is not None and limit <= 0:
+        return
+    specific_hints = compile_specific_hints(get_specific_hints(hints, spec), spec)
+    tower = spec.new_partial_tower()
+    try:
+        insert_hints(tower, list(specific_hints))
+    except ContradictingHintsError:
+        return
+
+    specific_hints = plan_hints(specific_hints, spec.floors_amount)
+    yielded_amount = 0
     for floors_combination in generate_all_floor_combinations(tower=tower):
         for specific_hint in specific_hints:
             if not specific_hint.validate(floors_combination):
                 break
         else:
-            counter += 1
-    return counter
+            yield floors_combination if compact else decode_tower(floors_combination, spec)
+            yielded_amount += 1
+            if yielded_amount == limit:
+                return
@@ -0,0 +1,82 @@
+from picasso._stats import CountStats
+from picasso.hints import SpecificHint
+from picasso.hints_utils import ContradictingHintsError, get_floors_mask
+from picasso.tower import EMPTY, Domains, PartialTower
+
+
+def new_domains(tower: PartialTower) -> Domains:
+    """
+    Create the domains of a partial tower, known items are on their floors and the rest are on any empty floor.
+    """
+    domains = []
+    for row_index, floor_items in enumerate(tower):
+        empty_floors_mask = get_floors_mask([floor for floor, item in enumerate(floor_items) if item == EMPTY])
+        row_domains = [empty_floors_mask] * len(floor_items)
+        for floor, item in enumerate(floor_items):
+            if item != EMPTY:
+                if row_domains[item] != empty_floors_mask:
+                    raise ContradictingHintsError(f"Item {item} of row {row_index} is on two floors")
+                row_domains[item] = 1 << floor
+        domains.append(row_domains)
+    return domains[0], domains[1]
+
+
+def prune_all_different(row_domains: list[int], row_index: int, full_mask: int) -> bool:
+    """
+    Remove floors by the rule that every item of a row is on a different floor, return whether a domain changed.
+    When k items can only be on the same k floors (a Hall set), the other items can not be on those floors,
+    and when a floor can hold only one item, the item must be on that floor.
+    """
+    is_changed = False
+    for domain in set(row_domains):
+        contained_items = [item for item, item_domain in enumerate(row_domains) if not item_domain & ~domain]
+        if len(contained_items) < domain.bit_count():
+            continue
+        if len(contained_items) > domain.bit_count():
+            raise ContradictingHintsError(f"{len(contained_items)} items of row {row_index} share fewer floors")
+        for item, item_domain in enumerate(row_domains):
+            if item_domain & domain and item_domain & ~domain and item not in contained_items:
+                row_domains[item] = item_domain & ~domain
+                is_changed = True
+
+    covered_floors = covered_twice_floors = 0
+    for domain in row_domains:
+        covered_twice_floors |= covered_floors & domain
+        covered_floors |= domain
+    if covered_floors != full_mask:
+        raise ContradictingHintsError(f"Some floors of row {row_index} are left without an item")
+    single_item_floors = covered_floors & ~covered_twice_floors
+    if single_item_floors:
+        for item, domain in enumerate(row_domains):
+            single_item_domain = domain & single_item_floors
+            if single_item_domain and domain != single_item_domain:
+                if single_item_domain & (single_item_domain - 1):
+                    raise ContradictingHintsError(f"Item {item} of row {row_index} is the only item of two floors")
+                row_domains[item] = single_item_domain
+                is_changed = True
+    return is_changed
+
+
+def propagate_domains(tower: PartialTower, hints: list[SpecificHint], stats: CountStats | None = None) -> Domains:
+    """
+    Prune the domains of the tower by the hints and by the all different rule of every row until nothing changes,
+    and insert every item that is left with a single floor to the tower.
+    Raise ContradictingHintsError when an item or a floor is left without options.
+    """
+    full_mask = (1 << len(tower[0])) - 1
+    domains = new_domains(tower)
+    is_changed = True
+    while is_changed:
+        if stats is not None:
+            stats.fixed_point_iterations += 1
+        is_changed = False
+        for hint in hints:
+            is_changed |= hint.prune(domains, full_mask)
+        for row_index, row_domains in enumerate(domains):
+            is_changed |= prune_all_different(row_domains, row_index, full_mask)
+
+    for floor_items, row_domains in zip(tower, domains):
+        for item, domain in enumerate(row_domains):
+            if domain.bit_count() == 1:
+                floor_items[domain.bit_length() - 1] = item
+    return domains
@@ -0,0 +1,115 @@
+from enum import Enum
+from functools import lru_cache
+from math import factorial
+from random import Random
+from typing import NamedTuple
+
+from picasso._index import MAX_BITSETS_FLOORS, get_bitset, get_bitsets_cache
+from picasso._redundancy import get_needed_indices
+from picasso.hints import AbsoluteHint, Hint, NeighborHint, RelativeHint
+from picasso.models import Difficulty, Floor, HintAttribute, PicassoTowerFloor
+from picasso.tower import DEFAULT_TOWER_SPEC, CompactTower, TowerSpec, decode_tower
+
+# The candidate towers of a puzzle are kept as a bitset over all the assignments.
+MAX_PUZZLE_FLOORS = MAX_BITSETS_FLOORS
+
+
+class Puzzle(NamedTuple):
+    hints: list[Hint]
+    solution: dict[int, PicassoTowerFloor]
+    spec: TowerSpec
+
+
+@lru_cache
+def get_size_spec(size: int) -> TowerSpec:
+    """
+    Get the tower of a size, the default tower for five floors and towers of numbered colors and animals otherwise.
+    """
+    if size == DEFAULT_TOWER_SPEC.floors_amount:
+        return DEFAULT_TOWER_SPEC
+    colors = Enum(f"Colors{size}", [f"Color{number}" for number in range(1, size + 1)])  # type: ignore[misc]
+    animals = Enum(f"Animals{size}", [f"Animal{number}" for number in range(1, size + 1)])  # type: ignore[misc]
+    return TowerSpec(colors, animals)
+
+
+def get_floor(floor: int) -> HintAttribute:
+    """
+    Get the hint attribute of a floor number, floors above the fifth are plain ints.
+    """
+    return Floor(floor) if floor <= Floor.Fifth else floor
+
+
+def get_true_hints(solution: CompactTower, difficulty: Difficulty, spec: TowerSpec) -> list[Hint]:
+    """
+    Get the hints the solution satisfies out of the hints of the difficulty:
+    hard puzzles only relate colors and animals to each other, medium puzzles also have absolute hints
+    of a color and an animal and neighbor hints of floors, and easy puzzles also have absolute hints of floors.
+    """
+    colors, animals = solution
+    items: list[tuple[HintAttribute, int]] = [
+        *((spec.colors[color], floor) for floor, color in enumerate(colors, start=1)),
+        *((spec.animals[animal], floor) for floor, animal in enumerate(animals, start=1)),
+    ]
+    hints: list[Hint] = []
+    for item_index, (attr1, floor1) in enumerate(items, start=1):
+        if difficulty == Difficulty.Easy:
+            hints.append(AbsoluteHint(attr1, get_floor(floor1)))
+        if difficulty != Difficulty.Hard:
+            hints.extend(
+                NeighborHint(attr1, get_floor(floor))
+                for floor in (floor1 - 1, floor1 + 1)
+                if 1 <= floor <= spec.floors_amount
+            )
+        for attr2, floor2 in items[item_index:]:
+            if floor1 == floor2:
+                if difficulty != Difficulty.Hard:
+                    hints.append(AbsoluteHint(attr1, attr2))
+                continue
+            hints.append(RelativeHint(attr1, attr2, floor1 - floor2))
+            if abs(floor1 - floor2) == 1:
+                hints.append(NeighborHint(attr1, attr2))
+    return hints
+
+
+def generate_puzzle(seed: int, size: int = 5, difficulty: Difficulty = Difficulty.Medium) -> Puzzle:
+    """
+    Generate a puzzle of a random solution tower of size floors: a set of hints the solution satisfies,
+    that no other tower satisfies and that has no hint the others already imply.
+    The same seed, size and difficulty always generate the same puzzle.
+    The towers that satisfy the hints are kept as a bitset over all the assignments, every added hint filters them
+    with a single AND and the uniqueness is checked without counting the assignments again.
+    Raise ValueError for sizes above MAX_PUZZLE_FLOORS.
+    """
+    if not 1 <= size <= MAX_PUZZLE_FLOORS:
+        raise ValueError(f"Got size {size}, must be 1 to {MAX_PUZZLE_FLOORS}")
+    spec = get_size_spec(size)
+    facts_bitsets, _ = get_bitsets_cache(spec)
+    rng = Random(seed)
+    colors = list(range(size))
+    animals = list(range(size))
+    rng.shuffle(colors)
+    rng.shuffle(animals)
+    solution: CompactTower = (tuple(colors), tuple(animals))
+
+    all_assignments = (1 << factorial(size) ** 2) - 1
+    solution_bitset = all_assignments
+    for row_index, floor_items in enumerate(solution):
+        for floor, item in enumerate(floor_items):
+            solution_bitset &= facts_bitsets[(row_index, item, floor)]
+
+    candidates = get_true_hints(solution, difficulty, spec)
+    rng.shuffle(candidates)
+    hints: list[Hint] = []
+    bitsets: list[int] = []
+    survivors = all_assignments
+    for hint in candidates:
+        if survivors == solution_bitset:
+            break
+        bitset = get_bitset(hint, spec)
+        if survivors & bitset != survivors:
+            survivors &= bitset
+            hints.append(hint)
+            bitsets.append(bitset)
+
+    hints = [hints[hint_index] for hint_index in get_needed_indices(bitsets, all_assignments, survivors)]
+    return Puzzle(hints, decode_tower(solution, spec), spec)
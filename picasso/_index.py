@@ -0,0 +1,318 @@
+import hashlib
+import json
+import os
+from functools import lru_cache
+from math import factorial
+from mmap import ACCESS_READ, mmap
+from pathlib import Path
+from typing import Any, Sequence
+
+from picasso._compile import CompiledHint, check_compiled_hint, compile_specific_hints
+from picasso._count_assignments import generate_all_floor_combinations
+from picasso.hints import AbsoluteHint, Hint, HintKey, NeighborHint, RelativeHint, SpecificHint, get_specific_hints
+from picasso.models import HintAttribute
+from picasso.tower import DEFAULT_TOWER_SPEC, TowerSpec
+
+# Bump when the layout of the index file or the order of the assignments changes, older index files are rebuilt.
+INDEX_VERSION = 1
+# The index holds a bit for every assignment, a five floors tower has 14,400 of them.
+MAX_INDEX_ASSIGNMENTS = factorial(5) ** 2
+# The index file starts with this magic and the length of its JSON header, followed by the header and the bitsets.
+INDEX_MAGIC = b"PICASSO-INDEX\n"
+HEADER_LENGTH_SIZE = 4
+# The in memory bitsets of get_bitsets_cache are built by going over all the assignments once,
+# a six floors tower has 518,400 of them.
+MAX_BITSETS_FLOORS = 6
+
+# The bitset of a fact: the item of the row is on the floor.
+FactKey = tuple[int, int, int]
+
+
+def get_spec_fingerprint(spec: TowerSpec = DEFAULT_TOWER_SPEC) -> str:
+    """
+    Get a fingerprint of the index version and the color and animal enums of the tower,
+    an index is rebuilt when any of them changes.
+    """
+    enums = [[(member.name, str(member.value)) for member in enum_type] for enum_type in (spec.colors, spec.animals)]
+    return hashlib.sha256(json.dumps([INDEX_VERSION, enums]).encode()).hexdigest()
+
+
+def get_default_index_path(spec: TowerSpec = DEFAULT_TOWER_SPEC) -> Path:
+    """
+    Get the path of the index of the tower in the user cache directory, every fingerprint has its own file.
+    """
+    cache_directory = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "picasso"
+    return cache_directory / f"hints_index_{get_spec_fingerprint(spec)[:16]}.bin"
+
+
+def get_atomic_hints(spec: TowerSpec = DEFAULT_TOWER_SPEC) -> list[CompiledHint]:
+    """
+    Get every distinct specific hint of the tower: the absolute, relative and neighbor hints
+    of every two attributes and every floor difference, without the hints that have the same key.
+    """
+    attributes: list[HintAttribute] = [*range(1, spec.floors_amount + 1), *spec.colors, *spec.animals]
+    hints: list[Hint] = []
+    for attr1 in attributes:
+        for attr2 in attributes:
+            hints.append(AbsoluteHint(attr1, attr2))
+            hints.append(NeighborHint(attr1, attr2))
+            hints.extend(
+                RelativeHint(attr1, attr2, difference)
+                for difference in range(-spec.floors_amount, spec.floors_amount + 1)
+            )
+
+    atomic_hints: dict[HintKey, CompiledHint] = {}
+    for hint in hints:
+        try:
+            (specific_hint,) = get_specific_hints([hint], spec)
+        except ValueError:
+            continue
+        atomic_hints.setdefault(specific_hint.get_key(), CompiledHint(specific_hint, spec))
+    return list(atomic_hints.values())
+
+
+def get_facts_bitsets(spec: TowerSpec = DEFAULT_TOWER_SPEC) -> dict[FactKey, int]:
+    """
+    Get the bitset of the assignments of every (row, item, floor) fact, the assignments are numbered
+    in the order of generate_all_floor_combinations.
+    """
+    bitset_size = (factorial(spec.floors_amount) ** 2 + 7) // 8
+    facts_bits = {
+        (row_index, item, floor): bytearray(bitset_size)
+        for row_index in range(2)
+        for item in range(spec.floors_amount)
+        for floor in range(spec.floors_amount)
+    }
+    for assignment_index, assignment in enumerate(generate_all_floor_combinations(spec.new_partial_tower())):
+        byte_index, bit = divmod(assignment_index, 8)
+        for row_index, floor_items in enumerate(assignment):
+            for floor, item in enumerate(floor_items):
+                facts_bits[(row_index, item, floor)][byte_index] |= 1 << bit
+    return {fact: int.from_bytes(bits, "little") for fact, bits in facts_bits.items()}
+
+
+def get_hint_bitset(hint: CompiledHint, facts_bitsets: dict[FactKey, int]) -> int:
+    """
+    Get the bitset of the assignments the hint allows, from the bitsets of the floors it allows.
+    """
+    bitset = 0
+    if hint.second_row is None or hint.second_item is None:
+        for floor in hint.allowed_floors:
+            bitset |= facts_bitsets[(hint.first_row, hint.first_item, floor)]
+        return bitset
+    for first_floor, second_floor in hint.allowed_pairs:
+        bitset |= (
+            facts_bitsets[(hint.first_row, hint.first_item, first_floor)]
+            & facts_bitsets[(hint.second_row, hint.second_item, second_floor)]
+        )
+    return bitset
+
+
+@lru_cache
+def get_bitsets_cache(spec: TowerSpec) -> tuple[dict[FactKey, int], dict[HintKey, int]]:
+    """
+    Get the bitsets of the (row, item, floor) facts of the tower, and a cache of the bitsets of the hints keys.
+    Raise ValueError for towers above MAX_BITSETS_FLOORS floors.
+    """
+    if spec.floors_amount > MAX_BITSETS_FLOORS:
+        raise ValueError(f"Bitsets support towers of up to {MAX_BITSETS_FLOORS} floors, got {spec.floors_amount}")
+    return get_facts_bitsets(spec), {}
+
+
+def get_bitset(hint: Hint, spec: TowerSpec) -> int:
+    """
+    Get the bitset of the assignments of the tower the hint allows.
+    """
+    facts_bitsets, hints_bitsets = get_bitsets_cache(spec)
+    (specific_hint,) = get_specific_hints([hint], spec)
+    check_compiled_hint(specific_hint, spec)
+    key = specific_hint.get_key()
+    if key not in hints_bitsets:
+        hints_bitsets[key] = get_hint_bitset(CompiledHint(specific_hint, spec), facts_bitsets)
+    return hints_bitsets[key]
+
+
+def check_index_spec(spec: TowerSpec) -> None:
+    """
+    Raise ValueError for towers with too many assignments to index.
+    """
+    if factorial(spec.floors_amount) ** 2 > MAX_INDEX_ASSIGNMENTS:
+        raise ValueError(f"The index supports towers of up to {MAX_INDEX_ASSIGNMENTS} assignments")
+
+
+def build_index(path: Path, spec: TowerSpec = DEFAULT_TOWER_SPEC) -> None:
+    """
+    Build the index file of the tower: a bitset over all the assignments for every atomic hint.
+    The file is written next to its path and moved over it, so readers never see a partial index.
+    """
+    check_index_spec(spec)
+    bitset_size = (factorial(spec.floors_amount) ** 2 + 7) // 8
+    facts_bitsets = get_facts_bitsets(spec)
+    atomic_hints = get_atomic_hints(spec)
+    header = json.dumps(
+        {
+            "version": INDEX_VERSION,
+            "fingerprint": get_spec_fingerprint(spec),
+            "bitset_size": bitset_size,
+            "keys": [hint.get_key() for hint in atomic_hints],
+        }
+    ).encode()
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(temporary_path, "wb") as index_file:
+        index_file.write(INDEX_MAGIC + len(header).to_bytes(HEADER_LENGTH_SIZE, "little") + header)
+        for hint in atomic_hints:
+            index_file.write(get_hint_bitset(hint, facts_bitsets).to_bytes(bitset_size, "little"))
+    os.replace(temporary_path, path)
+
+
+def to_hint_key(json_key: list[Any]) -> HintKey:
+    """
+    Get the hint key of its JSON form in the index header.
+    """
+    attributes, differences = json_key
+    return tuple((row_index, item) for row_index, item in attributes), tuple(differences)
+
+
+def read_header(index_mmap: mmap) -> dict[str, Any] | None:
+    """
+    Read the JSON header of a mapped index file and leave the position at its first bitset,
+    return None when the file is not an index of this index version.
+    """
+    if index_mmap.read(len(INDEX_MAGIC)) != INDEX_MAGIC:
+        return None
+    header_length = int.from_bytes(index_mmap.read(HEADER_LENGTH_SIZE), "little")
+    try:
+        header: dict[str, Any] = json.loads(index_mmap.read(header_length))
+    except ValueError:
+        return None
+    return header if isinstance(header, dict) and header.get("version") == INDEX_VERSION else None
+
+
+class HintsIndex(object):
+    """
+    A memory mapped index of the bitsets of the assignments every atomic hint allows, for towers of up to five floors.
+    Counting a hints set is an AND of the bitsets of its hints and a popcount.
+    The index is built once into a file and rebuilt when the file is missing or was built
+    for another index version or other color and animal enums.
+    For example:
+        index = HintsIndex(get_default_index_path())
+        index.count(get_specific_hints([AbsoluteHint(Animal.Frog, Floor.Fifth)]))
+    """
+
+    def __init__(self, path: Path, spec: TowerSpec = DEFAULT_TOWER_SPEC):
+        check_index_spec(spec)
+        self.path = path
+        self.spec = spec
+        self.assignments_amount = factorial(spec.floors_amount) ** 2
+        if not self._load():
+            build_index(path, spec)
+            if not self._load():
+                raise ValueError(f"Could not load the index at {path}")
+        self._facts_bitsets: dict[FactKey, int] | None = None
+
+    def _load(self) -> bool:
+        """
+        Map the index file, return whether it exists and was built for this index version and tower.
+        """
+        try:
+            with open(self.path, "rb") as index_file:
+                self._mmap = mmap(index_file.fileno(), 0, access=ACCESS_READ)
+        except (FileNotFoundError, ValueError):
+            return False
+        header = read_header(self._mmap)
+        if header is None or header["fingerprint"] != get_spec_fingerprint(self.spec):
+            self._mmap.close()
+            return False
+
+        self.bitset_size: int = header["bitset_size"]
+        bitsets_start = self._mmap.tell()
+        self._bitsets_ranges: dict[HintKey, tuple[int, int]] = {}
+        for key_index, json_key in enumerate(header["keys"]):
+            bitset_start = bitsets_start + key_index * self.bitset_size
+            self._bitsets_ranges[to_hint_key(json_key)] = bitset_start, bitset_start + self.bitset_size
+        return True
+
+    def close(self) -> None:
+        """
+        Unmap the index file.
+        """
+        self._mmap.close()
+
+    def get_bitset(self, hint: SpecificHint) -> int:
+        """
+        Get the bitset of the assignments the hint allows.
+        Hints that are not in the index, like relative hints with differences beyond the tower, are computed.
+        Raise ValueError for hints compiled for another tower.
+        """
+        check_compiled_hint(hint, self.spec)
+        bitset_range = self._bitsets_ranges.get(hint.get_key())
+        if bitset_range is not None:
+            bitset_start, bitset_end = bitset_range
+            return int.from_bytes(self._mmap[bitset_start:bitset_end], "little")
+        if self._facts_bitsets is None:
+            self._facts_bitsets = get_facts_bitsets(self.spec)
+        (compiled_hint,) = compile_specific_hints([hint], self.spec)
+        return get_hint_bitset(compiled_hint, self._facts_bitsets)
+
+    def get_survivors(self, hints: Sequence[SpecificHint]) -> int:
+        """
+        Get the bitset of the assignments that satisfy all the hints.
+        """
+        bitset = (1 << self.assignments_amount) - 1
+        for hint in hints:
+            bitset &= self.get_bitset(hint)
+            if not bitset:
+                return 0
+        return bitset
+
+    def count(self, hints: Sequence[SpecificHint]) -> int:
+        """
+        Count the assignments that satisfy all the hints.
+        """
+        return self.get_survivors(hints).bit_count()
+
+    def get_marginals(self, hints: Sequence[SpecificHint]) -> tuple[int, list[list[list[int]]]]:
+        """
+        Count the assignments that satisfy all the hints, and the assignments that put every item of every row
+        on every floor, as tables[row index][floor][item]. A cell is the popcount of the survivors and the bitset
+        of the absolute hint of its item and floor.
+        """
+        survivors = self.get_survivors(hints)
+        floors_amount = self.spec.floors_amount
+        tables = []
+        for row_index in range(2):
+            table = [[0] * floors_amount for _ in range(floors_amount)]
+            if survivors:
+                for floor in range(floors_amount):
+                    for item in range(floors_amount):
+                        bitset_start, bitset_end = self._bitsets_ranges[(((row_index, item),), (floor,))]
+                        fact_bitset = int.from_bytes(self._mmap[bitset_start:bitset_end], "little")
+                        table[floor][item] = (survivors & fact_bitset).bit_count()
+            tables.append(table)
+        return survivors.bit_count(), tables
+
+
+@lru_cache
+def get_index(spec: TowerSpec = DEFAULT_TOWER_SPEC) -> HintsIndex:
+    """
+    Get the index of the tower at its default path, loaded once per process.
+    """
+    return HintsIndex(get_default_index_path(spec), spec)
+
+
+def count_with_index(hints: Sequence[SpecificHint], spec: TowerSpec = DEFAULT_TOWER_SPEC) -> int:
+    """
+    Count the assignments with the index of the tower, the index is built on the first use.
+    """
+    return get_index(spec).count(hints)
+
+
+def marginals_with_index(
+    hints: Sequence[SpecificHint], spec: TowerSpec = DEFAULT_TOWER_SPEC
+) -> tuple[int, list[list[list[int]]]]:
+    """
+    Count the assignments and the assignments of every item on every floor with the index of the tower.
+    """
+    return get_index(spec).get_marginals(hints)
@@ -0,0 +1,53 @@
+from typing import NamedTuple
+
+from picasso._backtracking import count_marginals
+from picasso._compile import compile_specific_hints
+from picasso._domains import propagate_domains
+from picasso._planner import plan_hints
+from picasso.hints import Hint, get_specific_hints
+from picasso.hints_utils import ContradictingHintsError
+from picasso.models import CountingEngine
+from picasso.tower import DEFAULT_TOWER_SPEC, TowerSpec
+
+
+class Marginals(NamedTuple):
+    # colors[floor index][color index] and animals[floor index][animal index] are the amounts of assignments
+    # that put the color or the animal on the floor.
+    colors: list[list[int]]
+    animals: list[list[int]]
+    total: int
+
+
+def assignment_marginals(
+    hints: list[Hint], engine: CountingEngine = CountingEngine.Backtracking, spec: TowerSpec = DEFAULT_TOWER_SPEC
+) -> Marginals:
+    """
+    Count the assignments that satisfy the hints, and for every floor and every color and animal
+    the assignments that put it on the floor, in a single pass of the counting engine.
+    The backtracking engine adds every branch that places all the hinted items to the tables of its items,
+    the NumPy engine weights every valid permutation of a row by the permutations of the other row it can go with,
+    and the Index engine takes the popcount of the assignments that satisfy the hints on every floor.
+    Every color table row sums to the total, and so does every column.
+    """
+    specific_hints = get_specific_hints(hints, spec)
+    if engine == CountingEngine.Index:
+        from picasso._index import marginals_with_index
+
+        total, (colors, animals) = marginals_with_index(specific_hints, spec)
+        return Marginals(colors, animals, total)
+
+    specific_hints = list(plan_hints(compile_specific_hints(specific_hints, spec), spec.floors_amount))
+    tower = spec.new_partial_tower()
+    try:
+        domains = propagate_domains(tower, specific_hints)
+    except ContradictingHintsError:
+        empty_table = [[0] * spec.floors_amount for _ in range(spec.floors_amount)]
+        return Marginals(empty_table, [list(floor_cells) for floor_cells in empty_table], 0)
+
+    if engine == CountingEngine.NumPy:
+        from picasso._numpy_engine import marginals_with_masks
+
+        total, (colors, animals) = marginals_with_masks(specific_hints, spec.floors_amount, domains)
+    else:
+        total, (colors, animals) = count_marginals(tower, specific_hints, domains)
+    return Marginals(colors, animals, total)
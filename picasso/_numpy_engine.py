@@ -0,0 +1,177 @@
+from functools import lru_cache
+from itertools import permutations
+
+import numpy as np
+import numpy.typing as npt
+
+from picasso.hints import SpecificHint
+from picasso.tower import COLORS_ROW, Domains
+
+# The masks of mixed hints hold (floors amount!) ** 2 cells, too many for higher towers.
+MAX_FLOORS_AMOUNT = 7
+# The hints on a color and an animal are masked for this amount of colors permutations at a time,
+# so bounded counts stop without masking the rest of the permutations.
+COLORS_CHUNK_SIZE = 24
+
+FloorsArray = npt.NDArray[np.int8]
+Mask = npt.NDArray[np.bool_]
+
+
+@lru_cache
+def get_permutations_floors(items_amount: int) -> FloorsArray:
+    """
+    Get the floor index of every item in every permutation of the items,
+    an array of shape (permutations amount, items amount).
+    """
+    items_by_floor = np.array(list(permutations(range(items_amount))), dtype=np.int8)
+    return np.argsort(items_by_floor, axis=1).astype(np.int8)
+
+
+def is_difference_allowed(differences: FloorsArray, allowed_differences: tuple[int, ...]) -> Mask:
+    """
+    Get a mask of the floor differences that are one of the allowed differences.
+    """
+    mask: Mask = differences == allowed_differences[0]
+    for allowed_difference in allowed_differences[1:]:
+        mask |= differences == allowed_difference
+    return mask
+
+
+def get_hint_mask(hint: SpecificHint, colors_floors: FloorsArray, animals_floors: FloorsArray) -> Mask:
+    """
+    Compile the hint to a boolean mask over the given permutations of the rows it depends on.
+    Hints on one row (only colors or only animals) get a mask over the permutations of that row,
+    hints on a color and an animal get a mask over (colors permutation, animals permutation).
+    """
+    rows_floors = (colors_floors, animals_floors)
+    (first_row, first_item), *other_attributes = hint.attributes
+    first_floors = rows_floors[first_row][:, first_item]
+    if not other_attributes:
+        return is_difference_allowed(first_floors - hint.base_floor, hint.differences)
+
+    second_row, second_item = other_attributes[0]
+    second_floors = rows_floors[second_row][:, second_item]
+    if first_row == second_row:
+        return is_difference_allowed(first_floors - second_floors, hint.differences)
+    if first_row == COLORS_ROW:
+        return is_difference_allowed(first_floors[:, np.newaxis] - second_floors[np.newaxis, :], hint.differences)
+    return is_difference_allowed(first_floors[np.newaxis, :] - second_floors[:, np.newaxis], hint.differences)
+
+
+@lru_cache
+def get_permutations_floors_bits(items_amount: int) -> npt.NDArray[np.int64]:
+    """
+    Get the bit of the floor of every item in every permutation of the items, to match against domains.
+    """
+    floors_bits: npt.NDArray[np.int64] = np.left_shift(1, get_permutations_floors(items_amount), dtype=np.int64)
+    return floors_bits
+
+
+def get_domains_mask(row_domains: list[int], floors_bits: npt.NDArray[np.int64]) -> Mask:
+    """
+    Get a mask of the permutations of a row that put every item on a floor of its domain.
+    """
+    mask: Mask = (floors_bits & np.array(row_domains, dtype=np.int64) != 0).all(axis=1)
+    return mask
+
+
+def get_valid_permutations(
+    hints: list[SpecificHint], floors: FloorsArray, domains: Domains | None = None
+) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp], list[SpecificHint]]:
+    """
+    Get the colors permutations and the animals permutations that satisfy the hints on one row
+    and put every item on a floor of its domain when the domains are given, and the hints on a color and an animal.
+    The domains already hold the floors of the hints on a single item, so these hints are not masked again.
+    """
+    items_amount = floors.shape[1]
+    full_domain = (1 << items_amount) - 1
+    rows_masks = [
+        (
+            get_domains_mask(domains[row_index], get_permutations_floors_bits(items_amount))
+            if domains is not None and any(domain != full_domain for domain in domains[row_index])
+            else np.ones(len(floors), dtype=np.bool_)
+        )
+        for row_index in range(2)
+    ]
+    mixed_hints = []
+    for hint in hints:
+        if len({row_index for row_index, _ in hint.attributes}) == 2:
+            mixed_hints.append(hint)
+        elif domains is None or len(hint.attributes) == 2:
+            rows_masks[hint.attributes[0][0]] &= get_hint_mask(hint, floors, floors)
+    return np.flatnonzero(rows_masks[0]), np.flatnonzero(rows_masks[1]), mixed_hints
+
+
+def get_mixed_mask(mixed_hints: list[SpecificHint], colors_floors: FloorsArray, animals_floors: FloorsArray) -> Mask:
+    """
+    Chain the masks of the hints on a color and an animal over (colors permutation, animals permutation).
+    """
+    mixed_mask: Mask = np.ones((len(colors_floors), len(animals_floors)), dtype=np.bool_)
+    for hint in mixed_hints:
+        mixed_mask &= get_hint_mask(hint, colors_floors, animals_floors)
+    return mixed_mask
+
+
+def check_items_amount(items_amount: int) -> None:
+    """
+    Raise ValueError for towers with too many floors for the masks.
+    """
+    if items_amount > MAX_FLOORS_AMOUNT:
+        raise ValueError(f"The NumPy engine supports towers of up to {MAX_FLOORS_AMOUNT} floors, got {items_amount}")
+
+
+def count_with_masks(
+    hints: list[SpecificHint], items_amount: int, at_most: int | None = None, domains: Domains | None = None
+) -> int:
+    """
+    Count the assignments by chaining the masks of all the hints, up to at_most assignments.
+    Only the permutations that put every item on a floor of its domain are masked when the domains are given.
+    With at_most, the hints on a color and an animal are masked for a chunk of the colors permutations at a time,
+    and the counting stops at the chunk that reaches at_most assignments.
+    """
+    check_items_amount(items_amount)
+    floors = get_permutations_floors(items_amount)
+    colors_permutations, animals_permutations, mixed_hints = get_valid_permutations(hints, floors, domains)
+    if not mixed_hints:
+        assignments_amount = len(colors_permutations) * len(animals_permutations)
+        return assignments_amount if at_most is None else min(assignments_amount, at_most)
+
+    animals_floors = floors[animals_permutations]
+    if at_most is None:
+        return int(np.count_nonzero(get_mixed_mask(mixed_hints, floors[colors_permutations], animals_floors)))
+
+    counter = 0
+    for chunk_start in range(0, len(colors_permutations), COLORS_CHUNK_SIZE):
+        chunk_end = chunk_start + COLORS_CHUNK_SIZE
+        colors_floors = floors[colors_permutations[chunk_start:chunk_end]]
+        counter += int(np.count_nonzero(get_mixed_mask(mixed_hints, colors_floors, animals_floors)))
+        if counter >= at_most:
+            return at_most
+    return counter
+
+
+def marginals_with_masks(
+    hints: list[SpecificHint], items_amount: int, domains: Domains | None = None
+) -> tuple[int, list[list[list[int]]]]:
+    """
+    Count the assignments and the assignments that put every item of every row on every floor,
+    as tables[row index][floor][item]. Every valid permutation of a row is weighted by the amount of valid
+    permutations of the other row it can be combined with.
+    """
+    check_items_amount(items_amount)
+    floors = get_permutations_floors(items_amount)
+    colors_permutations, animals_permutations, mixed_hints = get_valid_permutations(hints, floors, domains)
+    valid_mask = get_mixed_mask(mixed_hints, floors[colors_permutations], floors[animals_permutations])
+    colors_weights = valid_mask.sum(axis=1, dtype=np.int64)
+    animals_weights = valid_mask.sum(axis=0, dtype=np.int64)
+
+    tables = []
+    for permutations_indices, weights in (
+        (colors_permutations, colors_weights),
+        (animals_permutations, animals_weights),
+    ):
+        table = np.zeros((items_amount, items_amount), dtype=np.int64)
+        for item in range(items_amount):
+            table[:, item] = np.bincount(floors[permutations_indices, item], weights=weights, minlength=items_amount)
+        tables.append(table.tolist())
+    return int(colors_weights.sum()), tables
@@ -0,0 +1,52 @@
+from typing import Sequence
+
+from picasso._compile import CompiledHint
+
+# The relative cost of validating a compiled hint, every attribute of the hint is looked up in its row.
+VALIDATE_COST_PER_ATTRIBUTE = 1
+
+
+def get_acceptance_rate(hint: CompiledHint, floors_amount: int) -> float:
+    """
+    Estimate the fraction of the assignments the hint accepts.
+    In a random assignment every item is on every floor with the same chance,
+    and two items of the same row are never on the same floor.
+    """
+    if hint.second_row is None:
+        return len(hint.allowed_floors) / floors_amount
+    if hint.first_row != hint.second_row:
+        return len(hint.allowed_pairs) / floors_amount**2
+    if hint.first_item == hint.second_item:
+        return 1.0
+    different_floors_pairs = [(first, second) for first, second in hint.allowed_pairs if first != second]
+    return len(different_floors_pairs) / (floors_amount * (floors_amount - 1))
+
+
+def get_validate_cost(hint: CompiledHint) -> int:
+    """
+    Estimate the relative cost of validating the hint.
+    """
+    return VALIDATE_COST_PER_ATTRIBUTE * len(hint.attributes)
+
+
+def get_check_rank(cost: float, rejection_rate: float) -> float:
+    """
+    Rank a check for a chain of checks that stops at the first rejection, lower ranks should run first.
+    Running the checks by their cost divided by their rejection rate gives the lowest expected cost.
+    """
+    if rejection_rate <= 0:
+        return float("inf")
+    return cost / rejection_rate
+
+
+def plan_hints(hints: Sequence[CompiledHint], floors_amount: int) -> tuple[CompiledHint, ...]:
+    """
+    Order the hints so the cheapest and most rejecting hints are validated first.
+    The order is estimated from the precomputed floors of the hints, without validating any assignment.
+    """
+    return tuple(
+        sorted(
+            hints,
+            key=lambda hint: get_check_rank(get_validate_cost(hint), 1 - get_acceptance_rate(hint, floors_amount)),
+        )
+    )
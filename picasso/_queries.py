@@ -0,0 +1,75 @@
+import ast
+from math import factorial
+
+from picasso._index import get_bitset
+from picasso.hints import Hint
+from picasso.tower import DEFAULT_TOWER_SPEC, TowerSpec
+
+# The operators of the queries: A & B, A | B, A ^ B, A - B (A but not B) and ~A, or and, or and not.
+QUERY_OPERATORS = "&, |, ^, -, ~, and, or, not"
+
+
+def parse_query(query: str) -> ast.expr:
+    """
+    Parse a boolean expression over names of hint sets.
+    Raise ValueError for queries that are not valid expressions.
+    """
+    try:
+        return ast.parse(query, mode="eval").body
+    except SyntaxError:
+        raise ValueError(f"Got bad query {query!r}, must be an expression of hint set names and {QUERY_OPERATORS}")
+
+
+def evaluate_query(node: ast.expr, hint_sets_bitsets: dict[str, int], all_assignments: int) -> int:
+    """
+    Get the bitset of the assignments a parsed query selects from the bitsets of the hint sets.
+    Raise ValueError for unknown hint set names and unsupported operators.
+    """
+    if isinstance(node, ast.Name):
+        if node.id not in hint_sets_bitsets:
+            raise ValueError(f"Got unknown hint set {node.id}, can only be one of {list(hint_sets_bitsets)}")
+        return hint_sets_bitsets[node.id]
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.Invert, ast.Not)):
+        return all_assignments & ~evaluate_query(node.operand, hint_sets_bitsets, all_assignments)
+    if isinstance(node, ast.BinOp):
+        left = evaluate_query(node.left, hint_sets_bitsets, all_assignments)
+        right = evaluate_query(node.right, hint_sets_bitsets, all_assignments)
+        if isinstance(node.op, ast.BitAnd):
+            return left & right
+        if isinstance(node.op, ast.BitOr):
+            return left | right
+        if isinstance(node.op, ast.BitXor):
+            return left ^ right
+        if isinstance(node.op, ast.Sub):
+            return left & ~right
+    if isinstance(node, ast.BoolOp):
+        bitsets = [evaluate_query(value, hint_sets_bitsets, all_assignments) for value in node.values]
+        bitset = bitsets[0]
+        for other_bitset in bitsets[1:]:
+            bitset = bitset & other_bitset if isinstance(node.op, ast.And) else bitset | other_bitset
+        return bitset
+    raise ValueError(f"Got unsupported query part {ast.unparse(node)!r}, can only use {QUERY_OPERATORS}")
+
+
+def count_queries(
+    hint_sets: dict[str, list[Hint]], queries: list[str], spec: TowerSpec = DEFAULT_TOWER_SPEC
+) -> dict[str, int]:
+    """
+    Count the assignments every query selects, the queries are boolean expressions over the names of the hint sets,
+    like "A | B" for the assignments that satisfy A or B and "A - B" for the ones that satisfy A but not B.
+    The assignments are gone over once to get the bitsets of their floors, every distinct hint is evaluated once
+    into a bitset of the assignments it allows, and every query is counted with bitwise operations and a popcount.
+    Raise ValueError for bad queries and for towers above six floors.
+    """
+    parsed_queries = {query: parse_query(query) for query in queries}
+    all_assignments = (1 << factorial(spec.floors_amount) ** 2) - 1
+    hint_sets_bitsets = {}
+    for name, hints in hint_sets.items():
+        bitset = all_assignments
+        for hint in hints:
+            bitset &= get_bitset(hint, spec)
+        hint_sets_bitsets[name] = bitset
+    return {
+        query: evaluate_query(parsed_query, hint_sets_bitsets, all_assignments).bit_count()
+        for query, parsed_query in parsed_queries.items()
+    }
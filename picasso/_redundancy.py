@@ -0,0 +1,68 @@
+from math import factorial
+
+from picasso._index import get_bitset
+from picasso.hints import Hint
+from picasso.tower import DEFAULT_TOWER_SPEC, TowerSpec
+
+
+def get_hints_bitsets(hints: list[Hint], spec: TowerSpec = DEFAULT_TOWER_SPEC) -> tuple[list[int], int, int]:
+    """
+    Get the bitset of the assignments every hint allows, the bitset of all the assignments,
+    and the survivors bitset of the assignments all the hints allow.
+    """
+    all_assignments = (1 << factorial(spec.floors_amount) ** 2) - 1
+    bitsets = [get_bitset(hint, spec) for hint in hints]
+    survivors = all_assignments
+    for bitset in bitsets:
+        survivors &= bitset
+    return bitsets, all_assignments, survivors
+
+
+def get_needed_indices(bitsets: list[int], all_assignments: int, survivors: int) -> list[int]:
+    """
+    Get the indices, in order, of a subset of the bitsets whose AND is still the survivors and that has
+    no bitset the others already imply. The bitsets are dropped one at a time from the last, while the rest
+    still have the same survivors. The bitsets before a bitset are all still kept when it is checked,
+    so their AND is taken from the prefix ANDs, and the bitsets after it that were kept are ANDed as the pass goes.
+    """
+    prefix_survivors = [all_assignments]
+    for bitset in bitsets:
+        prefix_survivors.append(prefix_survivors[-1] & bitset)
+
+    # A hint that is needed with some of the other hints is still needed once more of them are dropped,
+    # so a single pass leaves only hints that can not be dropped.
+    needed_indices = []
+    kept_survivors = all_assignments
+    for index in reversed(range(len(bitsets))):
+        if prefix_survivors[index] & kept_survivors != survivors:
+            needed_indices.append(index)
+            kept_survivors &= bitsets[index]
+    return needed_indices[::-1]
+
+
+def find_redundant_hints(hints: list[Hint], spec: TowerSpec = DEFAULT_TOWER_SPEC) -> list[Hint]:
+    """
+    Return the hints whose removal alone leaves the assignments that satisfy the hints unchanged.
+    A hint is needed only if some assignment is rejected by it and by no other hint, so the assignments
+    rejected by exactly one hint are collected once from the rejection bitsets of all the hints.
+    Hints that repeat each other are all redundant, since each of them can be removed on its own.
+    Raise ValueError for towers above six floors.
+    """
+    bitsets, all_assignments, _ = get_hints_bitsets(hints, spec)
+    rejected_once = rejected_twice = 0
+    for bitset in bitsets:
+        rejections = all_assignments & ~bitset
+        rejected_twice |= rejected_once & rejections
+        rejected_once |= rejections
+    rejected_only_once = rejected_once & ~rejected_twice
+    return [hint for hint, bitset in zip(hints, bitsets) if not rejected_only_once & ~bitset]
+
+
+def minimize_hints(hints: list[Hint], spec: TowerSpec = DEFAULT_TOWER_SPEC) -> list[Hint]:
+    """
+    Return a subset of the hints, in their order, that is satisfied by exactly the same assignments
+    and has no redundant hint, so it can be counted instead of the hints with fewer validations.
+    Raise ValueError for towers above six floors.
+    """
+    bitsets, all_assignments, survivors = get_hints_bitsets(hints, spec)
+    return [hints[hint_index] for hint_index in get_needed_indices(bitsets, all_assignments, survivors)]
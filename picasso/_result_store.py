@@ -0,0 +1,104 @@
+import json
+import os
+import sqlite3
+from functools import lru_cache
+from pathlib import Path
+
+from picasso._count_assignments import count_specific_assignments
+from picasso._symmetry import SymmetryKey, get_symmetric_canonical_key
+from picasso.hints import Hint, get_specific_hints
+from picasso.models import CountingEngine
+from picasso.tower import DEFAULT_TOWER_SPEC, TowerSpec
+
+# Writers from other processes wait up to this amount of seconds for the store to be unlocked.
+STORE_TIMEOUT = 30.0
+
+
+def get_default_store_path() -> Path:
+    """
+    Get the path of the result store in the user cache directory.
+    """
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "picasso" / "results.sqlite3"
+
+
+class ResultStore(object):
+    """
+    A persistent SQLite store of the counts of hint sets, keyed by the floors amount of the tower and the symmetric
+    canonical key of the hints, so a hint set is counted once for all the hint sets that only differ from it
+    by turning the tower upside down or by relabeling its colors and animals.
+    The store can be shared by many processes.
+    For example:
+        store = ResultStore(get_default_store_path())
+        store.count([AbsoluteHint(Animal.Frog, Floor.Fifth)])
+    """
+
+    def __init__(self, path: Path, spec: TowerSpec = DEFAULT_TOWER_SPEC):
+        self.path = path
+        self.spec = spec
+        self.hits = 0
+        self.misses = 0
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(path, timeout=STORE_TIMEOUT)
+        with self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS counts "
+                "(floors_amount INTEGER NOT NULL, hints TEXT NOT NULL, count INTEGER NOT NULL, "
+                "PRIMARY KEY (floors_amount, hints))"
+            )
+
+    def close(self) -> None:
+        """
+        Close the connection to the store.
+        """
+        self._connection.close()
+
+    def get(self, key: SymmetryKey) -> int | None:
+        """
+        Get the stored count of a symmetric canonical key, None when it was not counted yet.
+        """
+        row = self._connection.execute(
+            "SELECT count FROM counts WHERE floors_amount = ? AND hints = ?",
+            (self.spec.floors_amount, json.dumps(key)),
+        ).fetchone()
+        return None if row is None else int(row[0])
+
+    def put(self, key: SymmetryKey, count: int) -> None:
+        """
+        Store the count of a symmetric canonical key.
+        """
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO counts (floors_amount, hints, count) VALUES (?, ?, ?)",
+                (self.spec.floors_amount, json.dumps(key), count),
+            )
+
+    def count(
+        self, hints: list[Hint], engine: CountingEngine = CountingEngine.Backtracking, at_most: int | None = None
+    ) -> int:
+        """
+        Count the assignments of the hints up to at_most assignments, from the store when a symmetric hint set
+        was already counted. Counts that stopped at at_most are not stored, since they are not the full count.
+        """
+        if at_most is not None and at_most < 0:
+            raise ValueError(f"Got at_most {at_most}, must not be negative")
+        specific_hints = get_specific_hints(hints, self.spec)
+        key = get_symmetric_canonical_key(specific_hints, self.spec.floors_amount)
+        count = self.get(key)
+        if count is not None:
+            self.hits += 1
+            return count if at_most is None else min(count, at_most)
+
+        self.misses += 1
+        count = count_specific_assignments(specific_hints, engine, self.spec, at_most)
+        if at_most is None or count < at_most:
+            self.put(key, count)
+        return count
+
+
+@lru_cache
+def get_result_store(path: Path, spec: TowerSpec = DEFAULT_TOWER_SPEC) -> ResultStore:
+    """
+    Get the result store at the path, opened once per process.
+    """
+    return ResultStore(path, spec)
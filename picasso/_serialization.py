@@ -0,0 +1,137 @@
+from enum import Enum
+from typing import Any
+
+from picasso.hints import AbsoluteHint, Hint, NeighborHint, RelativeHint
+from picasso.models import AttributeType, HintAttribute
+from picasso.tower import DEFAULT_TOWER_SPEC, TowerSpec
+
+# A hint as plain ints: (hint kind, attr1 type, attr1 value, attr2 type, attr2 value, difference).
+# Floors are kept as their numbers and colors and animals as their index in the tower spec.
+SerializedHint = tuple[int, int, int, int, int, int]
+
+HINT_KINDS: tuple[type[Hint], ...] = (AbsoluteHint, RelativeHint, NeighborHint)
+HINT_KINDS_BY_NAME: dict[str, type[Hint]] = {hint_kind.__name__: hint_kind for hint_kind in HINT_KINDS}
+ATTRIBUTE_TYPES: tuple[AttributeType, ...] = (AttributeType.Floor, AttributeType.Color, AttributeType.Animal)
+
+
+def serialize_attribute(attribute: HintAttribute, spec: TowerSpec = DEFAULT_TOWER_SPEC) -> tuple[int, int]:
+    """
+    Get the (type, value) ints of a hint attribute.
+    """
+    if isinstance(attribute, spec.color_type):
+        return ATTRIBUTE_TYPES.index(AttributeType.Color), spec.color_index[attribute]
+    if isinstance(attribute, spec.animal_type):
+        return ATTRIBUTE_TYPES.index(AttributeType.Animal), spec.animal_index[attribute]
+    if isinstance(attribute, int):
+        return ATTRIBUTE_TYPES.index(AttributeType.Floor), int(attribute)
+    raise ValueError(f"Got bad hint attr class, can only be one of {int, spec.color_type, spec.animal_type}")
+
+
+def deserialize_attribute(attribute_type: int, value: int, spec: TowerSpec = DEFAULT_TOWER_SPEC) -> HintAttribute:
+    """
+    Get the hint attribute of serialized (type, value) ints.
+    """
+    if ATTRIBUTE_TYPES[attribute_type] == AttributeType.Color:
+        return spec.colors[value]
+    if ATTRIBUTE_TYPES[attribute_type] == AttributeType.Animal:
+        return spec.animals[value]
+    return value
+
+
+def serialize_hint(hint: Hint, spec: TowerSpec = DEFAULT_TOWER_SPEC) -> SerializedHint:
+    """
+    Get the plain ints form of a hint, cheap to send to other processes and to hash.
+    """
+    if not isinstance(hint, (AbsoluteHint, RelativeHint, NeighborHint)):
+        raise ValueError(f"Got bad hint class, can only be one of {HINT_KINDS}")
+    difference = hint.difference if isinstance(hint, RelativeHint) else 0
+    return (
+        HINT_KINDS.index(type(hint)),
+        *serialize_attribute(hint.attr1, spec),
+        *serialize_attribute(hint.attr2, spec),
+        difference,
+    )
+
+
+def deserialize_hint(serialized_hint: SerializedHint, spec: TowerSpec = DEFAULT_TOWER_SPEC) -> Hint:
+    """
+    Get the hint of its plain ints form.
+    """
+    hint_kind, attr1_type, attr1_value, attr2_type, attr2_value, difference = serialized_hint
+    attr1 = deserialize_attribute(attr1_type, attr1_value, spec)
+    attr2 = deserialize_attribute(attr2_type, attr2_value, spec)
+    if HINT_KINDS[hint_kind] == RelativeHint:
+        return RelativeHint(attr1, attr2, difference)
+    if HINT_KINDS[hint_kind] == AbsoluteHint:
+        return AbsoluteHint(attr1, attr2)
+    return NeighborHint(attr1, attr2)
+
+
+def serialize_hints(hints: list[Hint], spec: TowerSpec = DEFAULT_TOWER_SPEC) -> tuple[SerializedHint, ...]:
+    """
+    Get the plain ints form of a list of hints.
+    """
+    return tuple(serialize_hint(hint, spec) for hint in hints)
+
+
+def deserialize_hints(serialized_hints: tuple[SerializedHint, ...], spec: TowerSpec = DEFAULT_TOWER_SPEC) -> list[Hint]:
+    """
+    Get the list of hints of their plain ints form.
+    """
+    return [deserialize_hint(serialized_hint, spec) for serialized_hint in serialized_hints]
+
+
+def attribute_to_json(attribute: HintAttribute) -> int | str:
+    """
+    Get the JSON form of a hint attribute, floors are kept as their numbers and colors and animals as their names.
+    """
+    return attribute.name if isinstance(attribute, Enum) and not isinstance(attribute, int) else int(attribute)
+
+
+def attribute_from_json(attribute: Any, spec: TowerSpec = DEFAULT_TOWER_SPEC) -> HintAttribute:
+    """
+    Get the hint attribute of its JSON form.
+    """
+    if isinstance(attribute, int) and not isinstance(attribute, bool):
+        return attribute
+    if isinstance(attribute, str):
+        if attribute in spec.color_type.__members__:
+            return spec.color_type[attribute]
+        if attribute in spec.animal_type.__members__:
+            return spec.animal_type[attribute]
+    raise ValueError(f"Got bad hint attr {attribute!r}, can only be a floor number, a color name or an animal name")
+
+
+def hint_to_json(hint: Hint) -> dict[str, Any]:
+    """
+    Get the JSON form of a hint, for example {"kind": "RelativeHint", "attr1": "Red", "attr2": "Frog", "difference": 1}.
+    """
+    if not isinstance(hint, (AbsoluteHint, RelativeHint, NeighborHint)):
+        raise ValueError(f"Got bad hint class, can only be one of {HINT_KINDS}")
+    record: dict[str, Any] = {
+        "kind": type(hint).__name__,
+        "attr1": attribute_to_json(hint.attr1),
+        "attr2": attribute_to_json(hint.attr2),
+    }
+    if isinstance(hint, RelativeHint):
+        record["difference"] = hint.difference
+    return record
+
+
+def hint_from_json(record: Any, spec: TowerSpec = DEFAULT_TOWER_SPEC) -> Hint:
+    """
+    Get the hint of its JSON form, raise ValueError for records that are not hints.
+    """
+    if not isinstance(record, dict) or record.get("kind") not in HINT_KINDS_BY_NAME:
+        raise ValueError(f"Got bad hint {record!r}, must have a kind of {list(HINT_KINDS_BY_NAME)}")
+    attr1 = attribute_from_json(record.get("attr1"), spec)
+    attr2 = attribute_from_json(record.get("attr2"), spec)
+    hint_kind = HINT_KINDS_BY_NAME[record["kind"]]
+    if hint_kind == RelativeHint:
+        difference = record.get("difference")
+        if not isinstance(difference, int) or isinstance(difference, bool):
+            raise ValueError(f"Got bad relative hint difference {difference!r}, must be an int")
+        return RelativeHint(attr1, attr2, difference)
+    if hint_kind == AbsoluteHint:
+        return AbsoluteHint(attr1, attr2)
+    return NeighborHint(attr1, attr2)
@@ -0,0 +1,90 @@
+from math import factorial
+
+from picasso._compile import CompiledHint, compile_hints
+from picasso._count_assignments import generate_all_floor_combinations
+from picasso.hints import Hint
+from picasso.tower import DEFAULT_TOWER_SPEC, CompactTower, TowerSpec
+
+# The session keeps all the surviving assignments in memory, a six floors tower has 518,400 of them.
+MAX_SESSION_ASSIGNMENTS = factorial(6) ** 2
+
+
+class TowerSession(object):
+    """
+    Count the assignments of a hints set that changes one hint at a time.
+    The session keeps the assignments that survived every prefix of the added hints:
+    adding a hint only filters the current survivors, and removing a hint goes back to the survivors
+    from before it was added and filters them by the hints that were added after it.
+    For example:
+        session = TowerSession()
+        session.add(AbsoluteHint(Animal.Frog, Floor.Fifth))
+        session.push()
+        session.add(NeighborHint(Color.Red, Color.Green))
+        session.count()
+        session.pop()
+    """
+
+    def __init__(self, spec: TowerSpec = DEFAULT_TOWER_SPEC):
+        if factorial(spec.floors_amount) ** 2 > MAX_SESSION_ASSIGNMENTS:
+            raise ValueError(f"A session supports towers of up to {MAX_SESSION_ASSIGNMENTS} assignments")
+        self.spec = spec
+        self.hints: list[CompiledHint] = []
+        self._survivors: list[list[CompactTower]] = [list(generate_all_floor_combinations(spec.new_partial_tower()))]
+        self._checkpoints: list[int] = []
+
+    def count(self) -> int:
+        """
+        Return the number of valid assignments that satisfy the session hints.
+        """
+        return len(self._survivors[-1])
+
+    def add(self, hint: Hint) -> int:
+        """
+        Add a hint to the session and return the updated count.
+        """
+        compiled_hint = compile_hints([hint], self.spec)[0]
+        self.hints.append(compiled_hint)
+        self._survivors.append([tower for tower in self._survivors[-1] if compiled_hint.validate(tower)])
+        return self.count()
+
+    def remove(self, hint: Hint) -> int:
+        """
+        Remove the last added hint that is equal to the given hint and return the updated count.
+        """
+        compiled_hint = compile_hints([hint], self.spec)[0]
+        if compiled_hint not in self.hints:
+            raise ValueError("Hint is not in the session")
+        hint_index = len(self.hints) - 1 - self.hints[::-1].index(compiled_hint)
+
+        next_hint_index = hint_index + 1
+        hints_after = self.hints[next_hint_index:]
+        self._rollback(hint_index)
+        for hint_after in hints_after:
+            self.add(hint_after)
+        self._checkpoints = [
+            checkpoint - 1 if checkpoint > hint_index else checkpoint for checkpoint in self._checkpoints
+        ]
+        return self.count()
+
+    def push(self) -> None:
+        """
+        Save a checkpoint of the current hints.
+        """
+        self._checkpoints.append(len(self.hints))
+
+    def pop(self) -> int:
+        """
+        Go back to the last saved checkpoint, removing the hints that were added after it, and return the count.
+        """
+        if not self._checkpoints:
+            raise IndexError("pop from a session without checkpoints")
+        self._rollback(self._checkpoints.pop())
+        return self.count()
+
+    def _rollback(self, hints_amount: int) -> None:
+        """
+        Go back to the survivors of the first hints.
+        """
+        del self.hints[hints_amount:]
+        survivors_amount = hints_amount + 1
+        del self._survivors[survivors_amount:]
@@ -0,0 +1,112 @@
+from contextlib import contextmanager, nullcontext
+from time import perf_counter
+from typing import ContextManager, Iterator, Sequence
+
+from picasso.hints import SpecificHint
+from picasso.tower import CompactTower, Domains, PartialTower
+
+
+class HintStats(object):
+    """
+    The work a single hint did while counting.
+    """
+
+    def __init__(self, hint: SpecificHint):
+        self.hint = hint
+        self.floors_pruned = 0
+        self.validate_calls = 0
+        self.rejections = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}({self.hint!r}, floors_pruned={self.floors_pruned}, "
+            f"validate_calls={self.validate_calls}, rejections={self.rejections})"
+        )
+
+
+class InstrumentedHint(SpecificHint):
+    """
+    A specific hint that counts the floors it prunes from the domains and the calls and rejections of its validate.
+    """
+
+    __slots__ = ("hint", "attributes", "differences", "base_floor", "stats")
+
+    def __init__(self, hint: SpecificHint, stats: HintStats):
+        self.hint = hint
+        self.attributes = hint.attributes
+        self.differences = hint.differences
+        self.base_floor = hint.base_floor
+        self.stats = stats
+
+    def validate(self, tower: CompactTower | PartialTower) -> bool:
+        self.stats.validate_calls += 1
+        is_valid = self.hint.validate(tower)
+        if not is_valid:
+            self.stats.rejections += 1
+        return is_valid
+
+    def insert(self, tower: PartialTower) -> None:
+        self.hint.insert(tower)
+
+    def prune(self, domains: Domains, full_mask: int) -> bool:
+        floors_amount = sum(domains[row_index][item].bit_count() for row_index, item in self.attributes)
+        try:
+            return self.hint.prune(domains, full_mask)
+        finally:
+            self.stats.floors_pruned += floors_amount - sum(
+                domains[row_index][item].bit_count() for row_index, item in self.attributes
+            )
+
+
+class CountStats(object):
+    """
+    Statistics of counting the assignments of a hints set, collected when passed to count_assignments.
+    For example:
+        stats = CountStats()
+        count_assignments(hints, stats=stats)
+        stats.fixed_point_iterations, stats.candidates, stats.stage_times, stats.hints_stats
+    The fixed point iterations are the rounds of the domains propagation, the candidates are the floors the backtracking
+    solver tried for the hints attributes, and the stage times are the wall times of every stage in seconds.
+    Counting without stats does not pay for any of them.
+    """
+
+    def __init__(self) -> None:
+        self.fixed_point_iterations = 0
+        self.candidates = 0
+        self.stage_times: dict[str, float] = {}
+        self.hints_stats: list[HintStats] = []
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(fixed_point_iterations={self.fixed_point_iterations}, "
+            f"candidates={self.candidates}, stage_times={self.stage_times}, hints_stats={self.hints_stats})"
+        )
+
+    def instrument(self, hints: Sequence[SpecificHint]) -> list[SpecificHint]:
+        """
+        Wrap the hints so their inserts and validations are recorded in the stats.
+        """
+        instrumented_hints: list[SpecificHint] = []
+        for hint in hints:
+            hint_stats = HintStats(hint)
+            self.hints_stats.append(hint_stats)
+            instrumented_hints.append(InstrumentedHint(hint, hint_stats))
+        return instrumented_hints
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        """
+        Add the wall time of the block to the stage time.
+        """
+        start_time = perf_counter()
+        try:
+            yield
+        finally:
+            self.stage_times[stage] = self.stage_times.get(stage, 0.0) + perf_counter() - start_time
+
+
+def measure_stage(stats: CountStats | None, stage: str) -> ContextManager[None]:
+    """
+    Measure the stage when stats are collected.
+    """
+    return nullcontext() if stats is None else stats.measure(stage)
@@ -0,0 +1,164 @@
+from typing import Iterable
+
+from picasso.hints import HintKey, SpecificHint
+
+# The canonical key of a hints set, the sorted keys of its hints after the symmetries are applied.
+SymmetryKey = tuple[HintKey, ...]
+
+
+def get_hint_key(attributes: tuple[tuple[int, int], ...], values: tuple[int, ...]) -> HintKey:
+    """
+    Get the key of a hint of the attributes and the floors or differences, ordered like SpecificHint.get_key.
+    """
+    if len(attributes) == 2 and attributes[1] < attributes[0]:
+        return (attributes[1], attributes[0]), tuple(sorted(-value for value in values))
+    return attributes, tuple(sorted(values))
+
+
+def reverse_floors(keys: Iterable[HintKey], floors_amount: int) -> list[HintKey]:
+    """
+    Get the keys of the hints on a tower turned upside down, the first floor becomes the last
+    and every floor difference is flipped.
+    """
+    reversed_keys = []
+    for attributes, values in keys:
+        if len(attributes) == 1:
+            reversed_keys.append(get_hint_key(attributes, tuple(floors_amount - 1 - floor for floor in values)))
+        else:
+            reversed_keys.append(get_hint_key(attributes, tuple(-difference for difference in values)))
+    return reversed_keys
+
+
+def relabel_items(keys: Iterable[HintKey], labels: dict[tuple[int, int], int]) -> SymmetryKey:
+    """
+    Get the sorted keys of the hints after every mentioned item is replaced by its label in its row.
+    """
+    return tuple(
+        sorted(
+            {
+                get_hint_key(tuple((row_index, labels[(row_index, item)]) for row_index, item in attributes), values)
+                for attributes, values in keys
+            }
+        )
+    )
+
+
+def refine_classes(
+    keys_by_attribute: dict[tuple[int, int], list[HintKey]], classes: dict[tuple[int, int], int]
+) -> dict[tuple[int, int], int]:
+    """
+    Split the classes of the mentioned items by the floors of their hints and the differences and classes
+    of the items they are hinted with, until no class splits anymore.
+    The classes are numbered by their signatures, so they do not depend on the labels of the items.
+    """
+    classes_amount = 0
+    while len(set(classes.values())) != classes_amount:
+        classes_amount = len(set(classes.values()))
+        signatures = {}
+        for attribute, attribute_keys in keys_by_attribute.items():
+            hints_signatures = []
+            for attributes, values in attribute_keys:
+                if len(attributes) == 1:
+                    hints_signatures.append((-1, -1, values))
+                elif attributes[0] == attribute:
+                    hints_signatures.append((attributes[1][0], classes[attributes[1]], values))
+                else:
+                    flipped_values = tuple(sorted(-value for value in values))
+                    hints_signatures.append((attributes[0][0], classes[attributes[0]], flipped_values))
+            signatures[attribute] = (classes[attribute], tuple(sorted(hints_signatures)))
+        classes_signatures = sorted(set(signatures.values()))
+        classes = {attribute: classes_signatures.index(signature) for attribute, signature in signatures.items()}
+    return classes
+
+
+def get_orbit(
+    item: tuple[int, int], automorphisms: list[dict[tuple[int, int], tuple[int, int]]]
+) -> set[tuple[int, int]]:
+    """
+    Get the items the automorphisms map the item to, by applying them until no new item is reached.
+    """
+    orbit = {item}
+    new_items = [item]
+    while new_items:
+        mapped_item = new_items.pop()
+        for automorphism in automorphisms:
+            other_item = automorphism[mapped_item]
+            if other_item not in orbit:
+                orbit.add(other_item)
+                new_items.append(other_item)
+    return orbit
+
+
+def get_relabeled_canonical_key(keys: list[HintKey]) -> SymmetryKey:
+    """
+    Get the smallest sorted keys of the hints over the labelings that give the items of every row
+    labels in the order of their classes. The items start in the class of their row, and while items
+    share a class every one of them is split into a class of its own in turn and the classes are refined again,
+    so only the items the hints can not tell apart are tried in every order.
+    Two labelings that give the same keys tell an automorphism of the hints, a relabeling that keeps them the same.
+    An item that an automorphism of the items split so far maps to an already tried item gives the same keys
+    and is skipped, so hints of many items that can not be told apart are not tried in every order.
+    """
+    keys_by_attribute: dict[tuple[int, int], list[HintKey]] = {}
+    for key in keys:
+        for attribute in key[0]:
+            keys_by_attribute.setdefault(attribute, []).append(key)
+    leaves_labels: dict[SymmetryKey, dict[tuple[int, int], int]] = {}
+    automorphisms: list[dict[tuple[int, int], tuple[int, int]]] = []
+
+    def search(classes: dict[tuple[int, int], int], split_items: list[tuple[int, int]]) -> SymmetryKey:
+        classes = refine_classes(keys_by_attribute, classes)
+        classes_items: dict[int, list[tuple[int, int]]] = {}
+        for attribute in sorted(classes):
+            classes_items.setdefault(classes[attribute], []).append(attribute)
+        shared_class = next(
+            (class_items for _, class_items in sorted(classes_items.items()) if len(class_items) > 1), None
+        )
+        if shared_class is not None:
+            items_keys: list[SymmetryKey] = []
+            tried_items: list[tuple[int, int]] = []
+            for item in shared_class:
+                path_automorphisms = [
+                    automorphism
+                    for automorphism in automorphisms
+                    if all(automorphism[split_item] == split_item for split_item in split_items)
+                ]
+                if any(item in get_orbit(tried_item, path_automorphisms) for tried_item in tried_items):
+                    continue
+                tried_items.append(item)
+                items_keys.append(
+                    search(
+                        {attribute: 2 * classes[attribute] + (attribute != item) for attribute in classes},
+                        [*split_items, item],
+                    )
+                )
+            return min(items_keys)
+
+        labels: dict[tuple[int, int], int] = {}
+        first_labels = [0, 0]
+        for _, ((row_index, row_item),) in sorted(classes_items.items()):
+            labels[(row_index, row_item)] = first_labels[row_index]
+            first_labels[row_index] += 1
+        relabeled_key = relabel_items(keys, labels)
+        if relabeled_key in leaves_labels:
+            labeled_items = {
+                (attribute[0], label): attribute for attribute, label in leaves_labels[relabeled_key].items()
+            }
+            automorphisms.append(
+                {attribute: labeled_items[(attribute[0], label)] for attribute, label in labels.items()}
+            )
+        else:
+            leaves_labels[relabeled_key] = labels
+        return relabeled_key
+
+    return search({attribute: attribute[0] for attribute in keys_by_attribute}, [])
+
+
+def get_symmetric_canonical_key(specific_hints: list[SpecificHint], floors_amount: int) -> SymmetryKey:
+    """
+    Get the canonical key of a hints set under turning the tower upside down and relabeling its colors and animals,
+    hints sets with the same key have the same amount of assignments.
+    The key does not depend on the order of the hints, their swapped attributes, or the labels of their items.
+    """
+    keys = sorted({hint.get_key() for hint in specific_hints})
+    return min(get_relabeled_canonical_key(keys), get_relabeled_canonical_key(reverse_floors(keys, floors_amount)))
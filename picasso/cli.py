@@ -0,0 +1,163 @@
+import json
+import sys
+from argparse import ArgumentParser
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from fileinput import FileInput
+from functools import partial
+from itertools import islice
+from os import cpu_count
+from pathlib import Path
+from typing import Any, Iterable, Iterator, TextIO
+
+from picasso._count_assignments import count_assignments
+from picasso._result_store import get_result_store
+from picasso._serialization import hint_from_json
+from picasso.models import CountingEngine
+from picasso.tower import DEFAULT_TOWER_SPEC, TowerSpec
+
+DEFAULT_CHUNK_SIZE = 100
+# Every worker has up to this amount of chunks sent to it and not written yet. The input is not read further
+# until the oldest chunk is written, so the memory stays bounded for any input size.
+MAX_PENDING_CHUNKS_PER_WORKER = 2
+
+
+def count_record(
+    line: str,
+    offset: int,
+    engine: CountingEngine = CountingEngine.Backtracking,
+    spec: TowerSpec = DEFAULT_TOWER_SPEC,
+    at_most: int | None = None,
+    store_path: Path | None = None,
+) -> dict[str, Any]:
+    """
+    Count the assignments of a JSONL record of hints, {"hints": [...]} with an optional "id" that is kept.
+    The result has the record offset and its count, or an error when the record is rejected or fails to count.
+    When a store path is given, hint sets that are symmetric to already counted ones are taken from the result store.
+    """
+    result: dict[str, Any] = {"offset": offset}
+    try:
+        record = json.loads(line)
+        if not isinstance(record, dict) or not isinstance(record.get("hints"), list):
+            raise ValueError('Got bad record, must be an object with a "hints" list')
+        if "id" in record:
+            result["id"] = record["id"]
+        hints = [hint_from_json(hint_record, spec) for hint_record in record["hints"]]
+        if store_path is not None:
+            result["count"] = get_result_store(store_path, spec).count(hints, engine, at_most)
+        else:
+            result["count"] = count_assignments(hints, engine, spec, at_most)
+    except Exception as error:
+        # A record that fails in any way gets its error, so the rest of the run goes on.
+        result["error"] = str(error) or type(error).__name__
+    return result
+
+
+def count_records_chunk(
+    lines: list[str],
+    first_offset: int,
+    engine: CountingEngine = CountingEngine.Backtracking,
+    spec: TowerSpec = DEFAULT_TOWER_SPEC,
+    at_most: int | None = None,
+    store_path: Path | None = None,
+) -> list[str]:
+    """
+    Count a chunk of JSONL records and return their JSONL results, runs inside the pool workers.
+    """
+    return [
+        json.dumps(count_record(line, offset, engine, spec, at_most, store_path))
+        for offset, line in enumerate(lines, start=first_offset)
+    ]
+
+
+def iter_chunks(lines: Iterable[str], first_offset: int, chunk_size: int) -> Iterator[tuple[int, list[str]]]:
+    """
+    Lazily split the lines into (first offset, lines) chunks.
+    """
+    lines_iterator = iter(lines)
+    offset = first_offset
+    while chunk := list(islice(lines_iterator, chunk_size)):
+        yield offset, chunk
+        offset += len(chunk)
+
+
+def count_jsonl(
+    lines: Iterable[str],
+    output: TextIO,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    offset: int = 0,
+    engine: CountingEngine = CountingEngine.Backtracking,
+    spec: TowerSpec = DEFAULT_TOWER_SPEC,
+    at_most: int | None = None,
+    store_path: Path | None = None,
+) -> None:
+    """
+    Count the JSONL records of the lines across a pool of worker processes and write their results in input order.
+    The records before offset are skipped, so a stopped run can be resumed from the offset after its last result.
+    The lines are read lazily and only a few chunks per worker are in flight, so the input can be of any size.
+    With a single worker the records are counted in this process.
+    With a store path every worker shares the result store at the path.
+    """
+    count_chunk = partial(count_records_chunk, engine=engine, spec=spec, at_most=at_most, store_path=store_path)
+    chunks = iter_chunks(islice(lines, offset, None), offset, chunk_size)
+    workers = workers or cpu_count() or 1
+    if workers == 1:
+        for first_offset, chunk in chunks:
+            write_results(output, count_chunk(chunk, first_offset))
+        return
+
+    pending_chunks: deque[Future[list[str]]] = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for first_offset, chunk in chunks:
+            if len(pending_chunks) == workers * MAX_PENDING_CHUNKS_PER_WORKER:
+                write_results(output, pending_chunks.popleft().result())
+            pending_chunks.append(executor.submit(count_chunk, chunk, first_offset))
+        while pending_chunks:
+            write_results(output, pending_chunks.popleft().result())
+
+
+def write_results(output: TextIO, results: list[str]) -> None:
+    """
+    Write the JSONL results and flush them, so the written offsets can be resumed from.
+    """
+    output.write("".join(f"{result}\n" for result in results))
+    output.flush()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = ArgumentParser(
+        description='Count the assignments of JSONL hint sets, one {"hints": [...], "id": ...} record per line.'
+    )
+    parser.add_argument("files", nargs="*", help="JSONL files to read, stdin when none or -")
+    parser.add_argument("--workers", type=int, help="worker processes, defaults to the cpu count")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="records sent to a worker at once")
+    parser.add_argument("--offset", type=int, default=0, help="records to skip, to resume a stopped run")
+    parser.add_argument("--at-most", type=int, help="stop counting a hint set at this amount of assignments")
+    parser.add_argument(
+        "--store", type=Path, metavar="PATH", help="SQLite result store of counts shared by symmetric hint sets"
+    )
+    parser.add_argument(
+        "--engine", choices=[engine.value for engine in CountingEngine], default=CountingEngine.Backtracking.value
+    )
+    args = parser.parse_args(argv)
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be positive")
+    if args.offset < 0 or (args.at_most is not None and args.at_most < 0):
+        parser.error("--offset and --at-most must not be negative")
+
+    with FileInput(args.files) as lines:
+        count_jsonl(
+            lines,
+            sys.stdout,
+            args.workers,
+            args.chunk_size,
+            args.offset,
+            CountingEngine(args.engine),
+            at_most=args.at_most,
+            store_path=args.store,
+        )
+
+
+if __name__ == "__main__":
+    main()
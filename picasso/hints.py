@@ -1,30 +1,79 @@
-from picasso.hints_utils import complete_last_available_absolute_color_animal_hint
-from picasso.models import Animal, Color, Floor, PicassoTowerFloor
+from enum import Enum
+
+from picasso.hints_utils import (
+    complete_last_available_absolute_color_animal_hint,
+    get_neighbor_differences,
+    insert_item,
+    insert_neighbor_item,
+    prune_domains,
+)
+from picasso.models import HintAttribute
+from picasso.tower import ANIMALS_ROW, COLORS_ROW, DEFAULT_TOWER_SPEC, CompactTower, Domains, PartialTower, TowerSpec
+
+# The normalized form of a specific hint: its ordered attributes and the floor differences between them.
+HintKey = tuple[tuple[tuple[int, int], ...], tuple[int, ...]]
 
 
 class Hint(object):
     """Base class for all the hint classes"""
 
-    pass
+    __slots__ = ()
 
 
 class SpecificHint(Hint):
     """
     A hint with a specific type of fields.
+    The attributes are the (row, item) pairs of the colors and animals the hint mentions.
+    The differences are the floor differences the hint allows between its first and second attributes,
+    or between its only attribute and the base floor.
     """
 
-    def validate(self, tower: dict[Floor, PicassoTowerFloor]) -> bool:
+    __slots__ = ()
+
+    attributes: tuple[tuple[int, int], ...]
+    differences: tuple[int, ...]
+    base_floor = 0
+
+    def get_key(self) -> HintKey:
+        """
+        Get the normalized form of the hint, the attributes are ordered and the differences are
+        flipped accordingly, so hints with the same key allow exactly the same towers.
+        Hints with one attribute are keyed by the floors it can be on, the ones on the tower only,
+        so a neighbor hint of the first floor has the key of the absolute hint of the second floor.
+        """
+        if len(self.attributes) == 1:
+            return self.attributes, tuple(sorted(self.base_floor + difference for difference in self.differences))
+        first_attribute, second_attribute = self.attributes
+        if second_attribute < first_attribute:
+            return (second_attribute, first_attribute), tuple(sorted(-difference for difference in self.differences))
+        return self.attributes, tuple(sorted(self.differences))
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, SpecificHint) and self.get_key() == other.get_key()
+
+    def __hash__(self) -> int:
+        return hash(self.get_key())
+
+    def validate(self, tower: CompactTower | PartialTower) -> bool:
         """
         Validate if the tower floors items are correct according to the hint.
+        The tower can be partial as long as all the hint attributes are already in it.
         """
         raise NotImplementedError
 
-    def insert(self, tower: dict[Floor, PicassoTowerFloor]) -> None:
+    def insert(self, tower: PartialTower) -> None:
         """
         If possible insert the hint to the tower.
         """
         raise NotImplementedError
 
+    def prune(self, domains: Domains, full_mask: int) -> bool:
+        """
+        Remove the floors the hint rules out from the domains of its attributes, return whether a domain changed.
+        Raise ContradictingHintsError if no floor is left for one of them.
+        """
+        return prune_domains(self.attributes, self.differences, self.base_floor, domains, full_mask)
+
 
 class AbsoluteHint(Hint):
     """
@@ -37,7 +86,7 @@ class AbsoluteHint(Hint):
         AbsoluteHint(Color.Orange, Animal.Chicken)
     """
 
-    def __init__(self, attr1: Floor | Color | Animal, attr2: Floor | Color | Animal):
+    def __init__(self, attr1: HintAttribute, attr2: HintAttribute):
         self.attr1 = attr1
         self.attr2 = attr2
 
@@ -49,15 +98,20 @@ class FloorColorAbsoluteHint(SpecificHint):
     The third floor is red - FloorColorAbsoluteHint(Floor.Third, Color.Red)
     """
 
-    def __init__(self, floor: Floor, color: Color):
+    differences = (0,)
+
+    def __init__(self, floor: int, color: Enum, spec: TowerSpec = DEFAULT_TOWER_SPEC):
         self.floor = floor
         self.color = color
+        self.base_floor = spec.floor_index(floor)
+        self._color = spec.color_index[color]
+        self.attributes = ((COLORS_ROW, self._color),)
 
-    def validate(self, tower: dict[Floor, PicassoTowerFloor]) -> bool:
-        return tower[self.floor].color == self.color
+    def validate(self, tower: CompactTower | PartialTower) -> bool:
+        return tower[0][self.base_floor] == self._color
 
-    def insert(self, tower: dict[Floor, PicassoTowerFloor]) -> None:
-        tower[self.floor].color = self.color
+    def insert(self, tower: PartialTower) -> None:
+        insert_item(tower[0], self.base_floor, self._color)
 
 
 class FloorAnimalAbsoluteHint(SpecificHint):
@@ -67,15 +121,20 @@ class FloorAnimalAbsoluteHint(SpecificHint):
     The frog lives on the fifth floor - FloorAnimalAbsoluteHint(Animal.Frog, Floor.Fifth)
     """
 
-    def __init__(self, floor: Floor, animal: Animal):
+    differences = (0,)
+
+    def __init__(self, floor: int, animal: Enum, spec: TowerSpec = DEFAULT_TOWER_SPEC):
         self.floor = floor
         self.animal = animal
+        self.base_floor = spec.floor_index(floor)
+        self._animal = spec.animal_index[animal]
+        self.attributes = ((ANIMALS_ROW, self._animal),)
 
-    def validate(self, tower: dict[Floor, PicassoTowerFloor]) -> bool:
-        return tower[self.floor].animal == self.animal
+    def validate(self, tower: CompactTower | PartialTower) -> bool:
+        return tower[1][self.base_floor] == self._animal
 
-    def insert(self, tower: dict[Floor, PicassoTowerFloor]) -> None:
-        tower[self.floor].animal = self.animal
+    def insert(self, tower: PartialTower) -> None:
+        insert_item(tower[1], self.base_floor, self._animal)
 
 
 class ColorAnimalAbsoluteHint(SpecificHint):
@@ -85,23 +144,26 @@ class ColorAnimalAbsoluteHint(SpecificHint):
     The orange floor is the floor where the chicken lives - ColorAnimalAbsoluteHint(Color.Orange, Animal.Chicken)
     """
 
-    def __init__(self, color: Color, animal: Animal):
+    differences = (0,)
+
+    def __init__(self, color: Enum, animal: Enum, spec: TowerSpec = DEFAULT_TOWER_SPEC):
         self.color = color
         self.animal = animal
+        self._color = spec.color_index[color]
+        self._animal = spec.animal_index[animal]
+        self.attributes = ((COLORS_ROW, self._color), (ANIMALS_ROW, self._animal))
 
-    def validate(self, tower: dict[Floor, PicassoTowerFloor]) -> bool:
-        for floor in tower.values():
-            if floor.color == self.color and floor.animal == self.animal:
-                return True
-        return False
+    def validate(self, tower: CompactTower | PartialTower) -> bool:
+        return tower[1][tower[0].index(self._color)] == self._animal
 
-    def insert(self, tower: dict[Floor, PicassoTowerFloor]) -> None:
-        for floor in tower.values():
-            if floor.color == self.color:
-                floor.animal = self.animal
-            elif floor.animal == self.animal:
-                floor.color = self.color
-        complete_last_available_absolute_color_animal_hint(tower, self.color, self.animal)
+    def insert(self, tower: PartialTower) -> None:
+        colors, animals = tower
+        for floor in range(len(colors)):
+            if colors[floor] == self._color:
+                insert_item(animals, floor, self._animal)
+            elif animals[floor] == self._animal:
+                insert_item(colors, floor, self._color)
+        complete_last_available_absolute_color_animal_hint(tower, self._color, self._animal)
 
 
 class RelativeHint(Hint):
@@ -117,7 +179,7 @@ class RelativeHint(Hint):
         RelativeHint(Floor.Third, Floor.Fifth, -2)
     """
 
-    def __init__(self, attr1: Floor | Color | Animal, attr2: Floor | Color | Animal, difference: int):
+    def __init__(self, attr1: HintAttribute, attr2: HintAttribute, difference: int):
         self.attr1 = attr1
         self.attr2 = attr2
         self.difference = difference
@@ -130,26 +192,25 @@ class ColorColorRelativeHint(SpecificHint):
     The red floor is above the blue floor - ColorColorRelativeHint(Color.Red, Color.Blue, 1)
     """
 
-    def __init__(self, color1: Color, color2: Color, difference: int):
+    def __init__(self, color1: Enum, color2: Enum, difference: int, spec: TowerSpec = DEFAULT_TOWER_SPEC):
         self.color1 = color1
         self.color2 = color2
         self.difference = difference
+        self.differences = (difference,)
+        self._color1 = spec.color_index[color1]
+        self._color2 = spec.color_index[color2]
+        self.attributes = ((COLORS_ROW, self._color1), (COLORS_ROW, self._color2))
 
-    def validate(self, tower: dict[Floor, PicassoTowerFloor]) -> bool:
-        for floor_number in range(max(0, self.difference) + 1, min(len(tower) + self.difference, len(tower)) + 1):
-            if (
-                tower[Floor(floor_number)].color == self.color1
-                and tower[Floor(floor_number - self.difference)].color == self.color2
-            ):
-                return True
-        return False
+    def validate(self, tower: CompactTower | PartialTower) -> bool:
+        return tower[0].index(self._color1) - tower[0].index(self._color2) == self.difference
 
-    def insert(self, tower: dict[Floor, PicassoTowerFloor]) -> None:
-        for floor_number in range(max(0, self.difference) + 1, min(len(tower) + self.difference, len(tower)) + 1):
-            if tower[Floor(floor_number)].color == self.color1:
-                tower[Floor(floor_number - self.difference)].color = self.color2
-            elif tower[Floor(floor_number - self.difference)].color == self.color2:
-                tower[Floor(floor_number)].color = self.color1
+    def insert(self, tower: PartialTower) -> None:
+        colors = tower[0]
+        for floor in range(max(0, self.difference), min(len(colors) + self.difference, len(colors))):
+            if colors[floor] == self._color1:
+                insert_item(colors, floor - self.difference, self._color2)
+            elif colors[floor - self.difference] == self._color2:
+                insert_item(colors, floor, self._color1)
 
 
 class ColorAnimalRelativeHint(SpecificHint):
@@ -159,26 +220,25 @@ class ColorAnimalRelativeHint(SpecificHint):
     The yellow floor is three below the floor the frog lives in - ColorAnimalRelativeHint(Color.Yellow, Animal.Frog, -3)
     """
 
-    def __init__(self, color: Color, animal: Animal, difference: int):
+    def __init__(self, color: Enum, animal: Enum, difference: int, spec: TowerSpec = DEFAULT_TOWER_SPEC):
         self.color = color
         self.animal = animal
         self.difference = difference
+        self.differences = (difference,)
+        self._color = spec.color_index[color]
+        self._animal = spec.animal_index[animal]
+        self.attributes = ((COLORS_ROW, self._color), (ANIMALS_ROW, self._animal))
 
-    def validate(self, tower: dict[Floor, PicassoTowerFloor]) -> bool:
-        for floor_number in range(max(0, self.difference) + 1, min(len(tower) + self.difference, len(tower)) + 1):
-            if (
-                tower[Floor(floor_number)].color == self.color
-                and tower[Floor(floor_number - self.difference)].animal == self.animal
-            ):
-                return True
-        return False
+    def validate(self, tower: CompactTower | PartialTower) -> bool:
+        return tower[0].index(self._color) - tower[1].index(self._animal) == self.difference
 
-    def insert(self, tower: dict[Floor, PicassoTowerFloor]) -> None:
-        for floor_number in range(max(0, self.difference) + 1, min(len(tower) + self.difference, len(tower)) + 1):
-            if tower[Floor(floor_number)].color == self.color:
-                tower[Floor(floor_number - self.difference)].animal = self.animal
-            elif tower[Floor(floor_number - self.difference)].animal == self.animal:
-                tower[Floor(floor_number)].color = self.color
+    def insert(self, tower: PartialTower) -> None:
+        colors, animals = tower
+        for floor in range(max(0, self.difference), min(len(colors) + self.difference, len(colors))):
+            if colors[floor] == self._color:
+                insert_item(animals, floor - self.difference, self._animal)
+            elif animals[floor - self.difference] == self._animal:
+                insert_item(colors, floor, self._color)
 
 
 class AnimalAnimalRelativeHint(SpecificHint):
@@ -188,26 +248,25 @@ class AnimalAnimalRelativeHint(SpecificHint):
     The frog lives two floors above the rabbit - AnimalAnimalRelativeHint(Color.Frog, Color.Rabbit, 2)
     """
 
-    def __init__(self, animal1: Animal, animal2: Animal, difference: int):
+    def __init__(self, animal1: Enum, animal2: Enum, difference: int, spec: TowerSpec = DEFAULT_TOWER_SPEC):
         self.animal1 = animal1
         self.animal2 = animal2
         self.difference = difference
+        self.differences = (difference,)
+        self._animal1 = spec.animal_index[animal1]
+        self._animal2 = spec.animal_index[animal2]
+        self.attributes = ((ANIMALS_ROW, self._animal1), (ANIMALS_ROW, self._animal2))
 
-    def validate(self, tower: dict[Floor, PicassoTowerFloor]) -> bool:
-        for floor_number in range(max(0, self.difference) + 1, min(len(tower) + self.difference, len(tower)) + 1):
-            if (
-                tower[Floor(floor_number)].animal == self.animal1
-                and tower[Floor(floor_number - self.difference)].animal == self.animal2
-            ):
-                return True
-        return False
+    def validate(self, tower: CompactTower | PartialTower) -> bool:
+        return tower[1].index(self._animal1) - tower[1].index(self._animal2) == self.difference
 
-    def insert(self, tower: dict[Floor, PicassoTowerFloor]) -> None:
-        for floor_number in range(max(0, self.difference) + 1, min(len(tower) + self.difference, len(tower)) + 1):
-            if tower[Floor(floor_number)].animal == self.animal1:
-                tower[Floor(floor_number - self.difference)].animal = self.animal2
-            elif tower[Floor(floor_number - self.difference)].animal == self.animal2:
-                tower[Floor(floor_number)].animal = self.animal1
+    def insert(self, tower: PartialTower) -> None:
+        animals = tower[1]
+        for floor in range(max(0, self.difference), min(len(animals) + self.difference, len(animals))):
+            if animals[floor] == self._animal1:
+                insert_item(animals, floor - self.difference, self._animal2)
+            elif animals[floor - self.difference] == self._animal2:
+                insert_item(animals, floor, self._animal1)
 
 
 class AnimalColorRelativeHint(SpecificHint):
@@ -217,26 +276,25 @@ class AnimalColorRelativeHint(SpecificHint):
     The frog lives three floor below the yellow floor - AnimalColorRelativeHint(Animal.Frog, Color.Yellow, -3)
     """
 
-    def __init__(self, animal: Animal, color: Color, difference: int):
+    def __init__(self, animal: Enum, color: Enum, difference: int, spec: TowerSpec = DEFAULT_TOWER_SPEC):
         self.animal = animal
         self.color = color
         self.difference = difference
+        self.differences = (difference,)
+        self._animal = spec.animal_index[animal]
+        self._color = spec.color_index[color]
+        self.attributes = ((ANIMALS_ROW, self._animal), (COLORS_ROW, self._color))
 
-    def validate(self, tower: dict[Floor, PicassoTowerFloor]) -> bool:
-        for floor_number in range(max(0, self.difference) + 1, min(len(tower) + self.difference, len(tower)) + 1):
-            if (
-                tower[Floor(floor_number)].animal == self.animal
-                and tower[Floor(floor_number - self.difference)].color == self.color
-            ):
-                return True
-        return False
+    def validate(self, tower: CompactTower | PartialTower) -> bool:
+        return tower[1].index(self._animal) - tower[0].index(self._color) == self.difference
 
-    def insert(self, tower: dict[Floor, PicassoTowerFloor]) -> None:
-        for floor_number in range(max(0, self.difference) + 1, min(len(tower) + self.difference, len(tower)) + 1):
-            if tower[Floor(floor_number)].animal == self.animal:
-                tower[Floor(floor_number - self.difference)].color = self.color
-            elif tower[Floor(floor_number - self.difference)].color == self.color:
-                tower[Floor(floor_number)].animal = self.animal
+    def insert(self, tower: PartialTower) -> None:
+        colors, animals = tower
+        for floor in range(max(0, self.difference), min(len(animals) + self.difference, len(animals))):
+            if animals[floor] == self._animal:
+                insert_item(colors, floor - self.difference, self._color)
+            elif colors[floor - self.difference] == self._color:
+                insert_item(animals, floor, self._animal)
 
 
 class NeighborHint(Hint):
@@ -252,7 +310,7 @@ class NeighborHint(Hint):
         NeighborHint(Color.Yellow, Floor.Third)
     """
 
-    def __init__(self, attr1: Floor | Color | Animal, attr2: Floor | Color | Animal):
+    def __init__(self, attr1: HintAttribute, attr2: HintAttribute):
         self.attr1 = attr1
         self.attr2 = attr2
 
@@ -264,26 +322,19 @@ class FloorColorNeighborHint(SpecificHint):
     The yellow floor is neighboring the third floor - FloorColorNeighborHint(Color.Yellow, Floor.Third)
     """
 
-    def __init__(self, floor: Floor, color: Color):
+    def __init__(self, floor: int, color: Enum, spec: TowerSpec = DEFAULT_TOWER_SPEC):
         self.floor = floor
         self.color = color
+        self.base_floor = spec.floor_index(floor)
+        self.differences = get_neighbor_differences(self.base_floor, spec.floors_amount)
+        self._color = spec.color_index[color]
+        self.attributes = ((COLORS_ROW, self._color),)
 
-    def validate(self, tower: dict[Floor, PicassoTowerFloor]) -> bool:
-        if self.floor == Floor.First:
-            return tower[Floor.Second].color == self.color
-        if self.floor == Floor.Fifth:
-            return tower[Floor.Fourth].color == self.color
-        return (tower[Floor(self.floor + 1)].color == self.color) or (tower[Floor(self.floor - 1)].color == self.color)
+    def validate(self, tower: CompactTower | PartialTower) -> bool:
+        return abs(tower[0].index(self._color) - self.base_floor) == 1
 
-    def insert(self, tower: dict[Floor, PicassoTowerFloor]) -> None:
-        if self.floor == Floor.First:
-            tower[Floor.Second].color = self.color
-        elif self.floor == Floor.Fifth:
-            tower[Floor.Fourth].color = self.color
-        elif tower[Floor(self.floor + 1)].color not in [self.color, None]:
-            tower[Floor(self.floor - 1)].color = self.color
-        elif tower[Floor(self.floor - 1)].color not in [self.color, None]:
-            tower[Floor(self.floor + 1)].color = self.color
+    def insert(self, tower: PartialTower) -> None:
+        insert_neighbor_item(tower[0], self.base_floor, self._color)
 
 
 class FloorAnimalNeighborHint(SpecificHint):
@@ -293,28 +344,19 @@ class FloorAnimalNeighborHint(SpecificHint):
     The Rabbit is neighbor to the First floor - FloorAnimalNeighborHint(Color.Rabbit, Floor.First)
     """
 
-    def __init__(self, floor: Floor, animal: Animal):
+    def __init__(self, floor: int, animal: Enum, spec: TowerSpec = DEFAULT_TOWER_SPEC):
         self.floor = floor
         self.animal = animal
+        self.base_floor = spec.floor_index(floor)
+        self.differences = get_neighbor_differences(self.base_floor, spec.floors_amount)
+        self._animal = spec.animal_index[animal]
+        self.attributes = ((ANIMALS_ROW, self._animal),)
+
+    def validate(self, tower: CompactTower | PartialTower) -> bool:
+        return abs(tower[1].index(self._animal) - self.base_floor) == 1
 
-    def validate(self, tower: dict[Floor, PicassoTowerFloor]) -> bool:
-        if self.floor == Floor.First:
-            return tower[Floor.Second].animal == self.animal
-        if self.floor == Floor.Fifth:
-            return tower[Floor.Fourth].animal == self.animal
-        return (tower[Floor(self.floor + 1)].animal == self.animal) or (
-            tower[Floor(self.floor - 1)].animal == self.animal
-        )
-
-    def insert(self, tower: dict[Floor, PicassoTowerFloor]) -> None:
-        if self.floor == Floor.First:
-            tower[Floor.Second].animal = self.animal
-        elif self.floor == Floor.Fifth:
-            tower[Floor.Fourth].animal = self.animal
-        elif tower[Floor(self.floor + 1)].animal not in [self.animal, None]:
-            tower[Floor(self.floor - 1)].animal = self.animal
-        elif tower[Floor(self.floor - 1)].animal not in [self.animal, None]:
-            tower[Floor(self.floor + 1)].animal = self.animal
+    def insert(self, tower: PartialTower) -> None:
+        insert_neighbor_item(tower[1], self.base_floor, self._animal)
 
 
 class ColorColorNeighborHint(SpecificHint):
@@ -324,35 +366,25 @@ class ColorColorNeighborHint(SpecificHint):
     The Red floor is neighbor to the Green floor - ColorColorNeighborHint(Color.Red, Floor.Green)
     """
 
-    def __init__(self, color1: Color, color2: Color):
+    differences = (-1, 1)
+
+    def __init__(self, color1: Enum, color2: Enum, spec: TowerSpec = DEFAULT_TOWER_SPEC):
         self.color1 = color1
         self.color2 = color2
+        self._color1 = spec.color_index[color1]
+        self._color2 = spec.color_index[color2]
+        self.attributes = ((COLORS_ROW, self._color1), (COLORS_ROW, self._color2))
+
+    def validate(self, tower: CompactTower | PartialTower) -> bool:
+        return abs(tower[0].index(self._color1) - tower[0].index(self._color2)) == 1
 
-    def validate(self, tower: dict[Floor, PicassoTowerFloor]) -> bool:
-        if tower[Floor.First].color == self.color1 and tower[Floor(Floor.First + 1)].color == self.color2:
-            return True
-        if tower[Floor.Fifth].color == self.color1 and tower[Floor(Floor.Fifth - 1)].color == self.color2:
-            return True
-        for floor_number in range(Floor.Second, Floor.Fifth):
-            if tower[Floor(floor_number)].color == self.color1 and (
-                tower[Floor(floor_number - 1)].color == self.color2
-                or tower[Floor(floor_number + 1)].color == self.color2
-            ):
-                return True
-        return False
-
-    def insert(self, tower: dict[Floor, PicassoTowerFloor]) -> None:
-        for floor in Floor:
-            if tower[floor].color in [self.color1, self.color2]:
-                color_to_insert = self.color1 if tower[floor].color == self.color2 else self.color2
-                if (
-                    floor < Floor.Fifth
-                    and floor < Floor.Fifth
-                    and tower[Floor(floor + 1)].color not in [color_to_insert, None]
-                ):
-                    tower[Floor(floor - 1)].color = color_to_insert
-                elif floor > Floor.First and tower[Floor(floor - 1)].color not in [color_to_insert, None]:
-                    tower[Floor(floor + 1)].color = color_to_insert
+    def insert(self, tower: PartialTower) -> None:
+        colors = tower[0]
+        for floor, color in enumerate(colors):
+            if color == self._color1:
+                insert_neighbor_item(colors, floor, self._color2)
+            elif color == self._color2:
+                insert_neighbor_item(colors, floor, self._color1)
 
 
 class ColorAnimalNeighborHint(SpecificHint):
@@ -363,35 +395,25 @@ class ColorAnimalNeighborHint(SpecificHint):
     ColorAnimalNeighborHint(Color.Green, Animal.Chicken)
     """
 
-    def __init__(self, color: Color, animal: Animal):
+    differences = (-1, 1)
+
+    def __init__(self, color: Enum, animal: Enum, spec: TowerSpec = DEFAULT_TOWER_SPEC):
         self.color = color
         self.animal = animal
+        self._color = spec.color_index[color]
+        self._animal = spec.animal_index[animal]
+        self.attributes = ((COLORS_ROW, self._color), (ANIMALS_ROW, self._animal))
+
+    def validate(self, tower: CompactTower | PartialTower) -> bool:
+        return abs(tower[0].index(self._color) - tower[1].index(self._animal)) == 1
 
-    def validate(self, tower: dict[Floor, PicassoTowerFloor]) -> bool:
-        if tower[Floor.First].color == self.color and tower[Floor(Floor.First + 1)].animal == self.animal:
-            return True
-        if tower[Floor.Fifth].color == self.color and tower[Floor(Floor.Fifth - 1)].animal == self.animal:
-            return True
-        for floor_number in range(Floor.Second, Floor.Fifth):
-            if tower[Floor(floor_number)].color == self.color and (
-                tower[Floor(floor_number - 1)].animal == self.animal
-                or tower[Floor(floor_number + 1)].animal == self.animal
-            ):
-                return True
-        return False
-
-    def insert(self, tower: dict[Floor, PicassoTowerFloor]) -> None:
-        for floor in Floor:
-            if tower[floor].color == self.color:
-                if floor < Floor.Fifth and tower[Floor(floor + 1)].animal not in [self.animal, None]:
-                    tower[Floor(floor - 1)].animal = self.animal
-                elif floor > Floor.First and tower[Floor(floor - 1)].animal not in [self.animal, None]:
-                    tower[Floor(floor + 1)].animal = self.animal
-            elif tower[floor].animal == self.animal:
-                if floor < Floor.Fifth and tower[Floor(floor + 1)].color not in [self.color, None]:
-                    tower[Floor(floor - 1)].color = self.color
-                elif floor > Floor.First and tower[Floor(floor - 1)].color not in [self.color, None]:
-                    tower[Floor(floor + 1)].color = self.color
+    def insert(self, tower: PartialTower) -> None:
+        colors, animals = tower
+        for floor in range(len(colors)):
+            if colors[floor] == self._color:
+                insert_neighbor_item(animals, floor, self._animal)
+            elif animals[floor] == self._animal:
+                insert_neighbor_item(colors, floor, self._color)
 
 
 class AnimalAnimalNeighborHint(SpecificHint):
@@ -401,118 +423,123 @@ class AnimalAnimalNeighborHint(SpecificHint):
     he grasshopper is a neighbor of the rabbit - AnimalAnimalNeighborHint(Animal.Grasshopper, Animal.Rabbit)
     """
 
-    def __init__(self, animal1: Animal, animal2: Animal):
+    differences = (-1, 1)
+
+    def __init__(self, animal1: Enum, animal2: Enum, spec: TowerSpec = DEFAULT_TOWER_SPEC):
         self.animal1 = animal1
         self.animal2 = animal2
+        self._animal1 = spec.animal_index[animal1]
+        self._animal2 = spec.animal_index[animal2]
+        self.attributes = ((ANIMALS_ROW, self._animal1), (ANIMALS_ROW, self._animal2))
 
-    def validate(self, tower: dict[Floor, PicassoTowerFloor]) -> bool:
-        if tower[Floor.First].animal == self.animal1 and tower[Floor(Floor.First + 1)].animal == self.animal2:
-            return True
-        if tower[Floor.Fifth].animal == self.animal1 and tower[Floor(Floor.Fifth - 1)].animal == self.animal2:
-            return True
-        for floor_number in range(Floor.Second, Floor.Fifth):
-            if tower[Floor(floor_number)].animal == self.animal1 and (
-                tower[Floor(floor_number - 1)].animal == self.animal2
-                or tower[Floor(floor_number + 1)].animal == self.animal2
-            ):
-                return True
-        return False
-
-    def insert(self, tower: dict[Floor, PicassoTowerFloor]) -> None:
-        for floor in Floor:
-            if tower[floor].animal in [self.animal1, self.animal2]:
-                animal_to_insert = self.animal1 if tower[floor].animal == self.animal2 else self.animal2
-                if floor < Floor.Fifth and tower[Floor(floor + 1)].animal not in [animal_to_insert, None]:
-                    tower[Floor(floor - 1)].animal = animal_to_insert
-                elif floor > Floor.First and tower[Floor(floor - 1)].animal not in [animal_to_insert, None]:
-                    tower[Floor(floor + 1)].animal = animal_to_insert
-
-
-def get_specific_absolute_hint(hint: AbsoluteHint) -> SpecificHint:
+    def validate(self, tower: CompactTower | PartialTower) -> bool:
+        return abs(tower[1].index(self._animal1) - tower[1].index(self._animal2)) == 1
+
+    def insert(self, tower: PartialTower) -> None:
+        animals = tower[1]
+        for floor, animal in enumerate(animals):
+            if animal == self._animal1:
+                insert_neighbor_item(animals, floor, self._animal2)
+            elif animal == self._animal2:
+                insert_neighbor_item(animals, floor, self._animal1)
+
+
+def get_specific_absolute_hint(hint: AbsoluteHint, spec: TowerSpec = DEFAULT_TOWER_SPEC) -> SpecificHint:
     """
     Get an AbsoluteHint and return subclass of SpecificHint with the correct parameters type.
     """
-    if isinstance(hint.attr1, Floor):
-        if isinstance(hint.attr2, Color):
-            return FloorColorAbsoluteHint(hint.attr1, hint.attr2)
-        if isinstance(hint.attr2, Animal):
-            return FloorAnimalAbsoluteHint(hint.attr1, hint.attr2)
+    if isinstance(hint.attr1, spec.color_type):
+        if isinstance(hint.attr2, spec.animal_type):
+            return ColorAnimalAbsoluteHint(hint.attr1, hint.attr2, spec)
+        if isinstance(hint.attr2, int):
+            return FloorColorAbsoluteHint(hint.attr2, hint.attr1, spec)
 
-    elif isinstance(hint.attr1, Color):
-        if isinstance(hint.attr2, Animal):
-            return ColorAnimalAbsoluteHint(hint.attr1, hint.attr2)
-        if isinstance(hint.attr2, Floor):
-            return FloorColorAbsoluteHint(hint.attr2, hint.attr1)
+    elif isinstance(hint.attr1, spec.animal_type):
+        if isinstance(hint.attr2, int):
+            return FloorAnimalAbsoluteHint(hint.attr2, hint.attr1, spec)
+        if isinstance(hint.attr2, spec.color_type):
+            return ColorAnimalAbsoluteHint(hint.attr2, hint.attr1, spec)
 
-    elif isinstance(hint.attr1, Animal):
-        if isinstance(hint.attr2, Floor):
-            return FloorAnimalAbsoluteHint(hint.attr2, hint.attr1)
-        if isinstance(hint.attr2, Color):
-            return ColorAnimalAbsoluteHint(hint.attr2, hint.attr1)
+    elif isinstance(hint.attr1, int):
+        if isinstance(hint.attr2, spec.color_type):
+            return FloorColorAbsoluteHint(hint.attr1, hint.attr2, spec)
+        if isinstance(hint.attr2, spec.animal_type):
+            return FloorAnimalAbsoluteHint(hint.attr1, hint.attr2, spec)
 
-    raise ValueError(f"Got bad hint attr class, can only be one of {Floor, Color, Animal}")
+    raise ValueError(f"Got bad hint attr class, can only be one of {int, spec.color_type, spec.animal_type}")
 
 
-def get_specific_relative_hint(hint: RelativeHint) -> SpecificHint:
+def get_specific_relative_hint(hint: RelativeHint, spec: TowerSpec = DEFAULT_TOWER_SPEC) -> SpecificHint:
     """
     Get an RelativeHint and return subclass of SpecificHint with the correct parameters type.
     """
-    if isinstance(hint.attr1, Color):
-        if isinstance(hint.attr2, Color):
-            return ColorColorRelativeHint(hint.attr1, hint.attr2, hint.difference)
-        if isinstance(hint.attr2, Animal):
-            return ColorAnimalRelativeHint(hint.attr1, hint.attr2, hint.difference)
+    if isinstance(hint.attr1, spec.color_type):
+        if isinstance(hint.attr2, spec.color_type):
+            return ColorColorRelativeHint(hint.attr1, hint.attr2, hint.difference, spec)
+        if isinstance(hint.attr2, spec.animal_type):
+            return ColorAnimalRelativeHint(hint.attr1, hint.attr2, hint.difference, spec)
 
-    elif isinstance(hint.attr1, Animal):
-        if isinstance(hint.attr2, Animal):
-            return AnimalAnimalRelativeHint(hint.attr1, hint.attr2, hint.difference)
-        if isinstance(hint.attr2, Color):
-            return AnimalColorRelativeHint(hint.attr1, hint.attr2, hint.difference)
+    elif isinstance(hint.attr1, spec.animal_type):
+        if isinstance(hint.attr2, spec.animal_type):
+            return AnimalAnimalRelativeHint(hint.attr1, hint.attr2, hint.difference, spec)
+        if isinstance(hint.attr2, spec.color_type):
+            return AnimalColorRelativeHint(hint.attr1, hint.attr2, hint.difference, spec)
 
-    raise ValueError(f"Got bad hint attr class, can only be one of {Floor, Color, Animal}")
+    raise ValueError(f"Got bad hint attr class, can only be one of {int, spec.color_type, spec.animal_type}")
 
 
-def get_specific_neighbor_hint(hint: NeighborHint) -> SpecificHint:
+def get_specific_neighbor_hint(hint: NeighborHint, spec: TowerSpec = DEFAULT_TOWER_SPEC) -> SpecificHint:
     """
     Get an NeighborHint and return subclass of SpecificHint with the correct parameters type.
     """
-    if isinstance(hint.attr1, Floor):
-        if isinstance(hint.attr2, Color):
-            return FloorColorNeighborHint(hint.attr1, hint.attr2)
-        if isinstance(hint.attr2, Animal):
-            return FloorAnimalNeighborHint(hint.attr1, hint.attr2)
+    if isinstance(hint.attr1, spec.color_type):
+        if isinstance(hint.attr2, spec.color_type):
+            return ColorColorNeighborHint(hint.attr1, hint.attr2, spec)
+        if isinstance(hint.attr2, spec.animal_type):
+            return ColorAnimalNeighborHint(hint.attr1, hint.attr2, spec)
+        if isinstance(hint.attr2, int):
+            return FloorColorNeighborHint(hint.attr2, hint.attr1, spec)
 
-    elif isinstance(hint.attr1, Color):
-        if isinstance(hint.attr2, Color):
-            return ColorColorNeighborHint(hint.attr1, hint.attr2)
-        if isinstance(hint.attr2, Animal):
-            return ColorAnimalNeighborHint(hint.attr1, hint.attr2)
-        if isinstance(hint.attr2, Floor):
-            return FloorColorNeighborHint(hint.attr2, hint.attr1)
+    elif isinstance(hint.attr1, spec.animal_type):
+        if isinstance(hint.attr2, spec.animal_type):
+            return AnimalAnimalNeighborHint(hint.attr1, hint.attr2, spec)
+        if isinstance(hint.attr2, int):
+            return FloorAnimalNeighborHint(hint.attr2, hint.attr1, spec)
+        if isinstance(hint.attr2, spec.color_type):
+            return ColorAnimalNeighborHint(hint.attr2, hint.attr1, spec)
 
-    elif isinstance(hint.attr1, Animal):
-        if isinstance(hint.attr2, Animal):
-            return AnimalAnimalNeighborHint(hint.attr1, hint.attr2)
-        if isinstance(hint.attr2, Floor):
-            return FloorAnimalNeighborHint(hint.attr2, hint.attr1)
-        if isinstance(hint.attr2, Color):
-            return ColorAnimalNeighborHint(hint.attr2, hint.attr1)
+    elif isinstance(hint.attr1, int):
+        if isinstance(hint.attr2, spec.color_type):
+            return FloorColorNeighborHint(hint.attr1, hint.attr2, spec)
+        if isinstance(hint.attr2, spec.animal_type):
+            return FloorAnimalNeighborHint(hint.attr1, hint.attr2, spec)
 
-    raise ValueError(f"Got bad hint attr class, can only be one of {Floor, Color, Animal}")
+    raise ValueError(f"Got bad hint attr class, can only be one of {int, spec.color_type, spec.animal_type}")
 
 
-def get_specific_hints(hints: list[Hint]) -> list[SpecificHint]:
+def get_specific_hints(hints: list[Hint], spec: TowerSpec = DEFAULT_TOWER_SPEC) -> list[SpecificHint]:
     """
-    Get a list of Hint and transfer them to the corresponding SpecificHint according to the members type
+    Get a list of Hint and transfer them to the corresponding SpecificHint according to the members type,
+    hints that are already specific are kept as they are.
     """
     specific_hints: list[SpecificHint] = []
     for hint in hints:
-        if isinstance(hint, AbsoluteHint):
-            specific_hints.append(get_specific_absolute_hint(hint))
+        if isinstance(hint, SpecificHint):
+            specific_hints.append(hint)
+        elif isinstance(hint, AbsoluteHint):
+            specific_hints.append(get_specific_absolute_hint(hint, spec))
         elif isinstance(hint, RelativeHint):
-            specific_hints.append(get_specific_relative_hint(hint))
+            specific_hints.append(get_specific_relative_hint(hint, spec))
         elif isinstance(hint, NeighborHint):
-            specific_hints.append(get_specific_neighbor_hint(hint))
+            specific_hints.append(get_specific_neighbor_hint(hint, spec))
         else:
             raise ValueError(f"Got bad hint class, can only be one of {AbsoluteHint, RelativeHint, NeighborHint}")
     return specific_hints
+
+
+def get_canonical_hints(specific_hints: list[SpecificHint]) -> tuple[SpecificHint, ...]:
+    """
+    Get the normalized form of a hints set, without repeating hints and ordered by the hints keys,
+    so sets of the same hints in any order or with swapped attributes have the same canonical hints.
+    """
+    return tuple(sorted(set(specific_hints), key=SpecificHint.get_key))
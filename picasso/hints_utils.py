@@ -1,45 +1,140 @@
-from picasso.models import Animal, Color, Floor, PicassoTowerFloor
+from picasso.tower import EMPTY, Domains, PartialTower
 
 
-def complete_last_available_option(tower: dict[Floor, PicassoTowerFloor]) -> None:
+class ContradictingHintsError(ValueError):
     """
-    In cases where there is only one color or animal left to insert,
-    this function responsible for inserting those color or animal to the left empty floor space.
+    Raised while inserting hints to a tower when the hints can not all be satisfied.
     """
-    unused_colors = list(Color)
-    unused_animals = list(Animal)
-    empty_color_floors: list[PicassoTowerFloor] = []
-    empty_animal_floors: list[PicassoTowerFloor] = []
 
-    for floor in tower.values():
-        if floor.color in unused_colors:
-            unused_colors.remove(floor.color)
-        if floor.animal in unused_animals:
-            unused_animals.remove(floor.animal)
-        if floor.color is None:
-            empty_color_floors.append(floor)
-        if floor.animal is None:
-            empty_animal_floors.append(floor)
 
-    if len(empty_color_floors) == 1 and len(unused_colors) == 1:
-        empty_color_floors[0].color = unused_colors[0]
-    if len(empty_animal_floors) == 1 and len(unused_animals) == 1:
-        empty_animal_floors[0].animal = unused_animals[0]
+def complete_last_available_option(tower: PartialTower) -> None:
+    """
+    In cases where there is only one color or animal left to insert,
+    this function responsible for inserting those color or animal to the left empty floor space.
+    """
+    for floor_items in tower:
+        unused_items = set(range(len(floor_items))).difference(floor_items)
+        if len(unused_items) == 1 and floor_items.count(EMPTY) == 1:
+            floor_items[floor_items.index(EMPTY)] = unused_items.pop()
 
 
-def complete_last_available_absolute_color_animal_hint(
-    tower: dict[Floor, PicassoTowerFloor], color: Color, animal: Animal
-) -> None:
+def complete_last_available_absolute_color_animal_hint(tower: PartialTower, color: int, animal: int) -> None:
     """
     In cases where there is only one empty floor and an absolute hint was given connecting a color and animal,
     this function responsible for inserting those color and animal to the last empty floor.
     """
-    empty_floors = []
-
-    for floor in tower.values():
-        if floor.color is None and floor.animal is None:
-            empty_floors.append(floor)
+    colors, animals = tower
+    if color in colors or animal in animals:
+        return
+    empty_floors = [
+        floor
+        for floor, (floor_color, floor_animal) in enumerate(zip(colors, animals))
+        if floor_color == floor_animal == EMPTY
+    ]
 
     if len(empty_floors) == 1:
-        empty_floors[0].color = color
-        empty_floors[0].animal = animal
+        colors[empty_floors[0]] = color
+        animals[empty_floors[0]] = animal
+
+
+def insert_item(floor_items: list[int], floor: int, item: int) -> None:
+    """
+    Insert an item to an empty floor, known floors are never overwritten.
+    Raise ContradictingHintsError when the floor holds another item or the item is already on another floor.
+    """
+    if floor_items[floor] == item:
+        return
+    if floor_items[floor] != EMPTY or item in floor_items:
+        raise ContradictingHintsError(f"Item {item} can not be inserted to floor index {floor}")
+    floor_items[floor] = item
+
+
+def insert_neighbor_item(floor_items: list[int], floor: int, item: int) -> None:
+    """
+    Insert an item that must live next to the given floor,
+    in cases where only one of the floor neighbors can still hold it.
+    Raise ContradictingHintsError when none of the floor neighbors can hold it.
+    """
+    optional_floors = [
+        neighbor
+        for neighbor in (floor - 1, floor + 1)
+        if 0 <= neighbor < len(floor_items) and floor_items[neighbor] in (EMPTY, item)
+    ]
+    if not optional_floors:
+        raise ContradictingHintsError(f"Item {item} can not be inserted next to floor index {floor}")
+    if len(optional_floors) == 1:
+        insert_item(floor_items, optional_floors[0], item)
+
+
+def get_neighbor_differences(floor: int, floors_amount: int) -> tuple[int, ...]:
+    """
+    Get the differences from the floor to its neighbors that are on the tower,
+    the first and the last floors have a single neighbor.
+    """
+    return tuple(difference for difference in (-1, 1) if 0 <= floor + difference < floors_amount)
+
+
+def get_floors_mask(floors: list[int] | range) -> int:
+    """
+    Get the bitset of the floor indices.
+    """
+    mask = 0
+    for floor in floors:
+        mask |= 1 << floor
+    return mask
+
+
+def shift_floors_mask(mask: int, difference: int, full_mask: int) -> int:
+    """
+    Move every floor of the bitset by the difference, floors that leave the tower are dropped.
+    Differences of the tower height or more leave no floor, without shifting by them.
+    """
+    if abs(difference) >= full_mask.bit_length():
+        return 0
+    if difference >= 0:
+        return (mask << difference) & full_mask
+    return mask >> -difference
+
+
+def set_domain(domains: Domains, row_index: int, item: int, domain: int) -> bool:
+    """
+    Set the domain of an item and return whether it changed.
+    Raise ContradictingHintsError if no floor is left for the item.
+    """
+    if not domain:
+        raise ContradictingHintsError(f"No floor is left for item {item} of row {row_index}")
+    is_changed = domains[row_index][item] != domain
+    domains[row_index][item] = domain
+    return is_changed
+
+
+def prune_domains(
+    attributes: tuple[tuple[int, int], ...],
+    differences: tuple[int, ...],
+    base_floor: int,
+    domains: Domains,
+    full_mask: int,
+) -> bool:
+    """
+    Remove the floors a hint rules out from the domains of its attributes, return whether a domain changed.
+    A floor of one attribute is kept only if the other attribute has a floor at one of the hint differences from it,
+    the only attribute of a hint is kept on the floors at the hint differences from its base floor.
+    """
+    first_row, first_item = attributes[0]
+    first_domain = domains[first_row][first_item]
+    if len(attributes) == 1:
+        allowed_floors = [base_floor + difference for difference in differences]
+        allowed_mask = get_floors_mask([floor for floor in allowed_floors if floor >= 0]) & full_mask
+        return set_domain(domains, first_row, first_item, first_domain & allowed_mask)
+
+    second_row, second_item = attributes[1]
+    if (first_row, first_item) == (second_row, second_item):
+        return False if 0 in differences else set_domain(domains, first_row, first_item, 0)
+    second_domain = domains[second_row][second_item]
+    first_support = second_support = 0
+    for difference in differences:
+        first_support |= shift_floors_mask(second_domain, difference, full_mask)
+        second_support |= shift_floors_mask(first_domain, -difference, full_mask)
+    is_first_changed = set_domain(domains, first_row, first_item, first_domain & first_support)
+    is_second_changed = set_domain(domains, second_row, second_item, second_domain & second_support)
+    return is_first_changed or is_second_changed
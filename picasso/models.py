@@ -1,7 +1,5 @@
 from enum import Enum, IntEnum
 
-from pydantic import BaseModel
-
 
 class Floor(IntEnum):
     First = 1
@@ -33,6 +31,38 @@ class AttributeType(Enum):
     Animal = "Animal"
 
 
-class PicassoTowerFloor(BaseModel):
-    animal: Animal | None
-    color: Color | None
+# A floor number, a color or an animal.
+# Towers of other sizes use their own color and animal enums and plain ints for the floors above the fifth.
+HintAttribute = int | Enum
+
+
+class PicassoTowerFloor(object):
+    """
+    The animal and the color of a single floor, None when unknown.
+    A plain slots class, so the core does not import pydantic and building the floors of many assignments is cheap.
+    The pydantic model of picasso.pydantic_models converts to and from it for validation at the boundaries.
+    """
+
+    __slots__ = ("animal", "color")
+
+    def __init__(self, animal: Animal | Enum | None = None, color: Color | Enum | None = None):
+        self.animal = animal
+        self.color = color
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, PicassoTowerFloor) and (self.animal, self.color) == (other.animal, other.color)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(animal={self.animal!r}, color={self.color!r})"
+
+
+class CountingEngine(Enum):
+    Backtracking = "Backtracking"
+    NumPy = "NumPy"
+    Index = "Index"
+
+
+class Difficulty(Enum):
+    Easy = "Easy"
+    Medium = "Medium"
+    Hard = "Hard"
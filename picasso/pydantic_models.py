@@ -0,0 +1,30 @@
+from enum import Enum
+
+from pydantic import BaseModel
+
+from picasso.models import Animal, Color, PicassoTowerFloor
+
+
+class PicassoTowerFloorModel(BaseModel):
+    """
+    A pydantic model of a tower floor, to validate floors that come from outside the process.
+    Requires the optional pydantic dependency, the rest of the package works with PicassoTowerFloor.
+    For example:
+        PicassoTowerFloorModel.parse_obj({"animal": "Bird", "color": "Red"}).to_floor()
+    """
+
+    animal: Animal | Enum | None
+    color: Color | Enum | None
+
+    @classmethod
+    def from_floor(cls, tower_floor: PicassoTowerFloor) -> "PicassoTowerFloorModel":
+        """
+        Create the model of a tower floor.
+        """
+        return cls(animal=tower_floor.animal, color=tower_floor.color)
+
+    def to_floor(self) -> PicassoTowerFloor:
+        """
+        Convert the model to a tower floor.
+        """
+        return PicassoTowerFloor(animal=self.animal, color=self.color)
@@ -0,0 +1,275 @@
+import asyncio
+import json
+from argparse import ArgumentParser
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from math import ceil
+from multiprocessing import get_context
+from time import perf_counter
+from typing import Any
+
+from picasso._count_assignments import count_specific_assignments
+from picasso._serialization import hint_from_json
+from picasso.hints import SpecificHint, get_canonical_hints, get_specific_hints
+from picasso.models import CountingEngine
+from picasso.tower import DEFAULT_TOWER_SPEC, TowerSpec
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8123
+# The latency percentiles are taken over the last requests of every endpoint.
+LATENCY_WINDOW = 1000
+MAX_BODY_SIZE = 16 * 1024 * 1024
+
+ENDPOINTS = ("/count", "/is_unique", "/batch", "/metrics")
+HTTP_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+
+class HTTPError(Exception):
+    """
+    Raised while handling a request that gets an error response with the status.
+    """
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class CountService(object):
+    """
+    Counts the assignments of hint sets in a pool of worker processes for many concurrent clients.
+    Hint sets are keyed by their canonical hints, so a hint set that is already being counted for another request,
+    in any order or with swapped attributes, waits for the same count instead of being counted again.
+    For example:
+        service = CountService(workers=4)
+        await service.count([AbsoluteHint(Animal.Frog, Floor.Fifth)])
+        service.get_metrics()
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        engine: CountingEngine = CountingEngine.Backtracking,
+        spec: TowerSpec = DEFAULT_TOWER_SPEC,
+        executor: Executor | None = None,
+    ):
+        self.engine = engine
+        self.spec = spec
+        # Spawned workers do not inherit the sockets of the connections, forked workers would keep them open.
+        self.executor = executor or ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn"))
+        self.requests = 0
+        self.coalesced_requests = 0
+        self.in_flight_requests = 0
+        self.latencies: dict[str, deque[float]] = {}
+        self._pending_counts: dict[tuple[tuple[SpecificHint, ...], int | None], asyncio.Future[int]] = {}
+
+    def close(self) -> None:
+        """
+        Shut down the worker pool, counts that did not start are cancelled.
+        """
+        self.executor.shutdown(cancel_futures=True)
+
+    async def count(self, hint_records: Any, at_most: int | None = None) -> int:
+        """
+        Count the assignments of the JSON hints, up to at_most assignments.
+        Raise ValueError for JSON that is not a list of hints.
+        """
+        if not isinstance(hint_records, list):
+            raise ValueError("Got bad hints, must be a list")
+        if at_most is not None and (not isinstance(at_most, int) or isinstance(at_most, bool) or at_most < 0):
+            raise ValueError(f"Got at_most {at_most!r}, must be a non negative int")
+        hints = [hint_from_json(hint_record, self.spec) for hint_record in hint_records]
+        key = (get_canonical_hints(get_specific_hints(hints, self.spec)), at_most)
+
+        self.requests += 1
+        pending_count = self._pending_counts.get(key)
+        if pending_count is not None:
+            self.coalesced_requests += 1
+        else:
+            count = partial(count_specific_assignments, key[0], self.engine, self.spec, at_most)
+            pending_count = asyncio.get_running_loop().run_in_executor(self.executor, count)
+            self._pending_counts[key] = pending_count
+            pending_count.add_done_callback(lambda _: self._pending_counts.pop(key, None))
+        # A request that is cancelled must not cancel the count of the requests coalesced with it.
+        return await asyncio.shield(pending_count)
+
+    async def is_unique(self, hint_records: Any) -> bool:
+        """
+        Check if exactly one assignment satisfies the JSON hints, the counting stops at the second assignment.
+        """
+        return await self.count(hint_records, at_most=2) == 1
+
+    async def count_many(self, hint_sets_records: Any, at_most: int | None = None) -> list[dict[str, Any]]:
+        """
+        Count the assignments of many JSON hint sets concurrently.
+        Every hint set gets its count, or an error when its hints are rejected.
+        """
+        if not isinstance(hint_sets_records, list):
+            raise ValueError("Got bad hint sets, must be a list")
+        counts = await asyncio.gather(
+            *(self.count(hint_records, at_most) for hint_records in hint_sets_records), return_exceptions=True
+        )
+        results: list[dict[str, Any]] = []
+        for count in counts:
+            if isinstance(count, ValueError):
+                results.append({"error": str(count)})
+            elif isinstance(count, BaseException):
+                raise count
+            else:
+                results.append({"count": count})
+        return results
+
+    def record_latency(self, endpoint: str, latency: float) -> None:
+        """
+        Record the latency of a request, only the last requests of every endpoint are kept.
+        """
+        self.latencies.setdefault(endpoint, deque(maxlen=LATENCY_WINDOW)).append(latency)
+
+    def get_metrics(self) -> dict[str, Any]:
+        """
+        Get the queue depth (the distinct counts waiting for or running in the pool), the requests in flight,
+        the requests and coalesced requests so far, and the p50 and p99 latencies of every endpoint in milliseconds.
+        """
+        latencies = {}
+        for endpoint, endpoint_latencies in self.latencies.items():
+            sorted_latencies = sorted(endpoint_latencies)
+            latencies[endpoint] = {
+                f"p{percentile}": sorted_latencies[max(ceil(len(sorted_latencies) * percentile / 100), 1) - 1] * 1000
+                for percentile in (50, 99)
+            }
+        return {
+            "queue_depth": len(self._pending_counts),
+            "in_flight_requests": self.in_flight_requests,
+            "requests": self.requests,
+            "coalesced_requests": self.coalesced_requests,
+            "latency_ms": latencies,
+        }
+
+    async def handle_request(self, method: str, path: str, body: bytes) -> dict[str, Any]:
+        """
+        Route a request to its endpoint and return its JSON response.
+        """
+        if path == "/metrics":
+            if method != "GET":
+                raise HTTPError(405, f"{path} only supports GET")
+            return self.get_metrics()
+        if path not in ENDPOINTS:
+            raise HTTPError(404, f"Got unknown path {path}, can only be one of {ENDPOINTS}")
+        if method != "POST":
+            raise HTTPError(405, f"{path} only supports POST")
+
+        try:
+            request = json.loads(body)
+            if not isinstance(request, dict):
+                raise ValueError("Got bad request, must be a JSON object")
+            if path == "/count":
+                return {"count": await self.count(request.get("hints"), request.get("at_most"))}
+            if path == "/is_unique":
+                return {"is_unique": await self.is_unique(request.get("hints"))}
+            return {"results": await self.count_many(request.get("hint_sets"), request.get("at_most"))}
+        except ValueError as error:
+            raise HTTPError(400, str(error))
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Serve a single HTTP/1.1 request of the connection and close it.
+        """
+        start_time = perf_counter()
+        self.in_flight_requests += 1
+        path = ""
+        try:
+            try:
+                method, path, body = await read_request(reader)
+                status, response = 200, await self.handle_request(method, path, body)
+            except HTTPError as error:
+                status, response = error.status, {"error": str(error)}
+            except (ConnectionError, asyncio.IncompleteReadError):
+                raise
+            except Exception as error:
+                # Failures of the worker pool, like a broken pool, still get a response.
+                status, response = 500, {"error": str(error) or type(error).__name__}
+            await write_response(writer, status, response)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.in_flight_requests -= 1
+            if path in ENDPOINTS:
+                self.record_latency(path, perf_counter() - start_time)
+            writer.close()
+
+
+async def read_request(reader: asyncio.StreamReader) -> tuple[str, str, bytes]:
+    """
+    Read the method, path and body of an HTTP request.
+    """
+    request_line = (await reader.readline()).decode("latin-1").split()
+    if len(request_line) != 3:
+        raise HTTPError(400, "Got bad request line")
+    method, path, _ = request_line
+    content_length = 0
+    while (header := (await reader.readline()).decode("latin-1").strip()) != "":
+        name, _, value = header.partition(":")
+        if name.strip().lower() == "content-length":
+            if not value.strip().isdigit():
+                raise HTTPError(400, "Got bad Content-Length")
+            content_length = int(value)
+    if content_length > MAX_BODY_SIZE:
+        raise HTTPError(413, f"Got a body of {content_length} bytes, must be up to {MAX_BODY_SIZE}")
+    return method, path.split("?")[0], await reader.readexactly(content_length)
+
+
+async def write_response(writer: asyncio.StreamWriter, status: int, response: dict[str, Any]) -> None:
+    """
+    Write a JSON HTTP response.
+    """
+    body = json.dumps(response).encode()
+    writer.write(
+        f"HTTP/1.1 {status} {HTTP_REASONS[status]}\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body
+    )
+    await writer.drain()
+
+
+async def start_server(
+    service: CountService, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, unix_socket: str | None = None
+) -> asyncio.Server:
+    """
+    Start serving the service over HTTP on a TCP port, or on a Unix socket when given.
+    """
+    if unix_socket is not None:
+        return await asyncio.start_unix_server(service.handle_connection, unix_socket)
+    return await asyncio.start_server(service.handle_connection, host, port)
+
+
+async def serve(host: str, port: int, unix_socket: str | None, workers: int | None) -> None:
+    """
+    Serve a count service with its own worker pool until cancelled.
+    """
+    service = CountService(workers)
+    try:
+        server = await start_server(service, host, port, unix_socket)
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = ArgumentParser(description="Serve count_assignments over HTTP, JSON hints are posted to the endpoints.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="host to listen on")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="port to listen on")
+    parser.add_argument("--unix-socket", metavar="PATH", help="listen on a Unix socket instead of a TCP port")
+    parser.add_argument("--workers", type=int, help="worker processes, defaults to the cpu count")
+    args = parser.parse_args(argv)
+    asyncio.run(serve(args.host, args.port, args.unix_socket, args.workers))
+
+
+if __name__ == "__main__":
+    main()
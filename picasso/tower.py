@@ -0,0 +1,84 @@
+from enum import Enum
+
+from picasso.models import Animal, Color, Floor, PicassoTowerFloor
+
+EMPTY = -1
+
+COLORS_ROW = 0
+ANIMALS_ROW = 1
+
+# A full assignment of the tower: the color indices and the animal indices by floor index (floor number - 1).
+CompactTower = tuple[tuple[int, ...], tuple[int, ...]]
+
+# A tower that is still being filled: same layout as CompactTower but mutable and with EMPTY for unknown cells.
+PartialTower = tuple[list[int], list[int]]
+
+# The floors every color and every animal can still be on, as a bitset of floor indices for every item of a row:
+# domains[row_index][item] has bit floor set if the item can be on the floor.
+Domains = tuple[list[int], list[int]]
+
+
+class TowerSpec(object):
+    """
+    The colors and animals the tower floors hold, the tower has a floor for every color and for every animal.
+    For example, a seven floors tower:
+        TowerSpec(SevenColors, SevenAnimals)
+    Its floors are numbered from 1 to 7, floors above the fifth are given as plain ints.
+    """
+
+    def __init__(self, color_type: type[Enum], animal_type: type[Enum]):
+        if len(color_type) != len(animal_type):
+            raise ValueError(f"Got {len(color_type)} colors and {len(animal_type)} animals, must be the same amount")
+        self.color_type = color_type
+        self.animal_type = animal_type
+        self.floors_amount = len(color_type)
+        self.colors: tuple[Enum, ...] = tuple(color_type)
+        self.animals: tuple[Enum, ...] = tuple(animal_type)
+        self.color_index: dict[Enum, int] = {color: index for index, color in enumerate(self.colors)}
+        self.animal_index: dict[Enum, int] = {animal: index for index, animal in enumerate(self.animals)}
+
+    def floor_index(self, floor: int) -> int:
+        """
+        Get the index of the floor inside a compact tower.
+        """
+        if not Floor.First <= floor <= self.floors_amount:
+            raise ValueError(f"Got floor {floor}, the tower floors are 1 to {self.floors_amount}")
+        return floor - Floor.First
+
+    def new_partial_tower(self) -> PartialTower:
+        """
+        Create a partial tower without any known color or animal.
+        """
+        return [EMPTY] * self.floors_amount, [EMPTY] * self.floors_amount
+
+
+DEFAULT_TOWER_SPEC = TowerSpec(Color, Animal)
+
+
+def encode_tower(tower: dict[int, PicassoTowerFloor], spec: TowerSpec = DEFAULT_TOWER_SPEC) -> PartialTower:
+    """
+    Convert a tower of PicassoTowerFloor objects to its compact representation.
+    """
+    colors, animals = spec.new_partial_tower()
+    for floor, tower_floor in tower.items():
+        if tower_floor.color is not None:
+            colors[spec.floor_index(floor)] = spec.color_index[tower_floor.color]
+        if tower_floor.animal is not None:
+            animals[spec.floor_index(floor)] = spec.animal_index[tower_floor.animal]
+    return colors, animals
+
+
+def decode_tower(
+    tower: CompactTower | PartialTower, spec: TowerSpec = DEFAULT_TOWER_SPEC
+) -> dict[int, PicassoTowerFloor]:
+    """
+    Convert a compact tower back to a tower of PicassoTowerFloor objects, keyed by the floor numbers.
+    """
+    colors, animals = tower
+    return {
+        floor: PicassoTowerFloor(
+            color=spec.colors[color] if color != EMPTY else None,
+            animal=spec.animals[animal] if animal != EMPTY else None,
+        )
+        for floor, (color, animal) in enumerate(zip(colors, animals), start=Floor.First)
+    }
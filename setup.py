@@ -1,4 +1,4 @@
-from distutils.core import setup
+from setuptools import setup
 
 setup(
     name="picasso",
@@ -6,9 +6,13 @@ setup(
     author="Ido Buenos",
     author_email="buenos.work@gmail.com",
     packages=["picasso"],
-    install_requires=["pydantic==1.10.6"],
+    entry_points={"console_scripts": ["picasso-count = picasso.cli:main", "picasso-server = picasso.server:main"]},
     extras_require={
+        "numpy": ["numpy==1.24.2"],
+        "pydantic": ["pydantic==1.10.6"],
         "dev": [
+            "numpy==1.24.2",
+            "pydantic==1.10.6",
             "pytest==7.2.2",
             "isort==5.12.0",
             "black==23.1.0",
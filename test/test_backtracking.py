@@ -0,0 +1,69 @@
+from test.test_count_assignments import (
+    TEST_ALL_HINT_TYPES,
+    TEST_ALL_NEIGHBOR_HINT_KINDS,
+    TEST_ALL_RELATIVE_HINT_KINDS,
+    TEST_ALMOST_FULL_TOWER,
+    TEST_SMALL_AMOUNT_OF_HINTS,
+)
+
+import pytest
+
+from picasso._backtracking import count_solutions, get_independent_components
+from picasso._count_assignments import generate_all_floor_combinations, insert_hints
+from picasso.hints import AbsoluteHint, Hint, NeighborHint, RelativeHint, get_specific_hints
+from picasso.models import Animal, Color
+from picasso.tower import DEFAULT_TOWER_SPEC
+
+
+@pytest.mark.parametrize(
+    "hints",
+    [
+        TEST_ALMOST_FULL_TOWER,
+        TEST_ALL_HINT_TYPES,
+        TEST_SMALL_AMOUNT_OF_HINTS,
+        TEST_ALL_RELATIVE_HINT_KINDS,
+        TEST_ALL_NEIGHBOR_HINT_KINDS,
+    ],
+)
+@pytest.mark.parametrize("insert_hints_first", [True, False])
+def test_count_solutions_same_as_enumeration(hints: list[Hint], insert_hints_first: bool) -> None:
+    specific_hints = get_specific_hints(hints)
+    tower = DEFAULT_TOWER_SPEC.new_partial_tower()
+    if insert_hints_first:
+        insert_hints(tower, specific_hints)
+    expected_count = sum(
+        all(specific_hint.validate(floors_combination) for specific_hint in specific_hints)
+        for floors_combination in generate_all_floor_combinations(tower)
+    )
+
+    assert count_solutions(tower, specific_hints) == expected_count
+
+
+def test_independent_components() -> None:
+    color_hint, animal_hint, mixed_hint = get_specific_hints(
+        [
+            NeighborHint(Color.Red, Color.Blue),
+            RelativeHint(Animal.Frog, Animal.Bird, 2),
+            AbsoluteHint(Color.Green, Animal.Rabbit),
+        ]
+    )
+
+    assert get_independent_components([color_hint, animal_hint], 2) == [((0,), [color_hint]), ((1,), [animal_hint])]
+    assert get_independent_components([color_hint, animal_hint, mixed_hint], 2) == [
+        ((0, 1), [color_hint, animal_hint, mixed_hint])
+    ]
+
+
+@pytest.mark.parametrize("at_most", [None, 1, 7, 48, 100])
+def test_count_independent_components(at_most: int | None) -> None:
+    specific_hints = get_specific_hints(
+        [
+            NeighborHint(Color.Red, Color.Blue),
+            NeighborHint(Color.Green, Color.Yellow),
+            RelativeHint(Animal.Frog, Animal.Bird, 2),
+        ]
+    )
+    # 24 colors permutations and 18 animals permutations.
+    expected_count = 24 * 18 if at_most is None else min(24 * 18, at_most)
+
+    assert count_solutions(DEFAULT_TOWER_SPEC.new_partial_tower(), specific_hints, at_most) == expected_count
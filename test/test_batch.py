@@ -0,0 +1,43 @@
+from test.test_count_assignments import (
+    TEST_ALL_HINT_TYPES,
+    TEST_ALL_NEIGHBOR_HINT_KINDS,
+    TEST_ALL_RELATIVE_HINT_KINDS,
+    TEST_ALMOST_FULL_TOWER,
+    TEST_NO_HINTS_RESULT_IN_ALL_ASSIGNMENTS_POSSIBLE,
+    TEST_OVERLAPPING_HINTS_RESULT_IN_ZERO_POSSIBLE_ASSIGNMENTS,
+    TEST_SMALL_AMOUNT_OF_HINTS,
+)
+
+import pytest
+
+from picasso._batch import count_assignments_many
+from picasso._count_assignments import count_assignments
+from picasso._serialization import deserialize_hints, serialize_hints
+from picasso.hints import Hint
+
+TEST_HINT_SETS: list[list[Hint]] = [
+    TEST_ALMOST_FULL_TOWER,
+    TEST_ALL_HINT_TYPES,
+    TEST_SMALL_AMOUNT_OF_HINTS,
+    TEST_NO_HINTS_RESULT_IN_ALL_ASSIGNMENTS_POSSIBLE,
+    TEST_OVERLAPPING_HINTS_RESULT_IN_ZERO_POSSIBLE_ASSIGNMENTS,
+    TEST_ALL_RELATIVE_HINT_KINDS,
+    TEST_ALL_NEIGHBOR_HINT_KINDS,
+]
+
+
+@pytest.mark.parametrize("hints", TEST_HINT_SETS)
+def test_serialized_hints_count_the_same(hints: list[Hint]) -> None:
+    serialized_hints = serialize_hints(hints)
+
+    assert all(isinstance(value, int) for serialized_hint in serialized_hints for value in serialized_hint)
+    assert count_assignments(deserialize_hints(serialized_hints)) == count_assignments(hints)
+
+
+@pytest.mark.parametrize("workers,chunk_size", [(1, None), (2, None), (2, 3)])
+def test_count_assignments_many_keeps_input_order(workers: int, chunk_size: int | None) -> None:
+    hint_sets = TEST_HINT_SETS * 3
+
+    counts = count_assignments_many(hint_sets, workers=workers, chunk_size=chunk_size)
+
+    assert counts == [count_assignments(hints) for hints in hint_sets]
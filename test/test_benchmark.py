@@ -0,0 +1,57 @@
+from random import Random
+
+import pytest
+
+from benchmark.hints_generator import Density, generate_hints
+from benchmark.runner import COLD_START, COLD_START_STAGES, STAGES, format_results, get_percentile, run_benchmark
+from picasso._count_assignments import count_assignments
+
+
+@pytest.mark.parametrize("density", Density)
+def test_generate_hints(density: Density) -> None:
+    rng = Random(0)
+    for _ in range(20):
+        assert (count_assignments(generate_hints(rng, density)) == 0) == (density == Density.Contradictory)
+
+
+def test_generate_hints_is_seeded() -> None:
+    first_hints = generate_hints(Random(1), Density.Medium)
+    second_hints = generate_hints(Random(1), Density.Medium)
+
+    assert [vars(hint) for hint in first_hints] == [vars(hint) for hint in second_hints]
+
+
+def test_get_percentile() -> None:
+    values = [float(value) for value in range(1, 101)]
+
+    assert get_percentile(values, 50) == 50
+    assert get_percentile(values, 99) == 99
+    assert get_percentile([3.0], 99) == 3
+
+
+def test_run_benchmark() -> None:
+    results = run_benchmark(seed=0, sets_amount=3, cold_starts_amount=0)
+
+    assert list(results) == [density.value for density in Density]
+    assert all(set(STAGES).issubset(density_results) for density_results in results.values())
+
+
+def test_run_benchmark_cold_start() -> None:
+    results = run_benchmark(seed=0, sets_amount=1, cold_starts_amount=1)
+
+    assert set(results[COLD_START]) == set(COLD_START_STAGES)
+    assert f"{COLD_START}:" in format_results(results, baseline=results)
+
+
+def test_format_results_with_missing_baseline_stage() -> None:
+    # Baselines recorded before the domains propagation have no propagate_domains stage.
+    results = run_benchmark(seed=0, sets_amount=1, cold_starts_amount=0)
+    baseline = {
+        density: {stage: latencies for stage, latencies in density_results.items() if stage != "propagate_domains"}
+        for density, density_results in results.items()
+    }
+
+    lines = format_results(results, baseline).splitlines()
+
+    assert all("n/a" in line for line in lines if line.strip().startswith("propagate_domains"))
+    assert all(" x" in line and "n/a" not in line for line in lines if line.strip().startswith("enumeration"))
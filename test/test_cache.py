@@ -0,0 +1,47 @@
+from test.test_count_assignments import TEST_ALL_HINT_TYPES, TEST_SMALL_AMOUNT_OF_HINTS
+
+from picasso._cache import DEFAULT_CACHE_SIZE, CacheStats, CountAssignmentsCache
+from picasso.hints import AbsoluteHint, NeighborHint, RelativeHint, get_canonical_hints, get_specific_hints
+from picasso.models import Animal, Color, Floor
+
+
+def test_canonical_hints_ignore_order_and_swapped_attributes() -> None:
+    hints = [
+        AbsoluteHint(Animal.Frog, Floor.Fifth),
+        NeighborHint(Color.Red, Color.Green),
+        RelativeHint(Animal.Rabbit, Color.Blue, -2),
+    ]
+    equivalent_hints = [
+        RelativeHint(Color.Blue, Animal.Rabbit, 2),
+        NeighborHint(Color.Green, Color.Red),
+        AbsoluteHint(Floor.Fifth, Animal.Frog),
+        AbsoluteHint(Animal.Frog, Floor.Fifth),
+    ]
+
+    assert get_canonical_hints(get_specific_hints(hints)) == get_canonical_hints(get_specific_hints(equivalent_hints))
+    assert get_canonical_hints(get_specific_hints(hints)) != get_canonical_hints(
+        get_specific_hints([RelativeHint(Animal.Rabbit, Color.Blue, 2)])
+    )
+
+
+def test_count_assignments_cache() -> None:
+    cache = CountAssignmentsCache(maxsize=1)
+
+    assert cache.count_assignments(TEST_SMALL_AMOUNT_OF_HINTS) == 1728
+    assert cache.count_assignments(list(reversed(TEST_SMALL_AMOUNT_OF_HINTS))) == 1728
+    assert cache.count_assignments(TEST_ALL_HINT_TYPES) == 4
+    assert cache.count_assignments(TEST_SMALL_AMOUNT_OF_HINTS) == 1728
+    assert cache.cache_info() == CacheStats(hits=1, misses=3, maxsize=1, currsize=1)
+
+    cache.cache_clear()
+    assert cache.cache_info() == CacheStats(hits=0, misses=0, maxsize=1, currsize=0)
+
+
+def test_neighbor_hints_of_the_edge_floors_share_the_cache() -> None:
+    cache = CountAssignmentsCache()
+
+    assert cache.count_assignments([NeighborHint(Floor.First, Color.Red)]) == 24 * 120
+    assert cache.count_assignments([AbsoluteHint(Floor.Second, Color.Red)]) == 24 * 120
+    assert cache.count_assignments([NeighborHint(Animal.Frog, Floor.Fifth)]) == 24 * 120
+    assert cache.count_assignments([AbsoluteHint(Animal.Frog, Floor.Fourth)]) == 24 * 120
+    assert cache.cache_info() == CacheStats(hits=2, misses=2, maxsize=DEFAULT_CACHE_SIZE, currsize=2)
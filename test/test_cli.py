@@ -0,0 +1,103 @@
+import json
+from io import StringIO
+from pathlib import Path
+from test.test_batch import TEST_HINT_SETS
+from typing import Any
+
+import pytest
+
+from picasso._count_assignments import count_assignments
+from picasso._serialization import hint_from_json, hint_to_json
+from picasso.cli import count_jsonl, main
+from picasso.hints import Hint
+
+TEST_LINES = [
+    json.dumps({"id": index, "hints": [hint_to_json(hint) for hint in hints]})
+    for index, hints in enumerate(TEST_HINT_SETS)
+]
+
+
+@pytest.mark.parametrize("hints", TEST_HINT_SETS)
+def test_json_hints_count_the_same(hints: list[Hint]) -> None:
+    json_hints = json.loads(json.dumps([hint_to_json(hint) for hint in hints]))
+
+    assert count_assignments([hint_from_json(hint_record) for hint_record in json_hints]) == count_assignments(hints)
+
+
+@pytest.mark.parametrize("workers,chunk_size,offset", [(1, 100, 0), (2, 1, 0), (2, 2, 3)])
+def test_count_jsonl_keeps_input_order(workers: int, chunk_size: int, offset: int) -> None:
+    output = StringIO()
+
+    count_jsonl(TEST_LINES * 2, output, workers, chunk_size, offset)
+
+    expected_results = [
+        {
+            "offset": offset,
+            "id": offset % len(TEST_HINT_SETS),
+            "count": count_assignments(TEST_HINT_SETS[offset % len(TEST_HINT_SETS)]),
+        }
+        for offset in range(offset, len(TEST_LINES) * 2)
+    ]
+    assert [json.loads(line) for line in output.getvalue().splitlines()] == expected_results
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "not json",
+        '{"hints": 3}',
+        '{"hints": [{"kind": "BadHint", "attr1": 1, "attr2": 2}]}',
+        '{"hints": [{"kind": "AbsoluteHint", "attr1": "Purple", "attr2": 2}]}',
+        '{"hints": [{"kind": "RelativeHint", "attr1": "Red", "attr2": 2}]}',
+        '{"hints": [{"kind": "AbsoluteHint", "attr1": "Red", "attr2": 6}]}',
+    ],
+)
+def test_count_jsonl_reports_bad_records(line: str) -> None:
+    output = StringIO()
+
+    count_jsonl([TEST_LINES[0], line, TEST_LINES[1]], output, workers=1)
+
+    first_result, bad_result, last_result = [json.loads(result) for result in output.getvalue().splitlines()]
+    assert "count" in first_result and "count" in last_result
+    assert bad_result["offset"] == 1 and "error" in bad_result and "count" not in bad_result
+
+
+def test_main_reads_files(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    hints_path = tmp_path / "hints.jsonl"
+    hints_path.write_text("".join(f"{line}\n" for line in TEST_LINES))
+
+    main([str(hints_path), str(hints_path), "--workers", "1", "--offset", "2", "--at-most", "10"])
+
+    results = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [result["offset"] for result in results] == list(range(2, len(TEST_LINES) * 2))
+    assert all(result["count"] <= 10 for result in results)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_count_jsonl_with_store(tmp_path: Path, workers: int) -> None:
+    store_path = tmp_path / "results.sqlite3"
+    output = StringIO()
+    stored_output = StringIO()
+
+    count_jsonl(TEST_LINES, output, workers=1)
+    count_jsonl(TEST_LINES * 2, stored_output, workers, chunk_size=2, store_path=store_path)
+
+    assert stored_output.getvalue().splitlines()[: len(TEST_LINES)] == output.getvalue().splitlines()
+    assert store_path.exists()
+
+
+def test_count_jsonl_reports_failing_records(monkeypatch: pytest.MonkeyPatch) -> None:
+    def count_or_fail(hints: list[Hint], *args: Any) -> int:
+        if list(map(hint_to_json, hints)) == list(map(hint_to_json, TEST_HINT_SETS[1])):
+            raise OverflowError("Too big to count")
+        return count_assignments(hints, *args)
+
+    monkeypatch.setattr("picasso.cli.count_assignments", count_or_fail)
+    output = StringIO()
+
+    count_jsonl(TEST_LINES[:3], output, workers=1)
+
+    first_result, failed_result, last_result = [json.loads(result) for result in output.getvalue().splitlines()]
+    assert first_result["count"] == count_assignments(TEST_HINT_SETS[0])
+    assert failed_result == {"offset": 1, "id": 1, "error": "Too big to count"}
+    assert last_result["count"] == count_assignments(TEST_HINT_SETS[2])
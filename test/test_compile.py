@@ -0,0 +1,81 @@
+from pathlib import Path
+from test.test_count_assignments import (
+    TEST_ALL_HINT_TYPES,
+    TEST_ALL_NEIGHBOR_HINT_KINDS,
+    TEST_ALL_RELATIVE_HINT_KINDS,
+    TEST_ALMOST_FULL_TOWER,
+    TEST_SMALL_AMOUNT_OF_HINTS,
+)
+from test.test_tower_sizes import SIX_FLOORS_SPEC, SixColors
+
+import pytest
+
+from picasso._compile import CompiledHint, compile_hints
+from picasso._count_assignments import count_assignments, generate_all_floor_combinations
+from picasso._index import get_bitset, get_index
+from picasso._marginals import assignment_marginals
+from picasso.hints import Hint, NeighborHint, get_specific_hints
+from picasso.models import Animal, Color, CountingEngine, Floor
+from picasso.tower import DEFAULT_TOWER_SPEC, TowerSpec
+
+TEST_HINT_SETS = [
+    TEST_ALMOST_FULL_TOWER,
+    TEST_ALL_HINT_TYPES,
+    TEST_SMALL_AMOUNT_OF_HINTS,
+    TEST_ALL_RELATIVE_HINT_KINDS,
+    TEST_ALL_NEIGHBOR_HINT_KINDS,
+]
+
+
+@pytest.mark.parametrize("hints", TEST_HINT_SETS)
+def test_compiled_hints_validate_like_specific_hints(hints: list[Hint]) -> None:
+    specific_hints = get_specific_hints(hints)
+    compiled_hints = compile_hints(hints)
+
+    for floors_combination in generate_all_floor_combinations(DEFAULT_TOWER_SPEC.new_partial_tower()):
+        assert [hint.validate(floors_combination) for hint in compiled_hints] == [
+            hint.validate(floors_combination) for hint in specific_hints
+        ]
+
+
+@pytest.mark.parametrize("hints", TEST_HINT_SETS)
+def test_compiled_hints_are_reusable(hints: list[Hint]) -> None:
+    compiled_hints: list[Hint] = list(compile_hints(hints))
+
+    assert count_assignments(compiled_hints) == count_assignments(hints)
+    assert count_assignments(compiled_hints) == count_assignments(hints)
+
+
+def test_compiled_hint_is_frozen() -> None:
+    compiled_hint = compile_hints(TEST_SMALL_AMOUNT_OF_HINTS)[0]
+
+    assert isinstance(compiled_hint, CompiledHint)
+    assert not hasattr(compiled_hint, "__dict__")
+    with pytest.raises(AttributeError):
+        compiled_hint.base_floor = 1
+
+
+def test_compiled_hints_are_tied_to_their_tower(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    get_index.cache_clear()
+    hints: list[Hint] = [NeighborHint(SixColors.Red, Floor.Fifth)]
+    default_compiled_hints: list[Hint] = list(compile_hints([NeighborHint(Color.Red, Floor.Fifth)]))
+    six_floors_compiled_hints: list[Hint] = list(compile_hints(hints, SIX_FLOORS_SPEC))
+
+    assert count_assignments(six_floors_compiled_hints, spec=SIX_FLOORS_SPEC) == count_assignments(
+        hints, spec=SIX_FLOORS_SPEC
+    )
+    assert count_assignments(default_compiled_hints, spec=TowerSpec(Color, Animal)) == count_assignments(
+        [NeighborHint(Color.Red, Floor.Fifth)]
+    )
+    with pytest.raises(ValueError):
+        count_assignments(default_compiled_hints, spec=SIX_FLOORS_SPEC)
+    with pytest.raises(ValueError):
+        count_assignments(six_floors_compiled_hints)
+    with pytest.raises(ValueError):
+        count_assignments(six_floors_compiled_hints, CountingEngine.Index)
+    with pytest.raises(ValueError):
+        assignment_marginals(six_floors_compiled_hints, CountingEngine.Index)
+    with pytest.raises(ValueError):
+        get_bitset(six_floors_compiled_hints[0], DEFAULT_TOWER_SPEC)
+    get_index.cache_clear()
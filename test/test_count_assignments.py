@@ -1,8 +1,19 @@
+from importlib.util import find_spec
+
 import pytest
 
-from picasso._count_assignments import count_assignments
-from picasso.hints import AbsoluteHint, Hint, NeighborHint, RelativeHint
-from picasso.models import Animal, Color, Floor
+from picasso._count_assignments import count_assignments, insert_hints
+from picasso.hints import AbsoluteHint, Hint, NeighborHint, RelativeHint, get_specific_hints
+from picasso.hints_utils import complete_last_available_option
+from picasso.models import Animal, Color, CountingEngine, Floor
+from picasso.tower import DEFAULT_TOWER_SPEC
+
+ENGINES = [
+    CountingEngine.Backtracking,
+    pytest.param(
+        CountingEngine.NumPy, marks=pytest.mark.skipif(find_spec("numpy") is None, reason="numpy is not installed")
+    ),
+]
 
 TEST_ALMOST_FULL_TOWER = [
     AbsoluteHint(Animal.Rabbit, Floor.First),
@@ -86,6 +97,19 @@ TEST_ALL_NEIGHBOR_HINT_KINDS = [
     NeighborHint(Animal.Rabbit, Color.Blue),
 ]
 
+TEST_SAME_COLOR_ON_TWO_FLOORS_RESULT_IN_ZERO_POSSIBLE_ASSIGNMENTS = [
+    AbsoluteHint(Floor.First, Color.Red),
+    AbsoluteHint(Floor.Second, Color.Red),
+]
+
+TEST_COLOR_ANIMAL_HINT_ON_ALREADY_KNOWN_FLOOR = [
+    RelativeHint(Color.Yellow, Animal.Rabbit, 4),
+    RelativeHint(Color.Yellow, Animal.Bird, 3),
+    NeighborHint(Animal.Bird, Animal.Chicken),
+    AbsoluteHint(Animal.Frog, Color.Yellow),
+    AbsoluteHint(Animal.Bird, Floor.Second),
+]
+
 
 @pytest.mark.parametrize(
     "hints,expected_count",
@@ -101,8 +125,33 @@ TEST_ALL_NEIGHBOR_HINT_KINDS = [
         (TEST_ALL_ABSOLUTE_HINT_KINDS, 36),
         (TEST_ALL_RELATIVE_HINT_KINDS, 12),
         (TEST_ALL_NEIGHBOR_HINT_KINDS, 2),
+        (TEST_SAME_COLOR_ON_TWO_FLOORS_RESULT_IN_ZERO_POSSIBLE_ASSIGNMENTS, 0),
+        (TEST_COLOR_ANIMAL_HINT_ON_ALREADY_KNOWN_FLOOR, 24),
     ],
 )
-def test_count_assignments(hints: list[Hint], expected_count: int) -> None:
-    result_count = count_assignments(hints)
+@pytest.mark.parametrize("engine", ENGINES)
+def test_count_assignments(hints: list[Hint], expected_count: int, engine: CountingEngine) -> None:
+    result_count = count_assignments(hints, engine)
     assert result_count == expected_count, f"Test failed, expected count {expected_count} but got {result_count}"
+
+
+@pytest.mark.parametrize(
+    "hints",
+    [
+        TEST_ALMOST_FULL_TOWER,
+        TEST_ALL_HINT_TYPES,
+        TEST_ALL_RELATIVE_HINT_KINDS,
+        TEST_FULL_TOWER_RESULT_IN_ONE_POSSIBLE_ASSIGNMENT,
+    ],
+)
+def test_insert_hints_reaches_fixed_point(hints: list[Hint]) -> None:
+    specific_hints = get_specific_hints(hints)
+    tower = DEFAULT_TOWER_SPEC.new_partial_tower()
+    insert_hints(tower, specific_hints)
+    inserted_tower = (list(tower[0]), list(tower[1]))
+
+    for specific_hint in specific_hints:
+        specific_hint.insert(tower)
+    complete_last_available_option(tower)
+
+    assert tower == inserted_tower
@@ -0,0 +1,71 @@
+from test.test_count_assignments import (
+    ENGINES,
+    TEST_ALL_HINT_TYPES,
+    TEST_ALL_NEIGHBOR_HINT_KINDS,
+    TEST_ALMOST_FULL_TOWER,
+)
+
+import pytest
+
+from picasso._backtracking import count_solutions
+from picasso._count_assignments import count_assignments
+from picasso._domains import propagate_domains, prune_all_different
+from picasso.hints import Hint, RelativeHint, get_specific_hints
+from picasso.hints_utils import ContradictingHintsError
+from picasso.models import Animal, Color, CountingEngine
+from picasso.tower import DEFAULT_TOWER_SPEC, EMPTY
+
+
+def test_propagate_domains_inserts_single_floor_items() -> None:
+    tower = DEFAULT_TOWER_SPEC.new_partial_tower()
+    colors_domains, animals_domains = propagate_domains(
+        tower, get_specific_hints([RelativeHint(Color.Red, Color.Blue, -4)])
+    )
+
+    red, blue = DEFAULT_TOWER_SPEC.color_index[Color.Red], DEFAULT_TOWER_SPEC.color_index[Color.Blue]
+
+    assert {colors_domains[red], colors_domains[blue]} == {0b00001, 0b10000}
+    assert animals_domains == [0b11111] * 5
+    assert {tower[0][0], tower[0][4]} == {red, blue}
+    assert tower[1] == [EMPTY] * 5
+
+
+def test_prune_all_different() -> None:
+    # The first two items can only be on the first two floors, so the rest are left with the other floors,
+    # and the last floor can only hold the last item.
+    row_domains = [0b0011, 0b0011, 0b0111, 0b1111]
+
+    assert prune_all_different(row_domains, 0, 0b1111)
+    assert row_domains == [0b0011, 0b0011, 0b0100, 0b1000]
+
+
+@pytest.mark.parametrize("row_domains", [[0b0001, 0b0001, 0b1110, 0b1110], [0b0011, 0b0011, 0b0011, 0b1111]])
+def test_prune_all_different_contradiction(row_domains: list[int]) -> None:
+    with pytest.raises(ContradictingHintsError):
+        prune_all_different(row_domains, 0, 0b1111)
+
+
+def test_propagate_domains_contradiction() -> None:
+    hints = get_specific_hints(
+        [RelativeHint(Animal.Frog, Animal.Bird, -4), RelativeHint(Animal.Rabbit, Animal.Bird, -4)]
+    )
+
+    with pytest.raises(ContradictingHintsError):
+        propagate_domains(DEFAULT_TOWER_SPEC.new_partial_tower(), hints)
+
+
+@pytest.mark.parametrize("hints", [TEST_ALMOST_FULL_TOWER, TEST_ALL_HINT_TYPES, TEST_ALL_NEIGHBOR_HINT_KINDS])
+def test_count_solutions_with_domains(hints: list[Hint]) -> None:
+    specific_hints = get_specific_hints(hints)
+    tower = DEFAULT_TOWER_SPEC.new_partial_tower()
+    domains = propagate_domains(tower, specific_hints)
+
+    assert count_solutions(tower, specific_hints, domains=domains) == count_solutions(
+        DEFAULT_TOWER_SPEC.new_partial_tower(), specific_hints
+    )
+
+
+@pytest.mark.parametrize("difference", [10**9, 10**20, -(10**20)])
+@pytest.mark.parametrize("engine", ENGINES)
+def test_huge_differences_count_zero(difference: int, engine: CountingEngine) -> None:
+    assert count_assignments([RelativeHint(Color.Red, Animal.Frog, difference)], engine) == 0
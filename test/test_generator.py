@@ -0,0 +1,41 @@
+import pytest
+
+from picasso import Difficulty, generate_puzzle
+from picasso._count_assignments import count_assignments
+from picasso.hints import AbsoluteHint, get_specific_hints
+from picasso.tower import encode_tower
+
+
+@pytest.mark.parametrize("difficulty", Difficulty)
+@pytest.mark.parametrize("size", [3, 5])
+def test_generate_puzzle_is_minimal_and_unique(size: int, difficulty: Difficulty) -> None:
+    for seed in range(10):
+        hints, solution, spec = generate_puzzle(seed, size, difficulty)
+        compact_solution = encode_tower(solution, spec)
+
+        assert all(hint.validate(compact_solution) for hint in get_specific_hints(hints, spec))
+        assert count_assignments(hints, spec=spec) == 1
+        for hint in hints:
+            other_hints = [other_hint for other_hint in hints if other_hint is not hint]
+            assert count_assignments(other_hints, spec=spec, at_most=2) == 2
+
+
+def test_generate_puzzle_is_seeded() -> None:
+    first_puzzle = generate_puzzle(7)
+    second_puzzle = generate_puzzle(7)
+
+    assert first_puzzle.solution == second_puzzle.solution
+    assert [vars(hint) for hint in first_puzzle.hints] == [vars(hint) for hint in second_puzzle.hints]
+
+
+def test_hard_puzzles_have_no_floors() -> None:
+    for seed in range(10):
+        hints = generate_puzzle(seed, difficulty=Difficulty.Hard).hints
+
+        assert not any(isinstance(hint, AbsoluteHint) for hint in hints)
+        assert not any(isinstance(vars(hint)[attr], int) for hint in hints for attr in ("attr1", "attr2"))
+
+
+def test_generate_puzzle_rejects_big_towers() -> None:
+    with pytest.raises(ValueError):
+        generate_puzzle(0, 7)
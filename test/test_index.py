@@ -0,0 +1,54 @@
+from enum import Enum
+from pathlib import Path
+from test.test_batch import TEST_HINT_SETS
+from test.test_tower_sizes import SixAnimals, SixColors
+
+import pytest
+
+from picasso._count_assignments import count_assignments
+from picasso._index import HintsIndex, get_default_index_path, get_index, get_spec_fingerprint
+from picasso.hints import Hint, RelativeHint, get_specific_hints
+from picasso.models import Animal, Color, CountingEngine
+from picasso.tower import DEFAULT_TOWER_SPEC, TowerSpec
+
+FourColors = Enum("FourColors", ["Red", "Green", "Blue", "Yellow"])
+FourAnimals = Enum("FourAnimals", ["Frog", "Rabbit", "Bird", "Chicken"])
+
+
+@pytest.fixture(scope="module")
+def index(tmp_path_factory: pytest.TempPathFactory) -> HintsIndex:
+    return HintsIndex(tmp_path_factory.mktemp("index") / "hints_index.bin")
+
+
+@pytest.mark.parametrize("hints", TEST_HINT_SETS + [[RelativeHint(Color.Red, Animal.Frog, 7)]])
+def test_index_counts_the_same(index: HintsIndex, hints: list[Hint]) -> None:
+    assert index.count(get_specific_hints(hints)) == count_assignments(hints)
+
+
+def test_index_engine(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    get_index.cache_clear()
+    hints = TEST_HINT_SETS[0]
+
+    assert count_assignments(hints, CountingEngine.Index) == count_assignments(hints)
+    assert count_assignments(hints, CountingEngine.Index, at_most=1) == min(count_assignments(hints), 1)
+    assert get_default_index_path().parent == tmp_path / "picasso"
+    get_index.cache_clear()
+
+
+def test_index_is_rebuilt_for_other_enums(tmp_path: Path) -> None:
+    index_path = tmp_path / "hints_index.bin"
+    HintsIndex(index_path).close()
+    spec = TowerSpec(FourColors, FourAnimals)
+    hints: list[Hint] = [RelativeHint(FourColors.Red, FourAnimals.Frog, 3)]
+
+    index = HintsIndex(index_path, spec)
+
+    assert get_spec_fingerprint(spec) != get_spec_fingerprint(DEFAULT_TOWER_SPEC)
+    assert index.count(get_specific_hints(hints, spec)) == count_assignments(hints, spec=spec)
+    index.close()
+
+
+def test_index_rejects_big_towers(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        HintsIndex(tmp_path / "hints_index.bin", TowerSpec(SixColors, SixAnimals))
@@ -0,0 +1,42 @@
+from test.test_count_assignments import (
+    TEST_ALL_HINT_TYPES,
+    TEST_ALL_RELATIVE_HINT_KINDS,
+    TEST_FULL_TOWER_RESULT_IN_ONE_POSSIBLE_ASSIGNMENT,
+    TEST_OVERLAPPING_HINTS_RESULT_IN_ZERO_POSSIBLE_ASSIGNMENTS,
+)
+from test.test_tower_sizes import TEN_FLOORS_SPEC
+
+import pytest
+
+from picasso._count_assignments import count_assignments, iter_assignments
+from picasso.hints import Hint, get_specific_hints
+from picasso.models import Animal, Color, Floor, PicassoTowerFloor
+
+
+@pytest.mark.parametrize(
+    "hints",
+    [TEST_ALL_HINT_TYPES, TEST_ALL_RELATIVE_HINT_KINDS, TEST_OVERLAPPING_HINTS_RESULT_IN_ZERO_POSSIBLE_ASSIGNMENTS],
+)
+def test_iter_compact_assignments(hints: list[Hint]) -> None:
+    assignments = list(iter_assignments(hints, compact=True))
+    specific_hints = get_specific_hints(hints)
+
+    assert len(assignments) == len(set(assignments)) == count_assignments(hints)
+    assert all(hint.validate(assignment) for assignment in assignments for hint in specific_hints)
+
+
+def test_iter_assignments_decoded() -> None:
+    (assignment,) = iter_assignments(TEST_FULL_TOWER_RESULT_IN_ONE_POSSIBLE_ASSIGNMENT)
+
+    assert assignment == {
+        Floor.First: PicassoTowerFloor(color=Color.Yellow, animal=Animal.Rabbit),
+        Floor.Second: PicassoTowerFloor(color=Color.Green, animal=Animal.Chicken),
+        Floor.Third: PicassoTowerFloor(color=Color.Red, animal=Animal.Frog),
+        Floor.Fourth: PicassoTowerFloor(color=Color.Orange, animal=Animal.Grasshopper),
+        Floor.Fifth: PicassoTowerFloor(color=Color.Blue, animal=Animal.Bird),
+    }
+
+
+@pytest.mark.parametrize("limit", [0, 1, 3])
+def test_iter_assignments_limit_on_huge_tower(limit: int) -> None:
+    assert len(list(iter_assignments([], limit=limit, compact=True, spec=TEN_FLOORS_SPEC))) == limit
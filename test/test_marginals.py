@@ -0,0 +1,58 @@
+from pathlib import Path
+from test.test_batch import TEST_HINT_SETS
+from test.test_count_assignments import ENGINES
+from test.test_index import FourAnimals, FourColors
+from typing import Iterator
+
+import pytest
+
+from picasso._count_assignments import iter_assignments
+from picasso._index import get_index
+from picasso._marginals import Marginals, assignment_marginals
+from picasso.hints import AbsoluteHint, Hint, RelativeHint
+from picasso.models import Color, CountingEngine, Floor
+from picasso.tower import DEFAULT_TOWER_SPEC, TowerSpec
+
+
+@pytest.fixture
+def index_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    get_index.cache_clear()
+    yield
+    get_index.cache_clear()
+
+
+def get_enumerated_marginals(hints: list[Hint], spec: TowerSpec = DEFAULT_TOWER_SPEC) -> Marginals:
+    tables = [[[0] * spec.floors_amount for _ in range(spec.floors_amount)] for _ in range(2)]
+    total = 0
+    for assignment in iter_assignments(hints, compact=True, spec=spec):
+        total += 1
+        for table, floor_items in zip(tables, assignment):
+            for floor, item in enumerate(floor_items):
+                table[floor][item] += 1
+    return Marginals(tables[0], tables[1], total)
+
+
+@pytest.mark.parametrize("hints", TEST_HINT_SETS)
+@pytest.mark.parametrize("engine", [*ENGINES, CountingEngine.Index])
+def test_assignment_marginals(hints: list[Hint], engine: CountingEngine, index_cache: None) -> None:
+    assert assignment_marginals(hints, engine) == get_enumerated_marginals(hints)
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_marginals_of_other_tower_sizes(engine: CountingEngine) -> None:
+    spec = TowerSpec(FourColors, FourAnimals)
+    hints: list[Hint] = [RelativeHint(FourColors.Red, FourAnimals.Frog, 1), AbsoluteHint(FourColors.Blue, Floor.First)]
+
+    assert assignment_marginals(hints, engine, spec) == get_enumerated_marginals(hints, spec)
+
+
+def test_marginals_sum_to_the_total() -> None:
+    colors, animals, total = assignment_marginals([RelativeHint(Color.Red, Color.Blue, 2)])
+
+    assert total == 3 * 6 * 120
+    red_cells = [floor_cells[DEFAULT_TOWER_SPEC.color_index[Color.Red]] for floor_cells in colors]
+    assert sorted(red_cells) == [0, 0, 6 * 120, 6 * 120, 6 * 120]
+    for table in (colors, animals):
+        assert all(sum(floor_cells) == total for floor_cells in table)
+        assert all(sum(item_cells) == total for item_cells in zip(*table))
@@ -0,0 +1,38 @@
+from test.test_count_assignments import TEST_ALL_HINT_TYPES
+
+import pytest
+
+from picasso._compile import compile_hints
+from picasso._planner import get_acceptance_rate, plan_hints
+from picasso.hints import AbsoluteHint, Hint, NeighborHint, RelativeHint
+from picasso.models import Animal, Color, Floor
+
+
+@pytest.mark.parametrize(
+    "hint, expected_rate",
+    [
+        (AbsoluteHint(Floor.First, Color.Red), 1 / 5),
+        (AbsoluteHint(Color.Red, Animal.Frog), 5 / 25),
+        (NeighborHint(Color.Red, Color.Blue), 8 / 20),
+        (NeighborHint(Floor.Third, Animal.Frog), 2 / 5),
+        (RelativeHint(Color.Red, Animal.Frog, 4), 1 / 25),
+        (RelativeHint(Animal.Frog, Animal.Frog, 0), 1.0),
+    ],
+)
+def test_acceptance_rate(hint: Hint, expected_rate: float) -> None:
+    assert get_acceptance_rate(compile_hints([hint])[0], 5) == pytest.approx(expected_rate)
+
+
+def test_plan_hints() -> None:
+    compiled_hints = compile_hints(
+        [
+            NeighborHint(Color.Red, Color.Blue),
+            RelativeHint(Color.Red, Animal.Frog, 4),
+            AbsoluteHint(Floor.First, Color.Red),
+        ]
+    )
+
+    assert plan_hints(compiled_hints, 5) == (compiled_hints[2], compiled_hints[1], compiled_hints[0])
+    assert sorted(plan_hints(compile_hints(TEST_ALL_HINT_TYPES), 5), key=repr) == sorted(
+        compile_hints(TEST_ALL_HINT_TYPES), key=repr
+    )
@@ -0,0 +1,40 @@
+from test.test_count_assignments import TEST_ALL_HINT_TYPES, TEST_SMALL_AMOUNT_OF_HINTS
+
+import pytest
+
+from picasso._count_assignments import count_assignments
+from picasso._queries import count_queries
+from picasso.hints import AbsoluteHint, Hint, NeighborHint
+from picasso.models import Animal, Color, Floor
+
+RED_FIRST: list[Hint] = [AbsoluteHint(Color.Red, Floor.First)]
+FROG_NEXT_TO_RED: list[Hint] = [NeighborHint(Animal.Frog, Color.Red)]
+HINT_SETS = {"A": RED_FIRST, "B": FROG_NEXT_TO_RED, "C": TEST_SMALL_AMOUNT_OF_HINTS, "D": TEST_ALL_HINT_TYPES}
+
+
+def test_count_queries() -> None:
+    a_count = count_assignments(RED_FIRST)
+    b_count = count_assignments(FROG_NEXT_TO_RED)
+    a_and_b_count = count_assignments(RED_FIRST + FROG_NEXT_TO_RED)
+
+    assert count_queries(HINT_SETS, ["A", "A & B", "A | B", "A - B", "A ^ B", "~A", "not A and B", "A or B or C"]) == {
+        "A": a_count,
+        "A & B": a_and_b_count,
+        "A | B": a_count + b_count - a_and_b_count,
+        "A - B": a_count - a_and_b_count,
+        "A ^ B": a_count + b_count - 2 * a_and_b_count,
+        "~A": 14400 - a_count,
+        "not A and B": b_count - a_and_b_count,
+        "A or B or C": count_queries(HINT_SETS, ["(A | B) | C"])["(A | B) | C"],
+    }
+
+
+@pytest.mark.parametrize("hint_set", ["C", "D"])
+def test_hint_sets_count_the_same(hint_set: str) -> None:
+    assert count_queries(HINT_SETS, [hint_set])[hint_set] == count_assignments(HINT_SETS[hint_set])
+
+
+@pytest.mark.parametrize("query", ["A +", "A + B", "E", "A < B", "A.color"])
+def test_bad_queries(query: str) -> None:
+    with pytest.raises(ValueError):
+        count_queries(HINT_SETS, [query])
@@ -0,0 +1,42 @@
+from test.test_batch import TEST_HINT_SETS
+
+import pytest
+
+from picasso._count_assignments import count_assignments, iter_assignments
+from picasso._redundancy import find_redundant_hints, minimize_hints
+from picasso.hints import AbsoluteHint, Hint, NeighborHint, RelativeHint
+from picasso.models import Animal, Color, Floor
+
+
+def test_find_redundant_hints() -> None:
+    red_first = AbsoluteHint(Color.Red, Floor.First)
+    red_below_blue = RelativeHint(Color.Red, Color.Blue, -1)
+    blue_second = AbsoluteHint(Floor.Second, Color.Blue)
+    red_next_to_blue = NeighborHint(Color.Blue, Color.Red)
+    frog_fifth = AbsoluteHint(Animal.Frog, Floor.Fifth)
+
+    hints: list[Hint] = [red_first, red_below_blue, blue_second, red_next_to_blue, frog_fifth]
+
+    # Any two of the first three hints imply the third, and each of them implies the neighbor hint.
+    assert find_redundant_hints(hints) == [red_first, red_below_blue, blue_second, red_next_to_blue]
+    assert minimize_hints(hints) == [red_first, red_below_blue, frog_fifth]
+
+
+def test_repeated_hints_are_redundant() -> None:
+    hint = AbsoluteHint(Color.Red, Floor.First)
+    swapped_hint = AbsoluteHint(Floor.First, Color.Red)
+
+    assert find_redundant_hints([hint, swapped_hint]) == [hint, swapped_hint]
+    assert minimize_hints([hint, swapped_hint]) == [hint]
+
+
+@pytest.mark.parametrize("hints", TEST_HINT_SETS)
+def test_minimize_hints_keeps_the_assignments(hints: list[Hint]) -> None:
+    minimized_hints = minimize_hints(hints)
+    redundant_hints = find_redundant_hints(hints)
+
+    assert list(iter_assignments(minimized_hints, compact=True)) == list(iter_assignments(hints, compact=True))
+    assert find_redundant_hints(minimized_hints) == []
+    for hint in hints:
+        other_hints = [other_hint for other_hint in hints if other_hint is not hint]
+        assert (hint in redundant_hints) == (count_assignments(other_hints) == count_assignments(hints))
@@ -0,0 +1,45 @@
+from pathlib import Path
+from test.test_batch import TEST_HINT_SETS
+
+import pytest
+
+from picasso._count_assignments import count_assignments
+from picasso._result_store import ResultStore
+from picasso.hints import AbsoluteHint, Hint, RelativeHint
+from picasso.models import Animal, Color, Floor
+
+
+@pytest.mark.parametrize("hints", TEST_HINT_SETS)
+def test_store_counts_the_same(tmp_path: Path, hints: list[Hint]) -> None:
+    store = ResultStore(tmp_path / "results.sqlite3")
+
+    assert store.count(hints) == count_assignments(hints)
+    assert store.count(hints) == count_assignments(hints)
+    assert (store.hits, store.misses) == (1, 1)
+    store.close()
+
+
+def test_symmetric_hints_are_counted_once(tmp_path: Path) -> None:
+    hints: list[Hint] = [AbsoluteHint(Color.Red, Floor.First), RelativeHint(Color.Blue, Animal.Frog, 2)]
+    symmetric_hints: list[Hint] = [AbsoluteHint(Color.Green, Floor.Fifth), RelativeHint(Color.Red, Animal.Bird, -2)]
+    store = ResultStore(tmp_path / "results.sqlite3")
+
+    assert store.count(hints) == store.count(symmetric_hints) == count_assignments(symmetric_hints)
+    assert (store.hits, store.misses) == (1, 1)
+    store.close()
+
+    reopened_store = ResultStore(tmp_path / "results.sqlite3")
+    assert reopened_store.count(symmetric_hints) == count_assignments(hints)
+    assert reopened_store.hits == 1
+    reopened_store.close()
+
+
+def test_partial_counts_are_not_stored(tmp_path: Path) -> None:
+    hints: list[Hint] = [AbsoluteHint(Color.Red, Floor.First)]
+    store = ResultStore(tmp_path / "results.sqlite3")
+
+    assert store.count(hints, at_most=10) == 10
+    assert store.count(hints) == count_assignments(hints)
+    assert store.count(hints, at_most=10) == 10
+    assert (store.hits, store.misses) == (1, 2)
+    store.close()
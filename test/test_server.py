@@ -0,0 +1,103 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from test.test_batch import TEST_HINT_SETS
+from typing import Any
+
+import pytest
+
+from picasso._count_assignments import count_assignments, is_unique
+from picasso._serialization import hint_to_json
+from picasso.hints import AbsoluteHint, Hint
+from picasso.models import Animal, Floor
+from picasso.server import CountService, start_server
+
+
+def to_json(hints: list[Hint]) -> list[dict[str, Any]]:
+    return [hint_to_json(hint) for hint in hints]
+
+
+async def post(port: int, method: str, path: str, request: Any = None) -> tuple[int, Any]:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = json.dumps(request).encode()
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    status_line, _, response_body = response.partition(b"\r\n\r\n")
+    return int(status_line.split()[1]), json.loads(response_body)
+
+
+def test_server_endpoints() -> None:
+    async def run() -> None:
+        service = CountService(workers=2)
+        server = await start_server(service, port=0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            hints = TEST_HINT_SETS[0]
+            assert await post(port, "POST", "/count", {"hints": to_json(hints)}) == (
+                200,
+                {"count": count_assignments(hints)},
+            )
+            assert await post(port, "POST", "/is_unique", {"hints": to_json(hints)}) == (
+                200,
+                {"is_unique": is_unique(hints)},
+            )
+            status, response = await post(
+                port, "POST", "/batch", {"hint_sets": [to_json(hints) for hints in TEST_HINT_SETS] + [[{}]]}
+            )
+            assert status == 200
+            assert response["results"][:-1] == [{"count": count_assignments(hints)} for hints in TEST_HINT_SETS]
+            assert "error" in response["results"][-1]
+
+            assert (await post(port, "POST", "/count", {"hints": [{"kind": "AbsoluteHint"}]}))[0] == 400
+            assert (await post(port, "POST", "/unknown", {}))[0] == 404
+            assert (await post(port, "GET", "/count"))[0] == 405
+            status, metrics = await post(port, "GET", "/metrics")
+            assert status == 200
+            assert metrics["queue_depth"] == 0 and metrics["in_flight_requests"] == 1
+            assert set(metrics["latency_ms"]) == {"/count", "/is_unique", "/batch"}
+        service.close()
+
+    asyncio.run(run())
+
+
+def test_service_coalesces_same_hints() -> None:
+    async def run() -> None:
+        service = CountService(executor=ThreadPoolExecutor(max_workers=2))
+        hints = to_json([AbsoluteHint(Animal.Frog, Floor.Fifth)])
+        swapped_hints = to_json([AbsoluteHint(Floor.Fifth, Animal.Frog)])
+
+        counts = await asyncio.gather(service.count(hints), service.count(swapped_hints), service.count(hints, 3))
+
+        assert counts == [count_assignments([AbsoluteHint(Animal.Frog, Floor.Fifth)])] * 2 + [3]
+        assert service.get_metrics()["requests"] == 3
+        assert service.get_metrics()["coalesced_requests"] == 1
+        assert service.get_metrics()["queue_depth"] == 0
+        service.close()
+
+    asyncio.run(run())
+
+
+@pytest.mark.parametrize("hints,at_most", [("not a list", None), ([], -1), ([], True)])
+def test_service_rejects_bad_requests(hints: Any, at_most: Any) -> None:
+    service = CountService(executor=ThreadPoolExecutor(max_workers=1))
+    with pytest.raises(ValueError):
+        asyncio.run(service.count(hints, at_most))
+    service.close()
+
+
+def test_server_reports_pool_failures() -> None:
+    async def run() -> None:
+        executor = ThreadPoolExecutor(max_workers=1)
+        executor.shutdown()
+        service = CountService(executor=executor)
+        server = await start_server(service, port=0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            status, response = await post(port, "POST", "/count", {"hints": to_json(TEST_HINT_SETS[0])})
+            assert status == 500 and "error" in response
+            assert "/count" in service.get_metrics()["latency_ms"]
+        service.close()
+
+    asyncio.run(run())
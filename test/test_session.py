@@ -0,0 +1,46 @@
+from test.test_count_assignments import TEST_ALL_HINT_TYPES, TEST_ALL_NEIGHBOR_HINT_KINDS
+
+import pytest
+
+from picasso._count_assignments import count_assignments
+from picasso._session import TowerSession
+from picasso.hints import AbsoluteHint, NeighborHint
+from picasso.models import Animal, Color, Floor
+
+
+def test_session_add_counts_like_count_assignments() -> None:
+    session = TowerSession()
+    assert session.count() == 14400
+
+    for hints_amount, hint in enumerate(TEST_ALL_HINT_TYPES, start=1):
+        assert session.add(hint) == count_assignments(TEST_ALL_HINT_TYPES[:hints_amount])
+
+
+def test_session_remove() -> None:
+    session = TowerSession()
+    for hint in TEST_ALL_NEIGHBOR_HINT_KINDS:
+        session.add(hint)
+
+    assert session.remove(NeighborHint(Animal.Grasshopper, Floor.Third)) == count_assignments(
+        TEST_ALL_NEIGHBOR_HINT_KINDS[:5] + TEST_ALL_NEIGHBOR_HINT_KINDS[6:]
+    )
+    with pytest.raises(ValueError):
+        session.remove(AbsoluteHint(Color.Blue, Floor.Third))
+
+
+def test_session_push_pop() -> None:
+    session = TowerSession()
+    session.add(AbsoluteHint(Animal.Frog, Floor.Fifth))
+    session.push()
+    session.add(NeighborHint(Color.Red, Color.Green))
+    session.push()
+    session.add(AbsoluteHint(Color.Red, Floor.First))
+    session.remove(AbsoluteHint(Floor.Fifth, Animal.Frog))
+
+    assert session.count() == count_assignments(
+        [NeighborHint(Color.Red, Color.Green), AbsoluteHint(Color.Red, Floor.First)]
+    )
+    assert session.pop() == count_assignments([NeighborHint(Color.Red, Color.Green)])
+    assert session.pop() == 14400
+    with pytest.raises(IndexError):
+        session.pop()
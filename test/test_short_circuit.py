@@ -0,0 +1,87 @@
+from importlib.util import find_spec
+from test.test_count_assignments import (
+    ENGINES,
+    TEST_ALL_HINT_TYPES,
+    TEST_ALL_RELATIVE_HINT_KINDS,
+    TEST_FULL_TOWER_RESULT_IN_ONE_POSSIBLE_ASSIGNMENT,
+    TEST_OVERLAPPING_HINTS_RESULT_IN_ZERO_POSSIBLE_ASSIGNMENTS,
+    TEST_SAME_COLOR_ON_TWO_FLOORS_RESULT_IN_ZERO_POSSIBLE_ASSIGNMENTS,
+)
+from test.test_tower_sizes import TEN_FLOORS_SPEC
+
+import pytest
+
+from picasso._compile import compile_hints
+from picasso._count_assignments import count_assignments, has_solution, insert_hints, is_unique
+from picasso.hints import Hint, RelativeHint, SpecificHint
+from picasso.hints_utils import ContradictingHintsError
+from picasso.models import Animal, Color, CountingEngine
+from picasso.tower import DEFAULT_TOWER_SPEC
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize(
+    "hints, expected_has_solution, expected_is_unique",
+    [
+        ([], True, False),
+        ([RelativeHint(Animal.Frog, Animal.Frog, 0)], True, False),
+        (TEST_ALL_HINT_TYPES, True, False),
+        (TEST_FULL_TOWER_RESULT_IN_ONE_POSSIBLE_ASSIGNMENT, True, True),
+        (TEST_OVERLAPPING_HINTS_RESULT_IN_ZERO_POSSIBLE_ASSIGNMENTS, False, False),
+        (TEST_SAME_COLOR_ON_TWO_FLOORS_RESULT_IN_ZERO_POSSIBLE_ASSIGNMENTS, False, False),
+    ],
+)
+def test_has_solution_and_is_unique(
+    hints: list[Hint], expected_has_solution: bool, expected_is_unique: bool, engine: CountingEngine
+) -> None:
+    assert has_solution(hints, engine) == expected_has_solution
+    assert is_unique(hints, engine) == expected_is_unique
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize("at_most", [0, 1, 5, 12, 100])
+def test_count_assignments_at_most(at_most: int, engine: CountingEngine) -> None:
+    assert count_assignments(TEST_ALL_RELATIVE_HINT_KINDS, engine, at_most=at_most) == min(12, at_most)
+
+
+def test_count_assignments_at_most_on_huge_tower() -> None:
+    assert count_assignments([], spec=TEN_FLOORS_SPEC, at_most=3) == 3
+
+
+def test_count_assignments_negative_at_most() -> None:
+    with pytest.raises(ValueError):
+        count_assignments([], at_most=-1)
+
+
+@pytest.mark.parametrize(
+    "hints",
+    [
+        TEST_OVERLAPPING_HINTS_RESULT_IN_ZERO_POSSIBLE_ASSIGNMENTS,
+        TEST_SAME_COLOR_ON_TWO_FLOORS_RESULT_IN_ZERO_POSSIBLE_ASSIGNMENTS,
+    ],
+)
+def test_insert_hints_detects_contradiction(hints: list[Hint]) -> None:
+    with pytest.raises(ContradictingHintsError):
+        insert_hints(DEFAULT_TOWER_SPEC.new_partial_tower(), list(compile_hints(hints)))
+
+
+@pytest.mark.skipif(find_spec("numpy") is None, reason="numpy is not installed")
+def test_numpy_engine_stops_at_most(monkeypatch: pytest.MonkeyPatch) -> None:
+    from picasso import _numpy_engine
+    from picasso._numpy_engine import FloorsArray, Mask
+
+    masked_chunks: list[int] = []
+    get_mixed_mask = _numpy_engine.get_mixed_mask
+
+    def count_chunk(mixed_hints: list[SpecificHint], colors_floors: FloorsArray, animals_floors: FloorsArray) -> Mask:
+        masked_chunks.append(len(colors_floors))
+        return get_mixed_mask(mixed_hints, colors_floors, animals_floors)
+
+    monkeypatch.setattr(_numpy_engine, "get_mixed_mask", count_chunk)
+    hints: list[Hint] = [RelativeHint(Color.Red, Animal.Frog, 1)]
+
+    assert count_assignments(hints, CountingEngine.NumPy, at_most=2) == 2
+    assert masked_chunks == [_numpy_engine.COLORS_CHUNK_SIZE]
+    assert count_assignments(hints, CountingEngine.NumPy) == count_assignments(hints)
+    # Full counts mask the colors permutations at once, the domains leave out the ones with red on the top floor.
+    assert masked_chunks == [_numpy_engine.COLORS_CHUNK_SIZE, 96]
@@ -0,0 +1,40 @@
+from test.test_count_assignments import (
+    ENGINES,
+    TEST_ALL_HINT_TYPES,
+    TEST_OVERLAPPING_HINTS_RESULT_IN_ZERO_POSSIBLE_ASSIGNMENTS,
+)
+
+import pytest
+
+from picasso._count_assignments import count_assignments
+from picasso._stats import CountStats
+from picasso.models import CountingEngine
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_count_stats(engine: CountingEngine) -> None:
+    stats = CountStats()
+
+    assert count_assignments(TEST_ALL_HINT_TYPES, engine, stats=stats) == count_assignments(TEST_ALL_HINT_TYPES, engine)
+    assert stats.fixed_point_iterations >= 1
+    assert len(stats.hints_stats) == len(TEST_ALL_HINT_TYPES)
+    assert sum(hint_stats.floors_pruned for hint_stats in stats.hints_stats) > 0
+    assert set(stats.stage_times) == {
+        "get_specific_hints",
+        "compile_hints",
+        "propagate_domains",
+        "enumeration",
+    }
+    assert all(hint_stats.rejections <= hint_stats.validate_calls for hint_stats in stats.hints_stats)
+    if engine == CountingEngine.Backtracking:
+        assert stats.candidates > 0
+        assert sum(hint_stats.rejections for hint_stats in stats.hints_stats) > 0
+
+
+def test_count_stats_of_contradicting_hints() -> None:
+    stats = CountStats()
+
+    assert count_assignments(TEST_OVERLAPPING_HINTS_RESULT_IN_ZERO_POSSIBLE_ASSIGNMENTS, stats=stats) == 0
+    assert stats.candidates == 0
+    assert "enumeration" not in stats.stage_times
+    assert [hint_stats.floors_pruned for hint_stats in stats.hints_stats] == [4, 4]
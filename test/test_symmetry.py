@@ -0,0 +1,63 @@
+from time import perf_counter
+
+from picasso._generator import get_size_spec
+from picasso._symmetry import get_symmetric_canonical_key
+from picasso.hints import AbsoluteHint, Hint, NeighborHint, RelativeHint, get_specific_hints
+from picasso.models import Animal, Color, Floor
+
+
+def get_key(hints: list[Hint]) -> tuple[object, ...]:
+    return get_symmetric_canonical_key(get_specific_hints(hints), floors_amount=5)
+
+
+def test_reversed_tower_has_the_same_key() -> None:
+    hints: list[Hint] = [AbsoluteHint(Color.Red, Floor.First), RelativeHint(Color.Blue, Animal.Frog, 2)]
+    reversed_hints: list[Hint] = [AbsoluteHint(Color.Red, Floor.Fifth), RelativeHint(Color.Blue, Animal.Frog, -2)]
+
+    assert get_key(hints) == get_key(reversed_hints)
+
+
+def test_relabeled_items_have_the_same_key() -> None:
+    hints: list[Hint] = [
+        AbsoluteHint(Color.Red, Animal.Frog),
+        NeighborHint(Color.Blue, Floor.Second),
+        RelativeHint(Color.Red, Color.Blue, 1),
+    ]
+    relabeled_hints: list[Hint] = [
+        RelativeHint(Color.Green, Color.Yellow, -1),
+        NeighborHint(Floor.Second, Color.Green),
+        AbsoluteHint(Animal.Bird, Color.Yellow),
+    ]
+
+    assert get_key(hints) == get_key(relabeled_hints)
+
+
+def test_symmetric_items_have_the_same_key() -> None:
+    pairs = list(zip(Color, Animal))
+    hints: list[Hint] = [AbsoluteHint(color, animal) for color, animal in pairs]
+    shuffled_hints: list[Hint] = [
+        AbsoluteHint(color, animal) for (color, _), (_, animal) in zip(pairs, pairs[1:] + pairs[:1])
+    ]
+
+    assert get_key(hints) == get_key(shuffled_hints)
+
+
+def test_many_symmetric_items_are_keyed_fast() -> None:
+    spec = get_size_spec(9)
+    pairs = list(zip(spec.colors, spec.animals))
+    hints = get_specific_hints([NeighborHint(color, animal) for color, animal in pairs], spec)
+    shuffled_pairs = zip(pairs, pairs[1:] + pairs[:1])
+    shuffled_hints = get_specific_hints(
+        [NeighborHint(color, animal) for (color, _), (_, animal) in shuffled_pairs], spec
+    )
+
+    start_time = perf_counter()
+    key = get_symmetric_canonical_key(hints, spec.floors_amount)
+    assert perf_counter() - start_time < 2
+    assert key == get_symmetric_canonical_key(shuffled_hints, spec.floors_amount)
+
+
+def test_not_symmetric_hints_have_other_keys() -> None:
+    assert get_key([AbsoluteHint(Color.Red, Floor.First)]) != get_key([AbsoluteHint(Color.Red, Floor.Second)])
+    assert get_key([RelativeHint(Color.Red, Color.Blue, 1)]) != get_key([NeighborHint(Color.Red, Color.Blue)])
+    assert get_key([AbsoluteHint(Color.Red, Animal.Frog)]) != get_key([NeighborHint(Color.Red, Animal.Frog)])
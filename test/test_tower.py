@@ -0,0 +1,40 @@
+import subprocess
+import sys
+from importlib.util import find_spec
+
+import pytest
+
+from picasso.models import Animal, Color, Floor, PicassoTowerFloor
+from picasso.tower import EMPTY, decode_tower, encode_tower
+
+
+def test_encode_decode_tower() -> None:
+    tower: dict[int, PicassoTowerFloor] = {floor: PicassoTowerFloor(animal=None, color=None) for floor in Floor}
+    tower[Floor.First].color = Color.Blue
+    tower[Floor.Third].animal = Animal.Frog
+    tower[Floor.Fifth] = PicassoTowerFloor(animal=Animal.Bird, color=Color.Red)
+
+    compact_tower = encode_tower(tower)
+
+    assert compact_tower == ([2, EMPTY, EMPTY, EMPTY, 0], [EMPTY, EMPTY, 0, EMPTY, 3])
+    assert decode_tower(compact_tower) == tower
+
+
+def test_core_does_not_import_pydantic() -> None:
+    code = "import sys, picasso._count_assignments; assert 'pydantic' not in sys.modules"
+
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+@pytest.mark.skipif(find_spec("pydantic") is None, reason="pydantic is not installed")
+def test_pydantic_floor_model() -> None:
+    from pydantic import ValidationError
+
+    from picasso.pydantic_models import PicassoTowerFloorModel
+
+    tower_floor = PicassoTowerFloorModel.parse_obj({"animal": "Bird", "color": None}).to_floor()
+
+    assert tower_floor == PicassoTowerFloor(animal=Animal.Bird)
+    assert PicassoTowerFloorModel.from_floor(tower_floor).to_floor() == tower_floor
+    with pytest.raises(ValidationError):
+        PicassoTowerFloorModel.parse_obj({"animal": "Cow", "color": None})
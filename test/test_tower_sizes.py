@@ -0,0 +1,69 @@
+from enum import Enum
+from math import factorial
+
+import pytest
+
+from picasso._count_assignments import count_assignments, generate_all_floor_combinations
+from picasso.hints import AbsoluteHint, Hint, NeighborHint, RelativeHint, get_specific_hints
+from picasso.tower import TowerSpec
+
+
+class SixColors(Enum):
+    Red = "Red"
+    Green = "Green"
+    Blue = "Blue"
+    Yellow = "Yellow"
+    Orange = "Orange"
+    Purple = "Purple"
+
+
+class SixAnimals(Enum):
+    Frog = "Frog"
+    Rabbit = "Rabbit"
+    Grasshopper = "Grasshopper"
+    Bird = "Bird"
+    Chicken = "Chicken"
+    Cat = "Cat"
+
+
+TenColors = Enum("TenColors", [f"Color{number}" for number in range(10)])  # type: ignore[misc]
+TenAnimals = Enum("TenAnimals", [f"Animal{number}" for number in range(10)])  # type: ignore[misc]
+
+SIX_FLOORS_SPEC = TowerSpec(SixColors, SixAnimals)
+TEN_FLOORS_SPEC = TowerSpec(TenColors, TenAnimals)
+
+TEST_SIX_FLOORS_HINTS: list[Hint] = [
+    AbsoluteHint(SixAnimals.Cat, 6),
+    AbsoluteHint(SixColors.Purple, SixAnimals.Frog),
+    RelativeHint(SixColors.Red, SixAnimals.Cat, -3),
+    NeighborHint(SixColors.Purple, SixColors.Red),
+    NeighborHint(SixAnimals.Bird, 1),
+]
+
+
+def test_count_six_floors_same_as_enumeration() -> None:
+    specific_hints = get_specific_hints(TEST_SIX_FLOORS_HINTS, SIX_FLOORS_SPEC)
+    expected_count = sum(
+        all(specific_hint.validate(floors_combination) for specific_hint in specific_hints)
+        for floors_combination in generate_all_floor_combinations(SIX_FLOORS_SPEC.new_partial_tower())
+    )
+
+    assert count_assignments(TEST_SIX_FLOORS_HINTS, spec=SIX_FLOORS_SPEC) == expected_count
+
+
+@pytest.mark.parametrize(
+    "hints,expected_count",
+    [
+        ([], factorial(10) ** 2),
+        ([AbsoluteHint(TEN_FLOORS_SPEC.colors[3], 10)], factorial(9) * factorial(10)),
+        ([RelativeHint(TEN_FLOORS_SPEC.colors[1], TEN_FLOORS_SPEC.animals[1], 9)], factorial(9) ** 2),
+        ([NeighborHint(1, TEN_FLOORS_SPEC.animals[0]), AbsoluteHint(TEN_FLOORS_SPEC.animals[0], 3)], 0),
+    ],
+)
+def test_count_ten_floors(hints: list[Hint], expected_count: int) -> None:
+    assert count_assignments(hints, spec=TEN_FLOORS_SPEC) == expected_count
+
+
+def test_floor_above_the_tower() -> None:
+    with pytest.raises(ValueError):
+        count_assignments([AbsoluteHint(TEN_FLOORS_SPEC.colors[3], 11)], spec=TEN_FLOORS_SPEC)